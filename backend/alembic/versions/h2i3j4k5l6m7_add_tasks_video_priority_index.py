@@ -0,0 +1,41 @@
+"""add_tasks_video_priority_index
+
+Revision ID: h2i3j4k5l6m7
+Revises: g1h2i3j4k5l6
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "h2i3j4k5l6m7"
+down_revision: str | Sequence[str] | None = "g1h2i3j4k5l6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Add a composite index matching the per-video task listing order so the
+    query is answered from the index without a separate sort step.
+    """
+    # Optimizes: SELECT ... FROM tasks WHERE video_id = ?
+    # ORDER BY priority DESC, created_at ASC
+    op.create_index(
+        "ix_tasks_video_priority_created",
+        "tasks",
+        ["video_id", sa.text("priority DESC"), "created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Remove the per-video task listing index.
+    """
+    op.drop_index("ix_tasks_video_priority_created", "tasks")
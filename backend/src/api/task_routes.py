@@ -106,6 +106,18 @@ class RetryTaskResponse(BaseModel):
         }
 
 
+class RetryFailedTasksResponse(BaseModel):
+    """Response model for bulk failed-task retry endpoint."""
+
+    reset: int = Field(..., description="Number of failed tasks reset to PENDING")
+    enqueued: int = Field(..., description="Number of reset tasks re-enqueued")
+
+    class Config:
+        """Pydantic config."""
+
+        json_schema_extra = {"example": {"reset": 12, "enqueued": 12}}
+
+
 class TaskListResponse(BaseModel):
     """Response model for task list endpoint."""
 
@@ -361,6 +373,85 @@ async def retry_task(
         raise HTTPException(status_code=500, detail=f"Failed to retry task: {str(e)}")
 
 
+@router.post(
+    "/retry-failed",
+    response_model=RetryFailedTasksResponse,
+    responses={
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+    summary="Retry all failed tasks",
+    description="Reset every FAILED task to PENDING and re-enqueue it for processing.",
+)
+async def retry_failed_tasks(
+    db: Session = Depends(get_db),
+) -> RetryFailedTasksResponse:
+    """Retry all failed tasks."""
+    try:
+        task_repo = SQLAlchemyTaskRepository(db)
+        tasks = task_repo.reset_failed_tasks()
+
+        logger.info(f"Reset {len(tasks)} failed tasks to PENDING")
+
+        if not tasks:
+            return RetryFailedTasksResponse(reset=0, enqueued=0)
+
+        from ..services.video_discovery_service import VideoDiscoveryService
+
+        video_repo = SqlVideoRepository(db)
+        discovery_service = VideoDiscoveryService(None, video_repo)
+        videos = {}
+        configs = {}
+        enqueued = 0
+
+        job_producer = JobProducer()
+        await job_producer.initialize()
+
+        try:
+            for task in tasks:
+                if task.video_id not in videos:
+                    videos[task.video_id] = video_repo.find_by_id(task.video_id)
+                video = videos[task.video_id]
+                if not video:
+                    # Left PENDING; reconciliation reports the missing video
+                    logger.error(
+                        f"Video {task.video_id} not found for task {task.task_id}"
+                    )
+                    continue
+
+                if task.task_type not in configs:
+                    configs[task.task_type] = discovery_service._get_default_config(
+                        task.task_type
+                    )
+
+                try:
+                    await job_producer.enqueue_task(
+                        task_id=task.task_id,
+                        task_type=task.task_type,
+                        video_id=str(task.video_id),
+                        video_path=video.file_path,
+                        config=configs[task.task_type],
+                    )
+                    enqueued += 1
+                except Exception as e:
+                    # Left PENDING; reconciliation re-enqueues it later
+                    logger.error(
+                        f"Failed to enqueue retried task {task.task_id}: {e}",
+                        exc_info=True,
+                    )
+        finally:
+            await job_producer.close()
+
+        logger.info(f"Re-enqueued {enqueued} of {len(tasks)} retried tasks")
+
+        return RetryFailedTasksResponse(reset=len(tasks), enqueued=enqueued)
+
+    except Exception as e:
+        logger.error(f"Failed to retry failed tasks: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"Failed to retry failed tasks: {str(e)}"
+        )
+
+
 @router.post(
     "/reconcile",
     summary="Manually trigger reconciliation",
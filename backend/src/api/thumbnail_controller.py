@@ -1,42 +1,178 @@
 """API controller for serving thumbnail images."""
 
+import os
+import time
+from collections import OrderedDict
+from datetime import timezone
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISREG
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi import Path as PathParam
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 
 router = APIRouter(prefix="/thumbnails", tags=["thumbnails"])
 
 THUMBNAIL_DIR = Path("/thumbnails")
+# Video IDs are UUIDs; anything outside this alphabet (such as "..") is
+# rejected before it can reach the filesystem
+VIDEO_ID_PATTERN = r"^[A-Za-z0-9_-]{1,64}$"
 CACHE_MAX_AGE = 604800  # 1 week in seconds
+CDN_CACHE_MAX_AGE = 2592000  # 30 days in seconds
+# Thumbnails are never rewritten for a given (video_id, timestamp_ms), so
+# browsers and shared caches can keep them without revalidating
+CACHE_CONTROL = (
+    f"public, max-age={CACHE_MAX_AGE}, s-maxage={CDN_CACHE_MAX_AGE}, immutable"
+)
+THUMBNAIL_CACHE_SIZE = 512  # Entries; thumbnails are ~10-20KB each
+VIDEO_DIR_CACHE_SIZE = 1024  # Entries; one per recently viewed video
+MISSING_CACHE_SIZE = 4096  # Entries
+MISSING_CACHE_TTL = 60  # Seconds a missing thumbnail is answered from memory
+
+# Thumbnail path -> monotonic time it was found missing, oldest first
+_missing_thumbnails: OrderedDict[str, float] = OrderedDict()
+
+
+@lru_cache(maxsize=VIDEO_DIR_CACHE_SIZE)
+def _video_dir(thumbnail_dir: Path, video_id: str) -> str:
+    """Join a video's thumbnail directory path, cached per video.
+
+    A scrubbing client requests many timestamps of the same video, so the
+    prefix is built once and only the file name is appended per request.
+    """
+    return os.path.join(thumbnail_dir, video_id)
+
+
+@lru_cache(maxsize=THUMBNAIL_CACHE_SIZE)
+def _load_thumbnail(path: str, mtime_ns: int) -> bytes:
+    """Read a thumbnail's bytes, cached by path and modification time.
+
+    The mtime is part of the key, so a regenerated thumbnail is read again.
+    """
+    return Path(path).read_bytes()
+
+
+def _is_known_missing(path: str) -> bool:
+    """Check whether a thumbnail was recently found missing.
+
+    Expired entries are dropped on lookup.
+    """
+    missing_since = _missing_thumbnails.get(path)
+    if missing_since is None:
+        return False
+    if time.monotonic() - missing_since >= MISSING_CACHE_TTL:
+        del _missing_thumbnails[path]
+        return False
+    return True
+
+
+def _remember_missing(path: str) -> None:
+    """Record a missing thumbnail, evicting the oldest entry when full."""
+    _missing_thumbnails[path] = time.monotonic()
+    _missing_thumbnails.move_to_end(path)
+    if len(_missing_thumbnails) > MISSING_CACHE_SIZE:
+        _missing_thumbnails.popitem(last=False)
+
+
+def _thumbnail_etag(stat_result: os.stat_result) -> str:
+    """Build a strong ETag from a thumbnail file's mtime and size."""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _is_not_modified(request: Request, etag: str, stat_result: os.stat_result) -> bool:
+    """Check the request's conditional headers against the current thumbnail.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    the client sent no ETag.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # GET uses weak comparison, so W/ prefixes are ignored
+        candidates = {
+            candidate.strip().removeprefix("W/")
+            for candidate in if_none_match.split(",")
+        }
+        return etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            # HTTP dates are always GMT
+            since = since.replace(tzinfo=timezone.utc)
+        return int(stat_result.st_mtime) <= since.timestamp()
+
+    return False
 
 
 @router.get("/{video_id}/{timestamp_ms}")
-async def get_thumbnail(video_id: str, timestamp_ms: int) -> FileResponse:
+async def get_thumbnail(
+    request: Request,
+    video_id: str = PathParam(..., pattern=VIDEO_ID_PATTERN),
+    timestamp_ms: int = PathParam(..., ge=0),
+) -> Response:
     """
     Serve a thumbnail image for a specific video timestamp.
 
-    Returns JPEG image with cache headers for browser caching.
+    Returns JPEG image with cache headers for browser caching. Recently served
+    thumbnails are answered from memory, and revalidation requests whose
+    ETag or date still matches get an empty 304.
 
     Args:
         video_id: The unique identifier of the video
         timestamp_ms: The timestamp in milliseconds
+        request: Incoming request, for its conditional headers
 
     Returns:
-        FileResponse with the JPEG thumbnail image
+        Response with the JPEG thumbnail image, or 304 Not Modified
 
     Raises:
-        HTTPException: 404 if thumbnail not found
+        HTTPException: 404 if thumbnail not found; malformed path parameters
+            are rejected with 422 before any filesystem access
     """
-    thumbnail_path = THUMBNAIL_DIR / video_id / f"{timestamp_ms}.jpg"
+    # Plain string join: the hot serve path has no use for a Path object
+    thumbnail_path = f"{_video_dir(THUMBNAIL_DIR, video_id)}/{timestamp_ms}.jpg"
+
+    # Bursts of requests for a missing thumbnail skip the stat; only misses
+    # are cached, so a newly generated thumbnail is served at most
+    # MISSING_CACHE_TTL seconds late
+    if _is_known_missing(thumbnail_path):
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
 
-    if not thumbnail_path.exists():
+    # Filesystem calls run in the threadpool so a slow disk does not stall
+    # the event loop
+    try:
+        stat_result = await run_in_threadpool(os.stat, thumbnail_path)
+    except (FileNotFoundError, NotADirectoryError):
+        _remember_missing(thumbnail_path)
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
+    if not S_ISREG(stat_result.st_mode):
         raise HTTPException(status_code=404, detail="Thumbnail not found")
 
-    return FileResponse(
-        thumbnail_path,
+    etag = _thumbnail_etag(stat_result)
+    headers = {
+        "Cache-Control": CACHE_CONTROL,
+        "CDN-Cache-Control": f"max-age={CDN_CACHE_MAX_AGE}",
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+    }
+
+    if _is_not_modified(request, etag, stat_result):
+        return Response(status_code=304, headers=headers)
+
+    content = await run_in_threadpool(
+        _load_thumbnail, thumbnail_path, stat_result.st_mtime_ns
+    )
+    return Response(
+        content=content,
         media_type="image/jpeg",
-        headers={
-            "Cache-Control": f"public, max-age={CACHE_MAX_AGE}",
-        },
+        headers=headers,
     )
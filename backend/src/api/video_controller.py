@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 from ..api.schemas import VideoCreateSchema, VideoResponseSchema, VideoUpdateSchema
 from ..database.connection import get_db
 from ..domain.models import Task, Video
+from ..domain.task_registry import get_bottom_level
 from ..repositories.task_repository import SQLAlchemyTaskRepository
 from ..repositories.video_repository import SqlVideoRepository
 from ..services.job_producer import JobProducer
@@ -47,7 +48,7 @@ async def create_video(
         )
 
         created_video = service.create_video(domain_video)
-        return VideoResponseSchema.model_validate(created_video.__dict__)
+        return VideoResponseSchema.model_validate(created_video)
 
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
@@ -64,7 +65,7 @@ async def get_video(
             status_code=status.HTTP_404_NOT_FOUND, detail="Video not found"
         )
 
-    return VideoResponseSchema.model_validate(video.__dict__)
+    return VideoResponseSchema.model_validate(video)
 
 
 @router.get("/", response_model=list[VideoResponseSchema])
@@ -78,7 +79,7 @@ async def list_videos(
         # Return all videos
         videos = service.get_all_videos()
 
-    return [VideoResponseSchema.model_validate(video.__dict__) for video in videos]
+    return [VideoResponseSchema.model_validate(video) for video in videos]
 
 
 @router.patch("/{video_id}", response_model=VideoResponseSchema)
@@ -98,7 +99,7 @@ async def update_video(
             status_code=status.HTTP_404_NOT_FOUND, detail="Video not found"
         )
 
-    return VideoResponseSchema.model_validate(video.__dict__)
+    return VideoResponseSchema.model_validate(video)
 
 
 @router.delete("/{video_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -371,7 +372,7 @@ async def create_video_task(
             video_id=video_id,
             task_type=request.task_type,
             status="pending",
-            priority=1,
+            priority=get_bottom_level(request.task_type),
         )
         task_repo.save(task)
 
@@ -18,7 +18,7 @@ class VideoDAO:
 
     def get_by_id(self, video_id: str) -> Video | None:
         """Get video by ID."""
-        return self.session.query(Video).filter(Video.video_id == video_id).first()
+        return self.session.get(Video, video_id)
 
     def get_by_path(self, file_path: str) -> Video | None:
         """Get video by file path."""
@@ -1,5 +1,15 @@
-from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String, Text
-from sqlalchemy.sql import func
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.sql import func, text
 
 from .connection import Base
 
@@ -34,12 +44,22 @@ class PathConfig(Base):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serves find_by_video_id's ORDER BY priority DESC, created_at ASC
+        Index(
+            "ix_tasks_video_priority_created",
+            "video_id",
+            text("priority DESC"),
+            "created_at",
+        ),
+    )
 
     task_id = Column(String, primary_key=True)
     video_id = Column(String, ForeignKey("videos.video_id"), nullable=False, index=True)
     task_type = Column(String, nullable=False, index=True)  # transcription, scene, etc
     status = Column(String, nullable=False, default="pending", index=True)  # Status
-    priority = Column(Integer, nullable=False, default=5)  # 1=highest, 10=lowest
+    # Critical-path bottom level of the task type; higher runs first, 0 = leaf
+    priority = Column(Integer, nullable=False, default=1)
     dependencies = Column(JSON)  # List of task_ids that must complete first
     language = Column(String, nullable=True, index=True)  # ISO 639-1 language code
     created_at = Column(DateTime, server_default=func.now())
@@ -52,6 +72,22 @@ class Artifact(Base):
     """SQLAlchemy entity for artifact envelope storage."""
 
     __tablename__ = "artifacts"
+    # Composite indexes mirror the 6d521ce5b616 migration
+    __table_args__ = (
+        Index(
+            "idx_artifacts_asset_type_start",
+            "asset_id",
+            "artifact_type",
+            "span_start_ms",
+        ),
+        Index(
+            "idx_artifacts_asset_type_profile_start",
+            "asset_id",
+            "artifact_type",
+            "model_profile",
+            "span_start_ms",
+        ),
+    )
 
     artifact_id = Column(String, primary_key=True)
     asset_id = Column(String, ForeignKey("videos.video_id"), nullable=False, index=True)
@@ -105,6 +141,11 @@ class SceneRange(Base):
     """SQLAlchemy entity for scene_ranges projection table."""
 
     __tablename__ = "scene_ranges"
+    # Composite indexes mirror the c6f63e560f88 migration
+    __table_args__ = (
+        Index("idx_scene_ranges_asset_index", "asset_id", "scene_index"),
+        Index("idx_scene_ranges_asset_start", "asset_id", "start_ms"),
+    )
 
     artifact_id = Column(
         String, ForeignKey("artifacts.artifact_id"), nullable=False, primary_key=True
@@ -5,6 +5,21 @@ from datetime import datetime
 class Video:
     """Domain model for Video - pure business object."""
 
+    __slots__ = (
+        "video_id",
+        "file_path",
+        "filename",
+        "last_modified",
+        "status",
+        "file_hash",
+        "duration",
+        "file_size",
+        "file_created_at",
+        "processed_at",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
         self,
         video_id: str,
@@ -74,6 +89,20 @@ class PathConfig:
 class Task:
     """Domain model for Task - pure business object."""
 
+    __slots__ = (
+        "task_id",
+        "video_id",
+        "task_type",
+        "status",
+        "priority",
+        "dependencies",
+        "language",
+        "created_at",
+        "started_at",
+        "completed_at",
+        "error",
+    )
+
     def __init__(
         self,
         task_id: str,
@@ -1,5 +1,7 @@
 """Initialize and register all artifact schemas at application startup."""
 
+from pydantic import BaseModel
+
 from src.domain.schema_registry import SchemaRegistry
 from src.domain.schemas import (
     FaceDetectionV1,
@@ -12,6 +14,18 @@ from src.domain.schemas import (
     TranscriptSegmentV1,
 )
 
+# All artifact schemas known to the application
+ALL_SCHEMAS: tuple[tuple[str, int, type[BaseModel]], ...] = (
+    ("transcript.segment", 1, TranscriptSegmentV1),
+    ("scene", 1, SceneV1),
+    ("object.detection", 1, ObjectDetectionV1),
+    ("face.detection", 1, FaceDetectionV1),
+    ("place.classification", 1, PlaceClassificationV1),
+    ("ocr.detection", 1, OCRDetectionV1),
+    ("ocr.text", 1, OcrTextV1),
+    ("video.metadata", 1, MetadataV1),
+)
+
 
 def register_all_schemas() -> None:
     """
@@ -23,34 +37,10 @@ def register_all_schemas() -> None:
     This function is idempotent - it will only register schemas that are
     not already registered, making it safe to call multiple times.
     """
-    # Register transcript.segment schemas
-    if not SchemaRegistry.is_registered("transcript.segment", 1):
-        SchemaRegistry.register("transcript.segment", 1, TranscriptSegmentV1)
-
-    # Register scene schemas
-    if not SchemaRegistry.is_registered("scene", 1):
-        SchemaRegistry.register("scene", 1, SceneV1)
-
-    # Register object.detection schemas
-    if not SchemaRegistry.is_registered("object.detection", 1):
-        SchemaRegistry.register("object.detection", 1, ObjectDetectionV1)
-
-    # Register face.detection schemas
-    if not SchemaRegistry.is_registered("face.detection", 1):
-        SchemaRegistry.register("face.detection", 1, FaceDetectionV1)
-
-    # Register place.classification schemas
-    if not SchemaRegistry.is_registered("place.classification", 1):
-        SchemaRegistry.register("place.classification", 1, PlaceClassificationV1)
-
-    # Register ocr.detection schemas
-    if not SchemaRegistry.is_registered("ocr.detection", 1):
-        SchemaRegistry.register("ocr.detection", 1, OCRDetectionV1)
-
-    # Register ocr.text schemas
-    if not SchemaRegistry.is_registered("ocr.text", 1):
-        SchemaRegistry.register("ocr.text", 1, OcrTextV1)
-
-    # Register video.metadata schemas
-    if not SchemaRegistry.is_registered("video.metadata", 1):
-        SchemaRegistry.register("video.metadata", 1, MetadataV1)
+    SchemaRegistry.bulk_register(
+        [
+            (artifact_type, schema_version, schema)
+            for artifact_type, schema_version, schema in ALL_SCHEMAS
+            if not SchemaRegistry.is_registered(artifact_type, schema_version)
+        ]
+    )
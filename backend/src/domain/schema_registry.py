@@ -1,5 +1,6 @@
 """Schema registry for artifact payload validation."""
 
+from collections.abc import Iterable
 
 from pydantic import BaseModel
 
@@ -35,21 +36,51 @@ class SchemaRegistry:
         Raises:
             ValueError: If schema is already registered or invalid parameters
         """
+        cls._check_registration(artifact_type, schema_version, schema)
+        cls._schemas[(artifact_type, schema_version)] = schema
+
+    @classmethod
+    def bulk_register(cls, schemas: Iterable[tuple[str, int, type[BaseModel]]]) -> None:
+        """
+        Register several schemas in a single pass.
+
+        Every entry is validated before any is added, so an invalid entry
+        leaves the registry unchanged.
+
+        Args:
+            schemas: Iterable of (artifact_type, schema_version, schema) tuples
+
+        Raises:
+            ValueError: If any schema is already registered or invalid parameters
+        """
+        pending: dict[tuple[str, int], type[BaseModel]] = {}
+        for artifact_type, schema_version, schema in schemas:
+            cls._check_registration(artifact_type, schema_version, schema)
+            key = (artifact_type, schema_version)
+            if key in pending:
+                raise ValueError(
+                    f"Schema already registered for {artifact_type} v{schema_version}"
+                )
+            pending[key] = schema
+
+        cls._schemas.update(pending)
+
+    @classmethod
+    def _check_registration(
+        cls, artifact_type: str, schema_version: int, schema: type[BaseModel]
+    ) -> None:
+        """Validate a registration, raising ValueError if it is not allowed."""
         if not artifact_type:
             raise ValueError("artifact_type cannot be empty")
         if schema_version < 1:
             raise ValueError("schema_version must be >= 1")
         if not issubclass(schema, BaseModel):
             raise ValueError("schema must be a Pydantic BaseModel subclass")
-
-        key = (artifact_type, schema_version)
-        if key in cls._schemas:
+        if (artifact_type, schema_version) in cls._schemas:
             raise ValueError(
                 f"Schema already registered for {artifact_type} v{schema_version}"
             )
 
-        cls._schemas[key] = schema
-
     @classmethod
     def get_schema(cls, artifact_type: str, schema_version: int) -> type[BaseModel]:
         """
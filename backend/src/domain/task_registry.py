@@ -1,6 +1,7 @@
 """Task registry defining language behavior for each task type."""
 
 from enum import Enum
+from functools import cache
 
 
 class LanguageMode(Enum):
@@ -25,6 +26,23 @@ TASK_REGISTRY: dict[str, LanguageMode] = {
     "thumbnail_extraction": LanguageMode.NONE,  # Low priority, runs after ML tasks
 }
 
+# Static task DAG: task type -> task types that consume its output. Thumbnail
+# extraction reads the artifacts every ML task produces, so it runs after them.
+THUMBNAIL_TASK_TYPES = ("thumbnail.extraction", "thumbnail_extraction")
+ML_TASK_TYPES = (
+    "object_detection",
+    "face_detection",
+    "transcription",
+    "ocr",
+    "place_detection",
+    "scene_detection",
+    "metadata_extraction",
+)
+TASK_DEPENDENTS: dict[str, tuple[str, ...]] = {
+    **{task_type: THUMBNAIL_TASK_TYPES for task_type in ML_TASK_TYPES},
+    **{task_type: () for task_type in THUMBNAIL_TASK_TYPES},
+}
+
 
 def is_language_required(task_type: str) -> bool:
     """Check if a task type requires a language to be specified."""
@@ -44,3 +62,18 @@ def is_language_agnostic(task_type: str) -> bool:
 def get_task_types() -> list[str]:
     """Get all registered task types."""
     return list(TASK_REGISTRY.keys())
+
+
+@cache
+def get_bottom_level(task_type: str) -> int:
+    """Get the length of the longest dependent chain below a task type.
+
+    Stored as the task priority (higher runs first) and used to order
+    enqueues, so work that blocks other tasks (the critical path) reaches the
+    job queue ahead of its dependents. Leaf tasks and unknown task types
+    score 0.
+    """
+    return max(
+        (1 + get_bottom_level(child) for child in TASK_DEPENDENTS.get(task_type, ())),
+        default=0,
+    )
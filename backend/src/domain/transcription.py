@@ -4,6 +4,17 @@ from datetime import datetime
 class Transcription:
     """Domain model for Transcription - pure business object."""
 
+    __slots__ = (
+        "segment_id",
+        "video_id",
+        "text",
+        "start",
+        "end",
+        "confidence",
+        "speaker",
+        "created_at",
+    )
+
     def __init__(
         self,
         segment_id: str,
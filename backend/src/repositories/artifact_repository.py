@@ -138,11 +138,7 @@ class SqlArtifactRepository(ArtifactRepository):
 
     def get_by_id(self, artifact_id: str) -> ArtifactEnvelope | None:
         """Get artifact by ID."""
-        entity = (
-            self.session.query(ArtifactEntity)
-            .filter(ArtifactEntity.artifact_id == artifact_id)
-            .first()
-        )
+        entity = self.session.get(ArtifactEntity, artifact_id)
         return self._to_domain(entity) if entity else None
 
     def get_by_asset(
@@ -12,6 +12,11 @@ class VideoRepository(ABC):
         """Save video to persistence layer."""
         pass
 
+    @abstractmethod
+    def save_many(self, videos: list[Video]) -> list[Video]:
+        """Save multiple new videos in a single transaction."""
+        pass
+
     @abstractmethod
     def find_by_id(self, video_id: str) -> Video | None:
         """Find video by ID."""
@@ -22,6 +27,11 @@ class VideoRepository(ABC):
         """Find video by file path."""
         pass
 
+    @abstractmethod
+    def find_by_paths(self, file_paths: list[str]) -> dict[str, Video]:
+        """Find videos by file path, keyed by path; unknown paths are omitted."""
+        pass
+
     @abstractmethod
     def find_by_status(self, status: str) -> list[Video]:
         """Find videos by status."""
@@ -75,6 +85,11 @@ class TaskRepository(ABC):
         """Save task to persistence layer."""
         pass
 
+    @abstractmethod
+    def save_many(self, tasks: list[Task]) -> list[Task]:
+        """Save multiple tasks in a single transaction."""
+        pass
+
     @abstractmethod
     def find_by_video_id(self, video_id: str) -> list[Task]:
         """Find all tasks for a video."""
@@ -116,6 +131,31 @@ class TaskRepository(ABC):
         """Find tasks by video ID and status."""
         pass
 
+    @abstractmethod
+    def find_existing_task_keys(
+        self, video_ids: list[str], task_types: list[str]
+    ) -> dict[str, set[tuple[str, str | None]]]:
+        """Find the (task_type, language) pairs that already have tasks.
+
+        Args:
+            video_ids: Video IDs to look up
+            task_types: Task types to consider
+
+        Returns:
+            Mapping of every requested video ID to its existing
+            (task_type, language) pairs
+        """
+        pass
+
+    @abstractmethod
+    def reset_failed_tasks(self) -> list[Task]:
+        """Reset every failed task to pending.
+
+        Returns:
+            The reset tasks
+        """
+        pass
+
     @abstractmethod
     def delete_by_video_id(self, video_id: str) -> bool:
         """Delete all tasks for a video."""
@@ -193,6 +233,18 @@ class RunRepository(ABC):
         """Create a new run record."""
         pass
 
+    @abstractmethod
+    def batch_create(self, runs: list[Run]) -> list[Run]:
+        """Create multiple run records in a single transaction.
+
+        Args:
+            runs: List of runs to create
+
+        Returns:
+            List of created runs
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, run_id: str) -> Run | None:
         """Get run by ID."""
@@ -18,11 +18,7 @@ class SQLAlchemyPathConfigRepository(PathConfigRepository):
     def save(self, path_config: PathConfig) -> PathConfig:
         """Save path config to database."""
         # Check if entity already exists
-        existing_entity = (
-            self.session.query(PathConfigEntity)
-            .filter(PathConfigEntity.path_id == path_config.path_id)
-            .first()
-        )
+        existing_entity = self.session.get(PathConfigEntity, path_config.path_id)
 
         if existing_entity:
             # Update existing entity
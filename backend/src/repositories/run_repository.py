@@ -37,11 +37,34 @@ class SqlRunRepository(RunRepository):
 
         return self._to_domain(entity)
 
+    def batch_create(self, runs: list[Run]) -> list[Run]:
+        """Create multiple run records in a single transaction.
+
+        Adds all entities and commits once, so the batch costs one flush
+        instead of one per run.
+
+        Args:
+            runs: List of runs to create
+
+        Returns:
+            List of created runs
+        """
+        if not runs:
+            return []
+
+        logger.debug(f"RunRepository.batch_create() called for {len(runs)} runs")
+
+        entities = [self._to_entity(run) for run in runs]
+        self.session.add_all(entities)
+        self.session.commit()
+
+        logger.info(f"Created {len(runs)} runs in batch")
+
+        return [self._to_domain(entity) for entity in entities]
+
     def get_by_id(self, run_id: str) -> Run | None:
         """Get run by ID."""
-        entity = (
-            self.session.query(RunEntity).filter(RunEntity.run_id == run_id).first()
-        )
+        entity = self.session.get(RunEntity, run_id)
         return self._to_domain(entity) if entity else None
 
     def get_by_asset(self, asset_id: str) -> list[Run]:
@@ -68,9 +91,7 @@ class SqlRunRepository(RunRepository):
         """Update an existing run record."""
         logger.debug(f"RunRepository.update() called for run: {run.run_id}")
 
-        entity = (
-            self.session.query(RunEntity).filter(RunEntity.run_id == run.run_id).first()
-        )
+        entity = self.session.get(RunEntity, run.run_id)
 
         if not entity:
             raise ValueError(f"Run not found: {run.run_id}")
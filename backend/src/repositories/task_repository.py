@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from ..database.models import Task as TaskEntity
@@ -17,19 +18,7 @@ class SQLAlchemyTaskRepository(TaskRepository):
 
     def save(self, task: Task) -> Task:
         """Save task to database."""
-        entity = TaskEntity(
-            task_id=task.task_id,
-            video_id=task.video_id,
-            task_type=task.task_type,
-            status=task.status,
-            priority=task.priority,
-            dependencies=task.dependencies,
-            language=task.language,
-            created_at=task.created_at or datetime.utcnow(),
-            started_at=task.started_at,
-            completed_at=task.completed_at,
-            error=task.error,
-        )
+        entity = self._domain_to_entity(task)
 
         self.session.add(entity)
         self.session.commit()
@@ -37,6 +26,21 @@ class SQLAlchemyTaskRepository(TaskRepository):
 
         return self._entity_to_domain(entity)
 
+    def save_many(self, tasks: list[Task]) -> list[Task]:
+        """Save multiple tasks to database.
+
+        Uses a single Core INSERT executed with every row, bypassing the ORM
+        unit of work and identity map, and commits once for the batch.
+        """
+        if not tasks:
+            return []
+
+        rows = [self._domain_to_row(task) for task in tasks]
+        self.session.execute(insert(TaskEntity), rows)
+        self.session.commit()
+
+        return [self._row_to_domain(row) for row in rows]
+
     def find_by_video_id(self, video_id: str) -> list[Task]:
         """Find all tasks for a video."""
         entities = (
@@ -59,9 +63,7 @@ class SQLAlchemyTaskRepository(TaskRepository):
 
     def find_by_id(self, task_id: str) -> Task | None:
         """Find task by ID."""
-        entity = (
-            self.session.query(TaskEntity).filter(TaskEntity.task_id == task_id).first()
-        )
+        entity = self.session.get(TaskEntity, task_id)
         return self._entity_to_domain(entity) if entity else None
 
     def find_all(self) -> list[Task]:
@@ -93,6 +95,30 @@ class SQLAlchemyTaskRepository(TaskRepository):
         self.session.commit()
         return deleted_count > 0
 
+    def _domain_to_row(self, task: Task) -> dict:
+        """Convert domain model to a column-value mapping."""
+        return {
+            "task_id": task.task_id,
+            "video_id": task.video_id,
+            "task_type": task.task_type,
+            "status": task.status,
+            "priority": task.priority,
+            "dependencies": task.dependencies,
+            "language": task.language,
+            "created_at": task.created_at or datetime.utcnow(),
+            "started_at": task.started_at,
+            "completed_at": task.completed_at,
+            "error": task.error,
+        }
+
+    def _row_to_domain(self, row: dict) -> Task:
+        """Convert a column-value mapping to domain model."""
+        return Task(**row)
+
+    def _domain_to_entity(self, task: Task) -> TaskEntity:
+        """Convert domain model to database entity."""
+        return TaskEntity(**self._domain_to_row(task))
+
     def _entity_to_domain(self, entity: TaskEntity) -> Task:
         """Convert database entity to domain model."""
         return Task(
@@ -156,13 +182,44 @@ class SQLAlchemyTaskRepository(TaskRepository):
         )
         return [self._entity_to_domain(entity) for entity in entities]
 
+    def find_existing_task_keys(
+        self, video_ids: list[str], task_types: list[str]
+    ) -> dict[str, set[tuple[str, str | None]]]:
+        """Find the (task_type, language) pairs that already have tasks.
+
+        Answers every existence check for a batch of videos with a single
+        query instead of one find_by_video_type_language call per pair.
+
+        Args:
+            video_ids: Video IDs to look up
+            task_types: Task types to consider
+
+        Returns:
+            Mapping of every requested video ID to its existing
+            (task_type, language) pairs
+        """
+        existing: dict[str, set[tuple[str, str | None]]] = {
+            video_id: set() for video_id in video_ids
+        }
+        if not video_ids or not task_types:
+            return existing
+
+        rows = (
+            self.session.query(
+                TaskEntity.video_id, TaskEntity.task_type, TaskEntity.language
+            )
+            .filter(TaskEntity.video_id.in_(video_ids))
+            .filter(TaskEntity.task_type.in_(task_types))
+            .all()
+        )
+        for video_id, task_type, language in rows:
+            existing[video_id].add((task_type, language))
+
+        return existing
+
     def update(self, task: Task) -> Task:
         """Update task in database."""
-        entity = (
-            self.session.query(TaskEntity)
-            .filter(TaskEntity.task_id == task.task_id)
-            .first()
-        )
+        entity = self.session.get(TaskEntity, task.task_id)
 
         if not entity:
             raise ValueError(f"Task not found: {task.task_id}")
@@ -204,3 +261,21 @@ class SQLAlchemyTaskRepository(TaskRepository):
         self.session.commit()
 
         return self._entity_to_domain(entity)
+
+    def reset_failed_tasks(self) -> list[Task]:
+        """Reset every failed task to pending in a single statement.
+
+        Uses UPDATE ... RETURNING so the whole failed backlog is reset and
+        read back in one round trip instead of a fetch and update per task.
+        """
+        entities = self.session.scalars(
+            update(TaskEntity)
+            .where(TaskEntity.status == "failed")
+            .values(status="pending", started_at=None, completed_at=None, error=None)
+            .returning(TaskEntity)
+        ).all()
+        # Convert before commit expires the entities and forces a reload each
+        tasks = [self._entity_to_domain(entity) for entity in entities]
+        self.session.commit()
+
+        return tasks
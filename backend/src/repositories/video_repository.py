@@ -1,5 +1,7 @@
 import logging
+from datetime import datetime
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from ..database.models import Video as VideoEntity
@@ -8,6 +10,9 @@ from .interfaces import VideoRepository
 
 logger = logging.getLogger(__name__)
 
+# Paths per IN (...) lookup, well under SQLite's bound-parameter limit
+FIND_BY_PATHS_CHUNK_SIZE = 500
+
 
 class SqlVideoRepository(VideoRepository):
     """SQLAlchemy implementation of VideoRepository."""
@@ -24,11 +29,7 @@ class SqlVideoRepository(VideoRepository):
             logger.debug(f"Converted to entity: {entity.video_id}")
 
             # Check if exists (update) or new (create)
-            existing = (
-                self.session.query(VideoEntity)
-                .filter(VideoEntity.video_id == video.video_id)
-                .first()
-            )
+            existing = self.session.get(VideoEntity, video.video_id)
 
             if existing:
                 logger.debug(f"Updating existing video: {existing.video_id}")
@@ -52,18 +53,33 @@ class SqlVideoRepository(VideoRepository):
                 return result
         except Exception as e:
             logger.error(f"Error in VideoRepository.save(): {e}")
-            import traceback
+            logger.debug("Traceback for failed VideoRepository.save()", exc_info=True)
+            raise
+
+    def save_many(self, videos: list[Video]) -> list[Video]:
+        """Insert multiple new videos.
+
+        Uses a single Core INSERT executed with every row, bypassing the ORM
+        unit of work, and commits once for the batch. The whole batch is
+        rolled back if any row fails.
+        """
+        if not videos:
+            return []
 
-            traceback.print_exc()
+        now = datetime.utcnow()
+        rows = [self._to_row(video, now) for video in videos]
+        try:
+            self.session.execute(insert(VideoEntity), rows)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
             raise
 
+        return [Video(**row) for row in rows]
+
     def find_by_id(self, video_id: str) -> Video | None:
         """Find video by ID."""
-        entity = (
-            self.session.query(VideoEntity)
-            .filter(VideoEntity.video_id == video_id)
-            .first()
-        )
+        entity = self.session.get(VideoEntity, video_id)
         return self._to_domain(entity) if entity else None
 
     def find_by_path(self, file_path: str) -> Video | None:
@@ -75,6 +91,20 @@ class SqlVideoRepository(VideoRepository):
         )
         return self._to_domain(entity) if entity else None
 
+    def find_by_paths(self, file_paths: list[str]) -> dict[str, Video]:
+        """Find videos by file path, keyed by path; unknown paths are omitted."""
+        found = {}
+        for start in range(0, len(file_paths), FIND_BY_PATHS_CHUNK_SIZE):
+            chunk = file_paths[start : start + FIND_BY_PATHS_CHUNK_SIZE]
+            entities = (
+                self.session.query(VideoEntity)
+                .filter(VideoEntity.file_path.in_(chunk))
+                .all()
+            )
+            for entity in entities:
+                found[entity.file_path] = self._to_domain(entity)
+        return found
+
     def find_by_status(self, status: str) -> list[Video]:
         """Find videos by status."""
         entities = (
@@ -84,11 +114,7 @@ class SqlVideoRepository(VideoRepository):
 
     def delete(self, video_id: str) -> bool:
         """Delete video by ID."""
-        entity = (
-            self.session.query(VideoEntity)
-            .filter(VideoEntity.video_id == video_id)
-            .first()
-        )
+        entity = self.session.get(VideoEntity, video_id)
         if entity:
             self.session.delete(entity)
             self.session.commit()
@@ -142,6 +168,23 @@ class SqlVideoRepository(VideoRepository):
             processed_at=domain.processed_at,
         )
 
+    def _to_row(self, domain: Video, now: datetime) -> dict:
+        """Convert domain model to a column-value mapping for a new row."""
+        return {
+            "video_id": domain.video_id,
+            "file_path": domain.file_path,
+            "filename": domain.filename,
+            "file_hash": domain.file_hash,
+            "last_modified": domain.last_modified,
+            "status": domain.status,
+            "duration": domain.duration,
+            "file_size": domain.file_size,
+            "file_created_at": domain.file_created_at,
+            "processed_at": domain.processed_at,
+            "created_at": domain.created_at or now,
+            "updated_at": domain.updated_at or now,
+        }
+
     def _to_domain(self, entity: VideoEntity) -> Video:
         """Convert SQLAlchemy entity to domain model."""
         return Video(
@@ -17,16 +17,18 @@ class JobProducer:
     """
 
     # All supported tasks
-    SUPPORTED_TASKS = {
-        "object_detection",
-        "face_detection",
-        "transcription",
-        "ocr",
-        "place_detection",
-        "scene_detection",
-        "metadata_extraction",
-        "thumbnail.extraction",
-    }
+    SUPPORTED_TASKS = frozenset(
+        {
+            "object_detection",
+            "face_detection",
+            "transcription",
+            "ocr",
+            "place_detection",
+            "scene_detection",
+            "metadata_extraction",
+            "thumbnail.extraction",
+        }
+    )
 
     def __init__(self, redis_url: str | None = None):
         """Initialize JobProducer with Redis connection.
@@ -122,12 +124,13 @@ class JobProducer:
             f"with job_id {job_id}"
         )
 
-        # Verify job was actually written to Redis
-        jobs_in_queue = await self.pool.zrange(queue_name, 0, -1)
-        if job_id.encode() not in jobs_in_queue:
+        # Verify job was actually written to Redis. ZSCORE is a single member
+        # lookup, so the check stays O(1) however long the queue grows.
+        score = await self.pool.zscore(queue_name, job_id)
+        if score is None:
             logger.error(
                 f"Job {job_id} was not found in Redis queue {queue_name} "
-                f"after enqueueing. Jobs in queue: {jobs_in_queue}"
+                f"after enqueueing"
             )
         else:
             logger.debug(f"Verified job {job_id} is in Redis queue {queue_name}")
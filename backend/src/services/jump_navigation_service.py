@@ -78,15 +78,17 @@ class JumpNavigationService:
         # Filter to only artifacts that start at or after from_ms
         artifacts = [a for a in artifacts if a.span_start_ms >= from_ms]
 
-        # Filter by label/cluster if specified
-        filtered = self._filter_artifacts(artifacts, label, cluster_id, min_confidence)
+        # Return first match (earliest start time), filtered by label/cluster
+        # if specified. Payloads are only parsed up to that match.
+        artifact = next(
+            self._filter_artifacts(artifacts, label, cluster_id, min_confidence),
+            None,
+        )
 
-        if not filtered:
+        if artifact is None:
             logger.debug("No matching artifacts found for jump_next")
             return None
 
-        # Return first match (earliest start time)
-        artifact = filtered[0]
         logger.info(
             f"Jump next found artifact {artifact.artifact_id} at "
             f"{artifact.span_start_ms}ms"
@@ -161,16 +163,20 @@ class JumpNavigationService:
                 f"  - artifact {a.artifact_id}: {a.span_start_ms}-{a.span_end_ms}ms"
             )
 
-        # Filter by label/cluster if specified
-        filtered = self._filter_artifacts(artifacts, label, cluster_id, min_confidence)
+        # Return last match (latest end time before from_ms), filtered by
+        # label/cluster if specified. Artifacts are ordered by span_start_ms,
+        # so scan from the end and only parse payloads up to that match.
+        artifact = next(
+            self._filter_artifacts(
+                reversed(artifacts), label, cluster_id, min_confidence
+            ),
+            None,
+        )
 
-        if not filtered:
+        if artifact is None:
             logger.debug("No matching artifacts found for jump_prev")
             return None
 
-        # Return last match (latest end time before from_ms)
-        # Artifacts are ordered by span_start_ms, so we take the last one
-        artifact = filtered[-1]
         logger.info(
             f"Jump prev found artifact {artifact.artifact_id} at "
             f"{artifact.span_start_ms}ms"
@@ -188,17 +194,18 @@ class JumpNavigationService:
         """
         Filter artifacts by label, cluster, and confidence.
 
+        Lazy, so callers that only need the first match stop parsing payloads
+        as soon as they have it.
+
         Args:
-            artifacts: List of ArtifactEnvelope objects
+            artifacts: Iterable of ArtifactEnvelope objects
             label: Optional label to filter by
             cluster_id: Optional cluster ID to filter by
             min_confidence: Minimum confidence threshold
 
-        Returns:
-            Filtered list of artifacts
+        Yields:
+            Matching artifacts, in input order
         """
-        filtered = []
-
         for artifact in artifacts:
             try:
                 payload = json.loads(artifact.payload_json)
@@ -228,13 +235,10 @@ class JumpNavigationService:
                     )
                     continue
 
-                filtered.append(artifact)
+                yield artifact
 
             except (json.JSONDecodeError, KeyError) as e:
                 logger.warning(
                     f"Failed to parse payload for artifact {artifact.artifact_id}: {e}"
                 )
                 continue
-
-        logger.debug(f"Filtered {len(filtered)} artifacts from {len(artifacts)} total")
-        return filtered
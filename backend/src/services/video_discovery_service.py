@@ -1,16 +1,20 @@
 """Video file discovery service."""
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 from uuid import uuid4
 
 from ..domain.models import PathConfig, Task, Video
 from ..domain.task_registry import (
+    get_bottom_level,
     is_language_optional,
     is_language_required,
 )
 from ..repositories.interfaces import VideoRepository
 from ..repositories.task_repository import SQLAlchemyTaskRepository
 from ..utils.print_logger import get_logger
+from .file_hash_service import FileHashService
 from .job_producer import JobProducer
 from .path_config_manager import PathConfigManager
 
@@ -33,17 +37,19 @@ ACTIVE_TASK_TYPES = [
 class VideoDiscoveryService:
     """Service for discovering video files in configured paths."""
 
-    SUPPORTED_FORMATS = {".mp4", ".mov", ".avi", ".mkv"}
+    SUPPORTED_FORMATS = frozenset({".mp4", ".mov", ".avi", ".mkv"})
 
     def __init__(
         self,
         path_config_manager: PathConfigManager,
         video_repository: VideoRepository,
         job_producer: JobProducer | None = None,
+        hash_service: FileHashService | None = None,
     ):
         self.path_config_manager = path_config_manager
         self.video_repository = video_repository
         self.job_producer = job_producer
+        self.hash_service = hash_service or FileHashService()
 
     def discover_videos(self) -> list[Video]:
         """Discover all video files in configured paths."""
@@ -70,30 +76,91 @@ class VideoDiscoveryService:
             logger.warning(f"Path does not exist: {path}")
             return videos
 
-        # Use glob patterns for each supported format (much more efficient)
-        # Check both lowercase and uppercase extensions for case-insensitive matching
-        for extension in self.SUPPORTED_FORMATS:
-            for ext_variant in [extension, extension.upper()]:
-                pattern = (
-                    f"**/*{ext_variant}" if path_config.recursive else f"*{ext_variant}"
-                )
-                logger.debug(f"Scanning with pattern: {pattern}")
+        video_files = list(self._iter_video_files(path, path_config.recursive))
+        file_paths = [str(video_file) for video_file in video_files]
+        by_path = self.video_repository.find_by_paths(file_paths)
+
+        new_files = [
+            (video_file, file_path)
+            for video_file, file_path in zip(video_files, file_paths)
+            if file_path not in by_path
+        ]
+        # Hash new files as one batch so they can be hashed in parallel
+        file_hashes = self.hash_service.calculate_hashes(
+            [file_path for _, file_path in new_files]
+        )
+
+        new_videos = []
+        for (video_file, _), file_hash in zip(new_files, file_hashes):
+            video = self._build_video_from_file(video_file, file_hash)
+            if video:
+                new_videos.append(video)
 
-                glob_method = path.rglob if path_config.recursive else path.glob
-                for video_file in glob_method(f"*{ext_variant}"):
-                    if video_file.is_file():
-                        video = self._create_video_from_file(video_file)
-                        if video:
-                            videos.append(video)
+        for video in self._save_new_videos(new_videos):
+            by_path[video.file_path] = video
+
+        # Keep walk order, dropping files whose record could not be created
+        for file_path in file_paths:
+            if file_path in by_path:
+                videos.append(by_path[file_path])
 
         return videos
 
+    def _save_new_videos(self, videos: list[Video]) -> list[Video]:
+        """Insert newly discovered videos in one batch.
+
+        If the batch fails (e.g. another scan inserted one of the paths
+        first), fall back to saving one at a time so a single bad row does
+        not drop the rest.
+        """
+        if not videos:
+            return []
+        try:
+            saved = self.video_repository.save_many(videos)
+            logger.info(f"Saved {len(saved)} new videos")
+            return saved
+        except Exception as e:
+            logger.error(f"Batch video insert failed, saving individually: {e}")
+
+        saved = []
+        for video in videos:
+            try:
+                saved.append(self.video_repository.save(video))
+            except Exception as e:
+                logger.error(f"Error saving video {video.file_path}: {e}")
+        return saved
+
+    def _iter_video_files(self, root: Path, recursive: bool) -> Iterator[Path]:
+        """Yield supported video files under root in a single walk.
+
+        Uses os.scandir so entry types come from the directory listing rather
+        than a stat per entry, and only matches are wrapped in Path. Symlinked
+        directories are not descended into; symlinked files are followed.
+        """
+        pending = [str(root)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending.append(entry.path)
+                        elif (
+                            os.path.splitext(entry.name)[1].lower()
+                            in self.SUPPORTED_FORMATS
+                            and entry.is_file()
+                        ):
+                            yield Path(entry.path)
+            except OSError as e:
+                logger.warning(f"Cannot scan directory {directory}: {e}")
+
     def _is_video_file(self, file_path: Path) -> bool:
         """Check if file is a supported video format."""
         return file_path.suffix.lower() in self.SUPPORTED_FORMATS
 
     def _create_video_from_file(self, file_path: Path) -> Video | None:
-        """Create Video domain object from file path."""
+        """Create and save a Video for a file, or return its existing record."""
         try:
             logger.debug(f"Creating video from file: {file_path}")
 
@@ -103,23 +170,45 @@ class VideoDiscoveryService:
                 logger.debug(f"Video already exists: {existing.video_id}")
                 return existing
 
+            video = self._build_video_from_file(
+                file_path, self._calculate_file_hash(file_path)
+            )
+            if not video:
+                return None
+
+            # Save to database
+            logger.debug("Attempting to save video to database...")
+            saved_video = self.video_repository.save(video)
+            logger.info(f"Video saved successfully: {saved_video.video_id}")
+            return saved_video
+
+        except Exception as e:
+            # Log the error for debugging
+            logger.error(f"Error creating video from {file_path}: {e}")
+            logger.debug("Traceback for failed video creation", exc_info=True)
+            return None
+
+    def _calculate_file_hash(self, file_path: Path) -> str | None:
+        """Compute a file's hash during discovery, or None if it fails."""
+        try:
+            file_hash = self.hash_service.calculate_hash(str(file_path))
+            logger.info(f"Computed file hash for {file_path.name}: {file_hash}")
+            return file_hash
+        except Exception as e:
+            logger.error(f"Failed to compute file hash for {file_path}: {e}")
+            return None
+
+    def _build_video_from_file(
+        self, file_path: Path, file_hash: str | None
+    ) -> Video | None:
+        """Build an unsaved Video domain object from file path and hash."""
+        try:
             # Get file stats
             stat = file_path.stat()
             logger.debug(
                 f"File stats - size: {stat.st_size}, modified: {stat.st_mtime}"
             )
 
-            # Compute file hash during discovery
-            from .file_hash_service import FileHashService
-
-            hash_service = FileHashService()
-            try:
-                file_hash = hash_service.calculate_hash(str(file_path))
-                logger.info(f"Computed file hash for {file_path.name}: {file_hash}")
-            except Exception as e:
-                logger.error(f"Failed to compute file hash for {file_path}: {e}")
-                file_hash = None
-
             # Create new video
             import uuid
             from datetime import datetime
@@ -134,19 +223,10 @@ class VideoDiscoveryService:
                 file_size=stat.st_size,
             )
             logger.debug(f"Created video object: {video.video_id}")
-
-            # Save to database
-            logger.debug("Attempting to save video to database...")
-            saved_video = self.video_repository.save(video)
-            logger.info(f"Video saved successfully: {saved_video.video_id}")
-            return saved_video
+            return video
 
         except Exception as e:
-            # Log the error for debugging
-            logger.error(f"Error creating video from {file_path}: {e}")
-            import traceback
-
-            traceback.print_exc()
+            logger.error(f"Error reading video file {file_path}: {e}")
             return None
 
     def validate_existing_videos(self) -> list[Video]:
@@ -209,6 +289,10 @@ class VideoDiscoveryService:
         existing = self.video_repository.find_by_path(video_path)
         if existing:
             logger.info(f"Video already exists: {existing.video_id}")
+            if existing.is_processed():
+                # Completed videos already have every task; skip the task scan
+                logger.info(f"Video already processed: {existing.video_id}")
+                return existing.video_id
             video = existing
         else:
             # Create video record
@@ -218,7 +302,11 @@ class VideoDiscoveryService:
             logger.info(f"Created video record: {video.video_id}")
 
         task_repo = SQLAlchemyTaskRepository(self.video_repository.session)
+        existing_keys = task_repo.find_existing_task_keys(
+            [video.video_id], ACTIVE_TASK_TYPES
+        )[video.video_id]
 
+        new_tasks: list[tuple[Task, dict]] = []
         for task_type in ACTIVE_TASK_TYPES:
             # Get default config for task type
             config = self._get_default_config(task_type)
@@ -226,90 +314,88 @@ class VideoDiscoveryService:
             if is_language_required(task_type):
                 # OCR: Create one task per configured language
                 languages = config.get("languages", ["en"])
-                for lang in languages:
-                    await self._create_task_if_not_exists(
-                        task_repo=task_repo,
-                        video=video,
-                        video_path=video_path,
-                        task_type=task_type,
-                        language=lang,
-                        config=config,
-                    )
             elif is_language_optional(task_type):
                 # Transcription: Check if languages are configured
                 languages = config.get("languages")
-                if languages and isinstance(languages, list) and len(languages) > 0:
-                    # Create one task per configured language
-                    for lang in languages:
-                        await self._create_task_if_not_exists(
-                            task_repo=task_repo,
-                            video=video,
-                            video_path=video_path,
-                            task_type=task_type,
-                            language=lang,
-                            config=config,
-                        )
-                else:
+                if not (
+                    languages and isinstance(languages, list) and len(languages) > 0
+                ):
                     # Auto-detect mode: single task with NULL language
-                    await self._create_task_if_not_exists(
-                        task_repo=task_repo,
-                        video=video,
-                        video_path=video_path,
-                        task_type=task_type,
-                        language=None,
-                        config=config,
-                    )
+                    languages = [None]
             else:
                 # Language-agnostic tasks (face_detection, object_detection, etc.)
-                await self._create_task_if_not_exists(
-                    task_repo=task_repo,
+                languages = [None]
+
+            for lang in languages:
+                new_task = self._build_task_if_not_exists(
+                    existing_keys=existing_keys,
                     video=video,
-                    video_path=video_path,
                     task_type=task_type,
-                    language=None,
+                    language=lang,
                     config=config,
                 )
+                if new_task:
+                    new_tasks.append(new_task)
+
+        if new_tasks:
+            # The job queue runs jobs in enqueue order, so enqueue the
+            # critical path (tasks other tasks wait on) first
+            new_tasks.sort(
+                key=lambda item: get_bottom_level(item[0].task_type), reverse=True
+            )
+
+            # Create all task records in PostgreSQL with one batched insert
+            try:
+                task_repo.save_many([task for task, _ in new_tasks])
+            except Exception as e:
+                logger.error(
+                    f"Failed to create {len(new_tasks)} task records for video "
+                    f"{video.video_id}: {e}",
+                    exc_info=True,
+                )
+                raise
+            logger.info(
+                f"Created {len(new_tasks)} task records for video {video.video_id}"
+            )
+
+            for task, task_config in new_tasks:
+                await self._enqueue_task(task, video_path, task_config)
 
         logger.info(
             f"Successfully discovered and queued all tasks for video {video.video_id}"
         )
         return video.video_id
 
-    async def _create_task_if_not_exists(
+    def _build_task_if_not_exists(
         self,
-        task_repo: SQLAlchemyTaskRepository,
+        existing_keys: set[tuple[str, str | None]],
         video: Video,
-        video_path: str,
         task_type: str,
         language: str | None,
         config: dict,
-    ) -> bool:
-        """Create a task if it doesn't already exist.
+    ) -> tuple[Task, dict] | None:
+        """Build a task and its job config if it doesn't already exist.
 
         Args:
-            task_repo: Task repository instance
+            existing_keys: (task_type, language) pairs that already have tasks
+                for this video; updated with the task being built
             video: Video domain object
-            video_path: Path to video file
             task_type: Type of task to create
             language: Language for the task (None for language-agnostic)
             config: Configuration dictionary for the task
 
         Returns:
-            True if task was created, False if it already existed
+            (task, task_config) for a new task, or None if it already existed
         """
         # Check if task already exists for this video, type, and language
-        existing_task = task_repo.find_by_video_type_language(
-            video.video_id, task_type, language
-        )
-        if existing_task:
+        if (task_type, language) in existing_keys:
             lang_str = f" ({language})" if language else ""
             logger.info(
                 f"Task already exists for video {video.video_id} "
                 f"({task_type}{lang_str}), skipping creation"
             )
-            return False
-
-        task_id = str(uuid4())
+            return None
+        existing_keys.add((task_type, language))
 
         # Build task-specific config with language
         task_config = config.copy()
@@ -319,56 +405,48 @@ class VideoDiscoveryService:
             # Remove languages list to avoid confusion
             task_config.pop("languages", None)
 
-        # Create task record in PostgreSQL
         task = Task(
-            task_id=task_id,
+            task_id=str(uuid4()),
             video_id=video.video_id,
             task_type=task_type,
             language=language,
             status="pending",
-            priority=1,
+            priority=get_bottom_level(task_type),
         )
-        try:
-            task_repo.save(task)
-            lang_str = f" ({language})" if language else ""
-            logger.info(
-                f"Created task record {task_id} ({task_type}{lang_str}) for "
-                f"video {video.video_id}"
-            )
-        except Exception as e:
-            logger.error(
-                f"Failed to create task record {task_id} ({task_type}): {e}",
-                exc_info=True,
-            )
-            raise
+        return task, task_config
 
-        # Enqueue job to Redis
+    async def _enqueue_task(self, task: Task, video_path: str, config: dict) -> None:
+        """Enqueue a saved task's job to Redis.
+
+        Args:
+            task: Task domain object already saved to the database
+            video_path: Path to video file
+            config: Task-specific job configuration
+        """
+        lang_str = f" ({task.language})" if task.language else ""
         try:
-            lang_str = f" ({language})" if language else ""
             logger.info(
-                f"Enqueueing task {task_id} ({task_type}{lang_str}) "
-                f"with config: {task_config}"
+                f"Enqueueing task {task.task_id} ({task.task_type}{lang_str}) "
+                f"with config: {config}"
             )
             await self.job_producer.enqueue_task(
-                task_id=task_id,
-                task_type=task_type,
-                video_id=video.video_id,
+                task_id=task.task_id,
+                task_type=task.task_type,
+                video_id=task.video_id,
                 video_path=video_path,
-                config=task_config,
+                config=config,
             )
             logger.info(
-                f"Enqueued task {task_id} ({task_type}{lang_str}) "
-                f"for video {video.video_id}"
+                f"Enqueued task {task.task_id} ({task.task_type}{lang_str}) "
+                f"for video {task.video_id}"
             )
         except Exception as e:
             logger.error(
-                f"Failed to enqueue task {task_id} ({task_type}): {e}",
+                f"Failed to enqueue task {task.task_id} ({task.task_type}): {e}",
                 exc_info=True,
             )
             raise
 
-        return True
-
     def _get_default_config(self, task_type: str) -> dict:
         """Get default configuration for task type.
 
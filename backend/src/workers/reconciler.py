@@ -6,6 +6,7 @@ This module implements the Reconciler class that:
 3. Alerts on long-running tasks (never auto-kills)
 4. Uses PostgreSQL as source of truth for task state
 5. Runs periodically (every 5 minutes via arq cron)
+6. Keeps running per-transition counts in a Redis hash for monitoring
 """
 
 import logging
@@ -15,6 +16,7 @@ from sqlalchemy.orm import Session
 
 from ..config.redis_config import REDIS_SETTINGS
 from ..database.connection import get_db
+from ..domain.task_registry import get_bottom_level
 from ..repositories.task_repository import SQLAlchemyTaskRepository
 from ..services.job_producer import JobProducer
 
@@ -23,6 +25,9 @@ logger = logging.getLogger(__name__)
 # Alert threshold for long-running tasks (in seconds)
 LONG_RUNNING_THRESHOLD = 3600  # 1 hour
 
+# Redis hash holding cumulative reconciler counts (read with a single HGETALL)
+COUNTS_KEY = "reconciler:counts"
+
 
 class Reconciler:
     """Reconciler for synchronizing PostgreSQL and Redis state.
@@ -44,6 +49,7 @@ class Reconciler:
         self.task_repo = None
         self.job_producer = None
         self._owns_session = session is None
+        self._redis = None
 
     async def run(self) -> dict:
         """Run all reconciliation checks.
@@ -120,6 +126,11 @@ class Reconciler:
         logger.info("Syncing PENDING tasks")
 
         pending_tasks = self.task_repo.find_by_status("pending")
+        # Re-enqueue the critical path first; rows saved before priorities
+        # held the bottom level would otherwise keep their insertion order
+        pending_tasks.sort(
+            key=lambda task: get_bottom_level(task.task_type), reverse=True
+        )
         checked = 0
         reenqueued = 0
 
@@ -166,6 +177,7 @@ class Reconciler:
                     )
 
                     reenqueued += 1
+                    self._bump("pending_reenqueued")
                     logger.info(f"Re-enqueued PENDING task {task.task_id}")
 
             except Exception as e:
@@ -243,6 +255,7 @@ class Reconciler:
                     )
 
                     synced += 1
+                    self._bump("running_reset")
                     logger.info(f"Reset RUNNING task {task.task_id} to PENDING")
 
                 else:
@@ -260,6 +273,7 @@ class Reconciler:
                         self.task_repo.update(task)
 
                         synced += 1
+                        self._bump("running_completed")
 
                     elif job_status == "failed":
                         logger.warning(
@@ -273,6 +287,7 @@ class Reconciler:
                         self.task_repo.update(task)
 
                         synced += 1
+                        self._bump("running_failed")
 
             except Exception as e:
                 logger.error(
@@ -313,10 +328,56 @@ class Reconciler:
                     # In a real implementation, this would send an alert
                     # (e.g., email, Slack, PagerDuty, etc.)
                     alerted += 1
+                    self._bump("long_running_alerted")
 
         logger.info(f"Long-running check complete: alerted={alerted}")
         return {"alerted": alerted}
 
+    def get_counts(self) -> dict[str, int]:
+        """Get cumulative reconciler counts from Redis.
+
+        Counts are maintained incrementally by ``_bump`` so this is a single
+        HGETALL regardless of how many tasks the reconciler has processed.
+
+        Returns:
+            Dictionary mapping count name to value (empty on Redis error)
+        """
+        try:
+            counts = self._get_redis().hgetall(COUNTS_KEY)
+            return {field: int(value) for field, value in counts.items()}
+        except Exception as e:
+            logger.error(f"Error reading reconciler counts: {e}", exc_info=True)
+            return {}
+
+    def _bump(self, field: str, delta: int = 1) -> None:
+        """Atomically increment a reconciler count in Redis.
+
+        Bookkeeping failures are logged and never interrupt reconciliation.
+
+        Args:
+            field: Count name within the counts hash
+            delta: Amount to increment by
+        """
+        try:
+            pipeline = self._get_redis().pipeline()
+            pipeline.hincrby(COUNTS_KEY, field, delta)
+            pipeline.execute()
+        except Exception as e:
+            logger.debug(f"Error bumping reconciler count {field}: {e}")
+
+    def _get_redis(self):
+        """Get the Redis client shared by this reconciler, creating it lazily."""
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.Redis(
+                host=REDIS_SETTINGS.host,
+                port=REDIS_SETTINGS.port,
+                db=REDIS_SETTINGS.database,
+                decode_responses=True,
+            )
+        return self._redis
+
     async def _check_job_exists(self, task_id: str) -> bool:
         """Check if a job exists in Redis for the given task.
 
@@ -0,0 +1,134 @@
+"""Shared pytest fixtures for database-backed tests."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from src.database.models import Base
+from tests.db_utils import create_test_engine, execute_script
+
+# File-backed test databases still journal to disk; WAL with NORMAL sync drops
+# the fsync on every commit.
+SQLITE_FILE_TEST_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    # Used with pytest-xdist's --dist=loadgroup to keep tests that share
+    # process-wide state on the same worker.
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing a group on one worker"
+    )
+
+
+@pytest.fixture(scope="session")
+def ddl_script():
+    """Compile the schema DDL once into a single SQLite script.
+
+    Equivalent to Base.metadata.create_all, but compiled a single time and
+    executed with one executescript call instead of a statement per table.
+    """
+    dialect = sqlite.dialect()
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)).strip())
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            statements.append(str(CreateIndex(index).compile(dialect=dialect)))
+    return ";\n".join(statements) + ";"
+
+
+@pytest.fixture(scope="session")
+def engine(ddl_script):
+    """Create a single in-memory SQLite engine shared by the whole test session.
+
+    The schema is built exactly once; tests are isolated by the transactional
+    session fixture below.
+    """
+    engine = create_test_engine()
+    execute_script(engine, ddl_script)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def template_engine(ddl_script):
+    """Create an empty in-memory database holding only the schema.
+
+    Serves as the clone source for fresh_engine and is never written to.
+    """
+    engine = create_test_engine()
+    execute_script(engine, ddl_script)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def file_engine(tmp_path_factory, ddl_script):
+    """Create a file-backed SQLite database holding the schema.
+
+    For tests that need a real database file rather than the shared in-memory
+    engine. One database is created per test module.
+    """
+    path = tmp_path_factory.mktemp("db") / "test.db"
+    engine = create_engine(f"sqlite:///{path}")
+
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_FILE_TEST_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    execute_script(engine, ddl_script)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def fresh_engine(template_engine):
+    """Create a private in-memory database cloned from the schema template.
+
+    For tests that need a database of their own rather than a rolled-back
+    view of the shared one. SQLite's backup API copies the template's pages
+    directly, which is cheaper than replaying the DDL.
+    """
+    engine = create_test_engine()
+    source = template_engine.raw_connection()
+    target = engine.raw_connection()
+    try:
+        source.driver_connection.backup(target.driver_connection)
+    finally:
+        target.close()
+        source.close()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    """Create database session for testing.
+
+    The session is joined into an outer transaction and every commit made by
+    the code under test only releases a SAVEPOINT, so rolling back the outer
+    transaction on teardown discards everything the test wrote.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session_factory = sessionmaker(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
+    session = session_factory()
+    try:
+        yield session
+    finally:
+        # Rolling back the outer transaction discards every savepoint first,
+        # leaving the session nothing to flush or roll back when it closes.
+        transaction.rollback()
+        session.close()
+        connection.close()
@@ -0,0 +1,61 @@
+"""Helpers for building SQLite test databases.
+
+Kept out of conftest.py so test modules can import them directly.
+"""
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+
+# Durability settings are pointless for throwaway test databases: keep the
+# rollback journal in memory and never fsync on commit.
+SQLITE_TEST_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+# Compiled-statement cache entries per engine. Larger than SQLAlchemy's
+# default of 500 so the repository queries repeated across the whole suite
+# stay compiled on the shared engine.
+TEST_QUERY_CACHE_SIZE = 1200
+
+
+def create_test_engine():
+    """Create an in-memory SQLite engine configured for tests.
+
+    StaticPool keeps one connection alive so every session sees the same
+    in-memory database.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        query_cache_size=TEST_QUERY_CACHE_SIZE,
+    )
+
+    # Apply the test pragmas on connect. pysqlite also defers BEGIN until the
+    # first DML statement, which breaks SAVEPOINT handling; take over
+    # transaction control so nested transactions roll back correctly.
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_TEST_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+def execute_script(engine, script):
+    """Run a multi-statement SQL script on the engine's DBAPI connection."""
+    raw_connection = engine.raw_connection()
+    try:
+        raw_connection.cursor().executescript(script)
+    finally:
+        raw_connection.close()
@@ -1,37 +1,21 @@
 import os
-import tempfile
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from src.database.connection import Base
 from src.main_api import app
+from src.services.job_producer import JobProducer
 
 # Set testing mode to prevent worker pools from starting
 os.environ["TESTING"] = "true"
 
 
 @pytest.fixture(scope="module")
-def test_db():
-    """Create a temporary database for testing."""
-    # Create temporary database file
-    db_fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(db_fd)
-
-    # Create engine and tables
-    engine = create_engine(f"sqlite:///{db_path}")
-    Base.metadata.create_all(engine)
-
-    # Create session factory
-    testing_session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-    yield testing_session_local
-
-    # Cleanup
-    os.unlink(db_path)
+def test_db(file_engine):
+    """Create a session factory on a temporary database for testing."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=file_engine)
 
 
 @pytest.fixture(scope="module")
@@ -50,9 +34,7 @@ def client(test_db):
     app.dependency_overrides[get_db] = override_get_db
 
     # Mock the job producer to avoid Redis connection
-    mock_job_producer = AsyncMock()
-    mock_job_producer.initialize = AsyncMock()
-    mock_job_producer.close = AsyncMock()
+    mock_job_producer = AsyncMock(spec=JobProducer)
 
     with patch("src.main_api.JobProducer", return_value=mock_job_producer):
         with TestClient(app) as test_client:
@@ -5,11 +5,8 @@ from datetime import datetime
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from src.database.models import Base
 from src.database.models import Video as VideoEntity
 from src.domain.artifacts import ArtifactEnvelope
 from src.domain.schema_initialization import register_all_schemas
@@ -21,23 +18,9 @@ from src.services.jump_navigation_service import JumpNavigationService
 
 
 @pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    # Use check_same_thread=False to allow SQLite to be used across threads in tests
-    # Use StaticPool to share connection across threads
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    Base.metadata.create_all(engine)
-    return engine
-
-
-@pytest.fixture
-def session(engine):
+def session(fresh_engine):
     """Create database session for testing."""
-    session_factory = sessionmaker(bind=engine)
+    session_factory = sessionmaker(bind=fresh_engine)
     session = session_factory()
     yield session
     session.close()
@@ -72,7 +55,7 @@ def test_video(session):
 
 
 @pytest.fixture
-def client(engine, session):
+def client(session, schema_registry):
     """Create test client with in-memory database."""
     from unittest.mock import Mock
 
@@ -94,41 +77,29 @@ def client(engine, session):
     mock_projection_sync = Mock(spec=ProjectionSyncService)
     mock_projection_sync.sync_artifact = Mock()
 
+    # Wire the services once per test; the overrides hand out these instances
+    # instead of rebuilding repositories on every request.
+    artifact_repo = SqlArtifactRepository(
+        session, schema_registry, mock_projection_sync
+    )
+    policy_manager = SelectionPolicyManager(session)
+    jump_service = JumpNavigationService(artifact_repo, policy_manager)
+    find_service = FindWithinVideoService(session, policy_manager)
+
     def override_get_db():
         try:
             yield session
         finally:
             pass
 
-    def override_jump_service():
-        from src.domain.schema_registry import SchemaRegistry
-
-        artifact_repo = SqlArtifactRepository(
-            session, SchemaRegistry, mock_projection_sync
-        )
-        policy_manager = SelectionPolicyManager(session)
-        return JumpNavigationService(artifact_repo, policy_manager)
-
-    def override_find_service():
-        policy_manager = SelectionPolicyManager(session)
-        return FindWithinVideoService(session, policy_manager)
-
-    def override_artifact_repo():
-        from src.domain.schema_registry import SchemaRegistry
-
-        return SqlArtifactRepository(session, SchemaRegistry, mock_projection_sync)
-
-    def override_policy_manager():
-        return SelectionPolicyManager(session)
-
     # Create app without lifespan to avoid startup issues in tests
     app = FastAPI()
     app.include_router(artifact_router, prefix="/v1")
     app.dependency_overrides[get_db] = override_get_db
-    app.dependency_overrides[get_jump_navigation_service] = override_jump_service
-    app.dependency_overrides[get_find_within_video_service] = override_find_service
-    app.dependency_overrides[get_artifact_repository] = override_artifact_repo
-    app.dependency_overrides[get_selection_policy_manager] = override_policy_manager
+    app.dependency_overrides[get_jump_navigation_service] = lambda: jump_service
+    app.dependency_overrides[get_find_within_video_service] = lambda: find_service
+    app.dependency_overrides[get_artifact_repository] = lambda: artifact_repo
+    app.dependency_overrides[get_selection_policy_manager] = lambda: policy_manager
 
     return TestClient(app)
 
@@ -168,6 +168,15 @@ class TestSelectionPolicy:
         assert policy.asset_id == "video_456"
         assert policy.is_default() is False
 
+    def test_invalid_mode_rejected(self):
+        """Test that an unknown selection mode is rejected."""
+        with pytest.raises(ValueError, match="mode must be one of"):
+            SelectionPolicy(
+                asset_id="video_456",
+                artifact_type="transcript.segment",
+                mode="invalid_mode",
+            )
+
     def test_profile_mode_requires_preferred_profile(self):
         """Test that profile mode requires preferred_profile."""
         with pytest.raises(ValueError, match="preferred_profile required"):
@@ -1,13 +1,13 @@
 """Tests for ArtifactRepository implementation."""
 
 import json
+from dataclasses import asdict
 from datetime import datetime
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert
 
-from src.database.models import Base
+from src.database.models import Artifact as ArtifactEntity
 from src.database.models import Video as VideoEntity
 from src.domain.artifacts import ArtifactEnvelope, SelectionPolicy
 from src.domain.schema_initialization import register_all_schemas
@@ -15,23 +15,6 @@ from src.domain.schema_registry import SchemaRegistry
 from src.repositories.artifact_repository import SqlArtifactRepository
 
 
-@pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    return engine
-
-
-@pytest.fixture
-def session(engine):
-    """Create database session for testing."""
-    session_factory = sessionmaker(bind=engine)
-    session = session_factory()
-    yield session
-    session.close()
-
-
 @pytest.fixture(scope="session")
 def schema_registry():
     """Create and initialize schema registry once for all tests."""
@@ -82,6 +65,12 @@ def sample_artifact(test_video):
     )
 
 
+def insert_artifacts(session, *artifacts):
+    """Seed artifacts with a single Core executemany insert and one commit."""
+    session.execute(insert(ArtifactEntity), [asdict(a) for a in artifacts])
+    session.commit()
+
+
 def test_create_artifact(repository, sample_artifact):
     """Test creating an artifact."""
     result = repository.create(sample_artifact)
@@ -123,10 +112,8 @@ def test_get_by_id_not_found(repository):
     assert result is None
 
 
-def test_get_by_asset(repository, sample_artifact, test_video):
+def test_get_by_asset(session, repository, sample_artifact, test_video):
     """Test retrieving artifacts by asset ID."""
-    repository.create(sample_artifact)
-
     # Create another artifact for the same asset
     artifact2 = ArtifactEnvelope(
         artifact_id="artifact_2",
@@ -151,7 +138,7 @@ def test_get_by_asset(repository, sample_artifact, test_video):
         run_id="run_1",
         created_at=datetime.now(),
     )
-    repository.create(artifact2)
+    insert_artifacts(session, sample_artifact, artifact2)
 
     results = repository.get_by_asset(test_video.video_id)
 
@@ -160,10 +147,10 @@ def test_get_by_asset(repository, sample_artifact, test_video):
     assert results[1].artifact_id == artifact2.artifact_id
 
 
-def test_get_by_asset_with_type_filter(repository, sample_artifact, test_video):
+def test_get_by_asset_with_type_filter(
+    session, repository, sample_artifact, test_video
+):
     """Test retrieving artifacts by asset ID and type."""
-    repository.create(sample_artifact)
-
     # Create artifact of different type
     scene_artifact = ArtifactEnvelope(
         artifact_id="artifact_scene",
@@ -183,7 +170,7 @@ def test_get_by_asset_with_type_filter(repository, sample_artifact, test_video):
         run_id="run_1",
         created_at=datetime.now(),
     )
-    repository.create(scene_artifact)
+    insert_artifacts(session, sample_artifact, scene_artifact)
 
     results = repository.get_by_asset(
         test_video.video_id, artifact_type="transcript.segment"
@@ -193,10 +180,8 @@ def test_get_by_asset_with_type_filter(repository, sample_artifact, test_video):
     assert results[0].artifact_type == "transcript.segment"
 
 
-def test_get_by_asset_with_time_range(repository, sample_artifact, test_video):
+def test_get_by_asset_with_time_range(session, repository, sample_artifact, test_video):
     """Test retrieving artifacts by asset ID and time range."""
-    repository.create(sample_artifact)
-
     # Create artifacts at different times
     artifact2 = ArtifactEnvelope(
         artifact_id="artifact_2",
@@ -221,7 +206,7 @@ def test_get_by_asset_with_time_range(repository, sample_artifact, test_video):
         run_id="run_1",
         created_at=datetime.now(),
     )
-    repository.create(artifact2)
+    insert_artifacts(session, sample_artifact, artifact2)
 
     results = repository.get_by_asset(test_video.video_id, start_ms=0, end_ms=2000)
 
@@ -229,10 +214,8 @@ def test_get_by_asset_with_time_range(repository, sample_artifact, test_video):
     assert results[0].artifact_id == sample_artifact.artifact_id
 
 
-def test_get_by_span(repository, sample_artifact, test_video):
+def test_get_by_span(session, repository, sample_artifact, test_video):
     """Test retrieving artifacts overlapping a time span."""
-    repository.create(sample_artifact)
-
     # Create artifacts at different times
     artifact2 = ArtifactEnvelope(
         artifact_id="artifact_2",
@@ -257,7 +240,6 @@ def test_get_by_span(repository, sample_artifact, test_video):
         run_id="run_1",
         created_at=datetime.now(),
     )
-    repository.create(artifact2)
 
     artifact3 = ArtifactEnvelope(
         artifact_id="artifact_3",
@@ -282,7 +264,7 @@ def test_get_by_span(repository, sample_artifact, test_video):
         run_id="run_1",
         created_at=datetime.now(),
     )
-    repository.create(artifact3)
+    insert_artifacts(session, sample_artifact, artifact2, artifact3)
 
     # Query for artifacts overlapping [400, 1200]
     results = repository.get_by_span(
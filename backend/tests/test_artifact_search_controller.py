@@ -12,35 +12,14 @@ Requirements:
 
 from datetime import datetime
 
-import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
 from src.api.artifact_search_controller import (
     KIND_TO_ARTIFACT_TYPE,
     build_search_query,
 )
-from src.database.models import Artifact, Base
+from src.database.models import Artifact
 from src.database.models import Video as VideoEntity
 
 
-@pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    return engine
-
-
-@pytest.fixture
-def session(engine):
-    """Create database session for testing."""
-    session_factory = sessionmaker(bind=engine)
-    session = session_factory()
-    yield session
-    session.close()
-
-
 def create_test_video(
     session,
     video_id: str,
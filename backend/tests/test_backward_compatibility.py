@@ -21,10 +21,8 @@ from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from src.database.models import Base, ObjectLabel
+from src.database.models import ObjectLabel
 from src.database.models import Video as VideoEntity
 from src.domain.artifacts import ArtifactEnvelope
 from src.domain.schema_initialization import register_all_schemas
@@ -35,23 +33,6 @@ from src.services.global_jump_service import GlobalJumpService
 from src.services.jump_navigation_service import JumpNavigationService
 
 
-@pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    return engine
-
-
-@pytest.fixture
-def session(engine):
-    """Create database session for testing."""
-    session_factory = sessionmaker(bind=engine)
-    session = session_factory()
-    yield session
-    session.close()
-
-
 @pytest.fixture(scope="session")
 def schema_registry():
     """Create and initialize schema registry once for all tests."""
@@ -3,14 +3,15 @@
 import json
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, create_autospec, patch
 
 from src.services.config_loader import ConfigLoader
+from src.services.path_config_manager import PathConfigManager
 
 
 def test_config_loader_with_existing_config():
     """Test ConfigLoader with existing configuration file."""
-    mock_manager = Mock()
+    mock_manager = create_autospec(PathConfigManager, instance=True)
     mock_manager.list_paths.return_value = []  # No existing paths
 
     loader = ConfigLoader(mock_manager)
@@ -41,7 +42,7 @@ def test_config_loader_with_existing_config():
 
 def test_config_loader_with_default_config():
     """Test ConfigLoader with default configuration."""
-    mock_manager = Mock()
+    mock_manager = create_autospec(PathConfigManager, instance=True)
     mock_manager.list_paths.return_value = []  # No existing paths
 
     loader = ConfigLoader(mock_manager)
@@ -55,7 +56,7 @@ def test_config_loader_with_default_config():
 
 def test_config_loader_merge_behavior():
     """Test ConfigLoader properly merges new paths with existing ones."""
-    mock_manager = Mock()
+    mock_manager = create_autospec(PathConfigManager, instance=True)
 
     # Mock existing path
     existing_path = Mock()
@@ -92,7 +93,7 @@ def test_config_loader_merge_behavior():
 
 def test_config_loader_merges_with_existing_paths():
     """Test ConfigLoader merges config paths with existing paths."""
-    mock_manager = Mock()
+    mock_manager = create_autospec(PathConfigManager, instance=True)
     mock_manager.list_paths.return_value = [Mock()]  # Existing paths
 
     loader = ConfigLoader(mock_manager)
@@ -106,7 +107,7 @@ def test_config_loader_merges_with_existing_paths():
 
 def test_config_loader_handles_invalid_config():
     """Test ConfigLoader handles invalid configuration gracefully."""
-    mock_manager = Mock()
+    mock_manager = create_autospec(PathConfigManager, instance=True)
     mock_manager.list_paths.return_value = []
 
     loader = ConfigLoader(mock_manager)
@@ -129,7 +130,7 @@ def test_config_loader_handles_invalid_config():
 
 def test_create_default_config_file():
     """Test creating default configuration file."""
-    mock_manager = Mock()
+    mock_manager = create_autospec(PathConfigManager, instance=True)
     loader = ConfigLoader(mock_manager)
 
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -5,8 +5,13 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+import xxhash
 
-from src.services.file_hash_service import FileHashError, FileHashService
+from src.services.file_hash_service import (
+    PARALLEL_HASH_MIN_FILES,
+    FileHashError,
+    FileHashService,
+)
 
 
 class TestFileHashService:
@@ -129,6 +134,17 @@ class TestFileHashService:
         finally:
             Path(temp_path).unlink()
 
+    @pytest.mark.parametrize("chunk_size", [4, 1000, 1 << 20])
+    def test_chunked_hash_matches_whole_file_hash(self, tmp_path, chunk_size):
+        """Test the hash does not depend on how the file is split into reads."""
+        content = bytes(range(256)) * 10
+        path = tmp_path / "video.mp4"
+        path.write_bytes(content)
+
+        hash_value = FileHashService(chunk_size=chunk_size).calculate_hash(str(path))
+
+        assert hash_value == xxhash.xxh64(content).hexdigest()
+
     def test_empty_file(self):
         """Test hash calculation for empty file."""
         with tempfile.NamedTemporaryFile(delete=False) as f:
@@ -141,3 +157,18 @@ class TestFileHashService:
 
         finally:
             Path(temp_path).unlink()
+
+    @pytest.mark.parametrize("file_count", [2, PARALLEL_HASH_MIN_FILES])
+    def test_calculate_hashes_matches_single_hashes(self, tmp_path, file_count):
+        """Test batch hashing, in-process and across worker processes."""
+        file_paths = []
+        for index in range(file_count):
+            path = tmp_path / f"video_{index}.mp4"
+            path.write_text(f"content {index}")
+            file_paths.append(str(path))
+        file_paths.append(str(tmp_path / "missing.mp4"))
+
+        hashes = self.service.calculate_hashes(file_paths, max_workers=2)
+
+        expected = [self.service.calculate_hash(path) for path in file_paths[:-1]]
+        assert hashes == expected + [None]
@@ -4,10 +4,7 @@ import json
 from datetime import datetime
 
 import pytest
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
 
-from src.database.models import Base
 from src.database.models import Video as VideoEntity
 from src.domain.artifacts import ArtifactEnvelope
 from src.domain.schema_initialization import register_all_schemas
@@ -16,86 +13,49 @@ from src.repositories.artifact_repository import SqlArtifactRepository
 from src.repositories.selection_policy_manager import SelectionPolicyManager
 from src.services.find_within_video_service import FindWithinVideoService
 from src.services.projection_sync_service import ProjectionSyncService
-
-
-@pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-
-    # Create FTS5 tables for SQLite
-    with engine.connect() as conn:
-        # Create transcript FTS5 table
-        conn.execute(
-            text(
-                """
-                CREATE VIRTUAL TABLE transcript_fts USING fts5(
-                    artifact_id UNINDEXED,
-                    asset_id UNINDEXED,
-                    start_ms UNINDEXED,
-                    end_ms UNINDEXED,
-                    text
-                )
-                """
-            )
-        )
-
-        # Create transcript metadata table
-        conn.execute(
-            text(
-                """
-                CREATE TABLE transcript_fts_metadata (
-                    artifact_id TEXT PRIMARY KEY,
-                    asset_id TEXT NOT NULL,
-                    start_ms INTEGER NOT NULL,
-                    end_ms INTEGER NOT NULL
-                )
-                """
-            )
-        )
-
-        # Create OCR FTS5 table
-        conn.execute(
-            text(
-                """
-                CREATE VIRTUAL TABLE ocr_fts USING fts5(
-                    artifact_id UNINDEXED,
-                    asset_id UNINDEXED,
-                    start_ms UNINDEXED,
-                    end_ms UNINDEXED,
-                    text
-                )
-                """
-            )
-        )
-
-        # Create OCR metadata table
-        conn.execute(
-            text(
-                """
-                CREATE TABLE ocr_fts_metadata (
-                    artifact_id TEXT PRIMARY KEY,
-                    asset_id TEXT NOT NULL,
-                    start_ms INTEGER NOT NULL,
-                    end_ms INTEGER NOT NULL
-                )
-                """
-            )
-        )
-
-        conn.commit()
-
-    return engine
-
-
-@pytest.fixture
-def session(engine):
-    """Create database session for testing."""
-    session_factory = sessionmaker(bind=engine)
-    session = session_factory()
-    yield session
-    session.close()
+from tests.db_utils import create_test_engine, execute_script
+
+FTS_DDL = """
+CREATE VIRTUAL TABLE transcript_fts USING fts5(
+    artifact_id UNINDEXED,
+    asset_id UNINDEXED,
+    start_ms UNINDEXED,
+    end_ms UNINDEXED,
+    text
+);
+CREATE TABLE transcript_fts_metadata (
+    artifact_id TEXT PRIMARY KEY,
+    asset_id TEXT NOT NULL,
+    start_ms INTEGER NOT NULL,
+    end_ms INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE ocr_fts USING fts5(
+    artifact_id UNINDEXED,
+    asset_id UNINDEXED,
+    start_ms UNINDEXED,
+    end_ms UNINDEXED,
+    text
+);
+CREATE TABLE ocr_fts_metadata (
+    artifact_id TEXT PRIMARY KEY,
+    asset_id TEXT NOT NULL,
+    start_ms INTEGER NOT NULL,
+    end_ms INTEGER NOT NULL
+);
+"""
+
+
+@pytest.fixture(scope="module")
+def engine(ddl_script):
+    """Create one in-memory engine with the schema and FTS5 tables per module.
+
+    Overrides the shared conftest engine, whose schema has no FTS tables;
+    tests are still isolated by the conftest savepoint session.
+    """
+    engine = create_test_engine()
+    execute_script(engine, ddl_script + FTS_DDL)
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture(scope="session")
@@ -3,32 +3,14 @@
 from datetime import datetime
 
 import pytest
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
 
-from src.database.models import Base, ObjectLabel
+from src.database.models import ObjectLabel
 from src.database.models import Video as VideoEntity
 from src.domain.exceptions import InvalidParameterError, VideoNotFoundError
 from src.services.global_jump_service import GlobalJumpService
 
 
-@pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    return engine
-
-
-@pytest.fixture
-def session(engine):
-    """Create database session for testing."""
-    session_factory = sessionmaker(bind=engine)
-    session = session_factory()
-    yield session
-    session.close()
-
-
 @pytest.fixture
 def global_jump_service(session):
     """Create GlobalJumpService instance."""
@@ -111,6 +111,22 @@ class TestJobProducerMLJobsEnqueueing:
         call_args = producer.pool.enqueue_job.call_args
         assert call_args[0][5] == config
 
+    @pytest.mark.asyncio
+    async def test_enqueue_task_verifies_job_by_member_lookup(self):
+        """Test enqueue verification looks up the job instead of scanning."""
+        producer = JobProducer()
+        producer.pool = AsyncMock()
+
+        await producer.enqueue_task(
+            task_id="task_123",
+            task_type="object_detection",
+            video_id="video_456",
+            video_path="/path/to/video.mp4",
+        )
+
+        producer.pool.zscore.assert_awaited_once_with("ml_jobs", "ml_task_123")
+        producer.pool.zrange.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_enqueue_task_without_pool_raises_error(self):
         """Test enqueueing to ml_jobs without initialized pool raises RuntimeError."""
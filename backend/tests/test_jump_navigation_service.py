@@ -2,13 +2,10 @@
 
 import json
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, Mock, PropertyMock
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from src.database.models import Base
 from src.database.models import Video as VideoEntity
 from src.domain.artifacts import ArtifactEnvelope, SelectionPolicy
 from src.domain.schema_initialization import register_all_schemas
@@ -18,23 +15,6 @@ from src.repositories.selection_policy_manager import SelectionPolicyManager
 from src.services.jump_navigation_service import JumpNavigationService
 
 
-@pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    return engine
-
-
-@pytest.fixture
-def session(engine):
-    """Create database session for testing."""
-    session_factory = sessionmaker(bind=engine)
-    session = session_factory()
-    yield session
-    session.close()
-
-
 @pytest.fixture(scope="session")
 def schema_registry():
     """Create and initialize schema registry once for all tests."""
@@ -565,13 +545,28 @@ def test_filter_artifacts_with_invalid_payload(jump_service, artifact_repo, test
 
     # The filter should handle this gracefully
     artifacts = [artifact1, invalid_artifact]
-    filtered = jump_service._filter_artifacts(artifacts, None, None, 0.0)
+    filtered = list(jump_service._filter_artifacts(artifacts, None, None, 0.0))
 
     # Should only return the valid artifact
     assert len(filtered) == 1
     assert filtered[0].artifact_id == "o1"
 
 
+def test_filter_artifacts_stops_parsing_at_first_match(jump_service, test_video):
+    """Test that taking the first match leaves later payloads unparsed."""
+    artifact1 = create_object_artifact(
+        "o1", test_video.video_id, 0, 100, "dog", frame_number=0
+    )
+    unread = Mock(spec=ArtifactEnvelope)
+    type(unread).payload_json = PropertyMock(
+        side_effect=AssertionError("payload parsed after first match")
+    )
+
+    matches = jump_service._filter_artifacts([artifact1, unread], "dog", None, 0.0)
+
+    assert next(matches).artifact_id == "o1"
+
+
 def test_jump_next_returns_earliest_match(jump_service, artifact_repo, test_video):
     """Test that jump_next returns the earliest matching artifact."""
     # Create multiple artifacts after the from_ms timestamp
@@ -7,6 +7,9 @@ from src.domain.schema_initialization import register_all_schemas
 from src.domain.schema_registry import SchemaRegistry
 from src.domain.schemas import MetadataV1
 
+# Tests here clear the process-wide SchemaRegistry; keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("schema_registry")
+
 
 class TestMetadataV1Schema:
     """Tests for MetadataV1 schema validation."""
@@ -1,5 +1,6 @@
 """Tests for projection sync service."""
 
+from dataclasses import replace
 from datetime import datetime
 from unittest.mock import Mock
 
@@ -11,49 +12,60 @@ from src.services.projection_sync_service import (
     ProjectionSyncService,
 )
 
+# Base for make_artifact; sync_artifact only reads artifacts
+TRANSCRIPT_ARTIFACT = ArtifactEnvelope(
+    artifact_id="artifact_123",
+    asset_id="video_123",
+    artifact_type="transcript.segment",
+    schema_version=1,
+    span_start_ms=0,
+    span_end_ms=5000,
+    payload_json='{"text": "Hello world", "confidence": 0.9, "language": "en"}',
+    producer="whisper",
+    producer_version="large-v3",
+    model_profile="high_quality",
+    config_hash="abc123",
+    input_hash="def456",
+    run_id="run_123",
+    created_at=datetime(2024, 1, 1, 12, 0, 0),
+)
+
+
+def make_artifact(**overrides):
+    """Build an artifact from the shared transcript, overriding any field."""
+    return replace(TRANSCRIPT_ARTIFACT, **overrides)
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock database session with a mock bind."""
+    mock_session = Mock()
+    mock_session.bind = Mock()
+    return mock_session
+
+
+@pytest.fixture
+def service(mock_session):
+    """Create ProjectionSyncService on the mock session."""
+    return ProjectionSyncService(mock_session)
+
 
 class TestProjectionSyncService:
     """Test ProjectionSyncService."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_session = Mock()
-        self.mock_bind = Mock()
-        self.mock_session.bind = self.mock_bind
-
-        self.service = ProjectionSyncService(self.mock_session)
-
-        # Test artifact
-        self.transcript_artifact = ArtifactEnvelope(
-            artifact_id="artifact_123",
-            asset_id="video_123",
-            artifact_type="transcript.segment",
-            schema_version=1,
-            span_start_ms=0,
-            span_end_ms=5000,
-            payload_json='{"text": "Hello world", "confidence": 0.9, "language": "en"}',
-            producer="whisper",
-            producer_version="large-v3",
-            model_profile="high_quality",
-            config_hash="abc123",
-            input_hash="def456",
-            run_id="run_123",
-            created_at=datetime.utcnow(),
-        )
-
-    def test_sync_transcript_artifact_postgresql(self):
+    def test_sync_transcript_artifact_postgresql(self, service, mock_session):
         """Test syncing transcript artifact to PostgreSQL FTS."""
         # Mock PostgreSQL dialect
-        self.mock_bind.dialect.name = "postgresql"
+        mock_session.bind.dialect.name = "postgresql"
 
         # Sync artifact
-        self.service.sync_artifact(self.transcript_artifact)
+        service.sync_artifact(TRANSCRIPT_ARTIFACT)
 
         # Verify SQL was executed (commit happens in batch_create, not here)
-        assert self.mock_session.execute.called
+        assert mock_session.execute.called
 
         # Verify the SQL contains the expected data
-        call_args = self.mock_session.execute.call_args
+        call_args = mock_session.execute.call_args
         params = call_args[0][1]
         assert params["artifact_id"] == "artifact_123"
         assert params["asset_id"] == "video_123"
@@ -61,100 +73,76 @@ class TestProjectionSyncService:
         assert params["end_ms"] == 5000
         assert params["text"] == "Hello world"
 
-    def test_sync_transcript_artifact_sqlite(self):
+    def test_sync_transcript_artifact_sqlite(self, service, mock_session):
         """Test syncing transcript artifact to SQLite FTS5."""
         # Mock SQLite dialect
-        self.mock_bind.dialect.name = "sqlite"
+        mock_session.bind.dialect.name = "sqlite"
 
         # Sync artifact
-        self.service.sync_artifact(self.transcript_artifact)
+        service.sync_artifact(TRANSCRIPT_ARTIFACT)
 
         # Verify SQL was executed twice (metadata + FTS5)
         # Commit happens in batch_create, not here
-        assert self.mock_session.execute.call_count == 2
+        assert mock_session.execute.call_count == 2
 
-    def test_sync_artifact_with_invalid_type(self):
+    def test_sync_artifact_with_invalid_type(self, service, mock_session):
         """Test syncing artifact with unsupported type (should not fail)."""
         # Create artifact with unsupported type
-        artifact = ArtifactEnvelope(
+        artifact = make_artifact(
             artifact_id="artifact_456",
-            asset_id="video_123",
             artifact_type="unsupported.type",
-            schema_version=1,
-            span_start_ms=0,
-            span_end_ms=5000,
             payload_json='{"data": "test"}',
             producer="test",
             producer_version="1.0",
             model_profile="fast",
-            config_hash="abc123",
-            input_hash="def456",
-            run_id="run_123",
-            created_at=datetime.utcnow(),
         )
 
         # Should not raise error (just doesn't sync anything)
-        self.service.sync_artifact(artifact)
+        service.sync_artifact(artifact)
 
         # Verify no SQL was executed
-        assert not self.mock_session.execute.called
+        assert not mock_session.execute.called
 
-    def test_sync_artifact_database_error(self):
+    def test_sync_artifact_database_error(self, service, mock_session):
         """Test handling of database errors during sync."""
         # Mock database error
-        self.mock_bind.dialect.name = "postgresql"
-        self.mock_session.execute.side_effect = Exception("Database error")
+        mock_session.bind.dialect.name = "postgresql"
+        mock_session.execute.side_effect = Exception("Database error")
 
         # Should raise ProjectionSyncError
         with pytest.raises(ProjectionSyncError) as exc_info:
-            self.service.sync_artifact(self.transcript_artifact)
+            service.sync_artifact(TRANSCRIPT_ARTIFACT)
 
         assert "Failed to sync projection" in str(exc_info.value)
         assert "Database error" in str(exc_info.value)
 
-    def test_sync_transcript_with_special_characters(self):
+    def test_sync_transcript_with_special_characters(self, service, mock_session):
         """Test syncing transcript with special characters."""
         # Create artifact with special characters
-        artifact = ArtifactEnvelope(
+        artifact = make_artifact(
             artifact_id="artifact_789",
-            asset_id="video_123",
-            artifact_type="transcript.segment",
-            schema_version=1,
-            span_start_ms=0,
-            span_end_ms=5000,
             payload_json=(
                 '{"text": "Hello \\"world\\" & <test>", '
                 '"confidence": 0.9, "language": "en"}'
             ),
-            producer="whisper",
-            producer_version="large-v3",
-            model_profile="high_quality",
-            config_hash="abc123",
-            input_hash="def456",
-            run_id="run_123",
-            created_at=datetime.utcnow(),
         )
 
-        self.mock_bind.dialect.name = "postgresql"
+        mock_session.bind.dialect.name = "postgresql"
 
         # Should not raise error
-        self.service.sync_artifact(artifact)
+        service.sync_artifact(artifact)
 
         # Verify text was properly extracted
-        call_args = self.mock_session.execute.call_args
+        call_args = mock_session.execute.call_args
         params = call_args[0][1]
         assert params["text"] == 'Hello "world" & <test>'
 
-    def test_sync_scene_artifact(self):
+    def test_sync_scene_artifact(self, service, mock_session):
         """Test syncing scene artifact to scene_ranges projection."""
         # Create scene artifact
-        scene_artifact = ArtifactEnvelope(
+        scene_artifact = make_artifact(
             artifact_id="scene_123",
-            asset_id="video_123",
             artifact_type="scene",
-            schema_version=1,
-            span_start_ms=0,
-            span_end_ms=5000,
             payload_json=(
                 '{"scene_index": 1, "method": "content", '
                 '"score": 0.95, "frame_number": 150}'
@@ -162,20 +150,16 @@ class TestProjectionSyncService:
             producer="pyscenedetect",
             producer_version="0.6.1",
             model_profile="balanced",
-            config_hash="abc123",
-            input_hash="def456",
-            run_id="run_123",
-            created_at=datetime.utcnow(),
         )
 
         # Sync artifact
-        self.service.sync_artifact(scene_artifact)
+        service.sync_artifact(scene_artifact)
 
         # Verify SQL was executed (commit happens in batch_create, not here)
-        assert self.mock_session.execute.called
+        assert mock_session.execute.called
 
         # Verify the SQL contains the expected data
-        call_args = self.mock_session.execute.call_args
+        call_args = mock_session.execute.call_args
         params = call_args[0][1]
         assert params["artifact_id"] == "scene_123"
         assert params["asset_id"] == "video_123"
@@ -183,14 +167,12 @@ class TestProjectionSyncService:
         assert params["start_ms"] == 0
         assert params["end_ms"] == 5000
 
-    def test_sync_object_detection_artifact(self):
+    def test_sync_object_detection_artifact(self, service, mock_session):
         """Test syncing object.detection artifact to object_labels projection."""
         # Create object detection artifact
-        object_artifact = ArtifactEnvelope(
+        object_artifact = make_artifact(
             artifact_id="object_123",
-            asset_id="video_123",
             artifact_type="object.detection",
-            schema_version=1,
             span_start_ms=1000,
             span_end_ms=1001,
             payload_json=(
@@ -201,20 +183,16 @@ class TestProjectionSyncService:
             producer="yolo",
             producer_version="yolov8n.pt",
             model_profile="fast",
-            config_hash="abc123",
-            input_hash="def456",
-            run_id="run_123",
-            created_at=datetime.utcnow(),
         )
 
         # Sync artifact
-        self.service.sync_artifact(object_artifact)
+        service.sync_artifact(object_artifact)
 
         # Verify SQL was executed (commit happens in batch_create, not here)
-        assert self.mock_session.execute.called
+        assert mock_session.execute.called
 
         # Verify the SQL contains the expected data
-        call_args = self.mock_session.execute.call_args
+        call_args = mock_session.execute.call_args
         params = call_args[0][1]
         assert params["artifact_id"] == "object_123"
         assert params["asset_id"] == "video_123"
@@ -223,14 +201,12 @@ class TestProjectionSyncService:
         assert params["start_ms"] == 1000
         assert params["end_ms"] == 1001
 
-    def test_sync_face_detection_artifact(self):
+    def test_sync_face_detection_artifact(self, service, mock_session):
         """Test syncing face.detection artifact to face_clusters projection."""
         # Create face detection artifact
-        face_artifact = ArtifactEnvelope(
+        face_artifact = make_artifact(
             artifact_id="face_123",
-            asset_id="video_123",
             artifact_type="face.detection",
-            schema_version=1,
             span_start_ms=2000,
             span_end_ms=2001,
             payload_json=(
@@ -241,20 +217,16 @@ class TestProjectionSyncService:
             producer="yolo-face",
             producer_version="yolov8n-face.pt",
             model_profile="fast",
-            config_hash="abc123",
-            input_hash="def456",
-            run_id="run_123",
-            created_at=datetime.utcnow(),
         )
 
         # Sync artifact
-        self.service.sync_artifact(face_artifact)
+        service.sync_artifact(face_artifact)
 
         # Verify SQL was executed (commit happens in batch_create, not here)
-        assert self.mock_session.execute.called
+        assert mock_session.execute.called
 
         # Verify the SQL contains the expected data
-        call_args = self.mock_session.execute.call_args
+        call_args = mock_session.execute.call_args
         params = call_args[0][1]
         assert params["artifact_id"] == "face_123"
         assert params["asset_id"] == "video_123"
@@ -263,14 +235,12 @@ class TestProjectionSyncService:
         assert params["start_ms"] == 2000
         assert params["end_ms"] == 2001
 
-    def test_sync_ocr_text_artifact_postgresql(self):
+    def test_sync_ocr_text_artifact_postgresql(self, service, mock_session):
         """Test syncing ocr.text artifact to PostgreSQL FTS."""
         # Create OCR text artifact
-        ocr_artifact = ArtifactEnvelope(
+        ocr_artifact = make_artifact(
             artifact_id="ocr_123",
-            asset_id="video_123",
             artifact_type="ocr.text",
-            schema_version=1,
             span_start_ms=3000,
             span_end_ms=3001,
             payload_json=(
@@ -282,23 +252,19 @@ class TestProjectionSyncService:
             producer="easyocr",
             producer_version="easyocr_en",
             model_profile="balanced",
-            config_hash="abc123",
-            input_hash="def456",
-            run_id="run_123",
-            created_at=datetime.utcnow(),
         )
 
         # Mock PostgreSQL dialect
-        self.mock_bind.dialect.name = "postgresql"
+        mock_session.bind.dialect.name = "postgresql"
 
         # Sync artifact
-        self.service.sync_artifact(ocr_artifact)
+        service.sync_artifact(ocr_artifact)
 
         # Verify SQL was executed (commit happens in batch_create, not here)
-        assert self.mock_session.execute.called
+        assert mock_session.execute.called
 
         # Verify the SQL contains the expected data
-        call_args = self.mock_session.execute.call_args
+        call_args = mock_session.execute.call_args
         params = call_args[0][1]
         assert params["artifact_id"] == "ocr_123"
         assert params["asset_id"] == "video_123"
@@ -306,14 +272,12 @@ class TestProjectionSyncService:
         assert params["end_ms"] == 3001
         assert params["text"] == "Welcome to the presentation"
 
-    def test_sync_ocr_text_artifact_sqlite(self):
+    def test_sync_ocr_text_artifact_sqlite(self, service, mock_session):
         """Test syncing ocr.text artifact to SQLite FTS5."""
         # Create OCR text artifact
-        ocr_artifact = ArtifactEnvelope(
+        ocr_artifact = make_artifact(
             artifact_id="ocr_456",
-            asset_id="video_123",
             artifact_type="ocr.text",
-            schema_version=1,
             span_start_ms=4000,
             span_end_ms=4001,
             payload_json=(
@@ -325,31 +289,24 @@ class TestProjectionSyncService:
             producer="easyocr",
             producer_version="easyocr_en",
             model_profile="balanced",
-            config_hash="abc123",
-            input_hash="def456",
-            run_id="run_123",
-            created_at=datetime.utcnow(),
         )
 
         # Mock SQLite dialect
-        self.mock_bind.dialect.name = "sqlite"
+        mock_session.bind.dialect.name = "sqlite"
 
         # Sync artifact
-        self.service.sync_artifact(ocr_artifact)
+        service.sync_artifact(ocr_artifact)
 
         # Verify SQL was executed twice (metadata + FTS5)
         # Commit happens in batch_create, not here
-        assert self.mock_session.execute.call_count == 2
+        assert mock_session.execute.call_count == 2
 
-    def test_sync_video_metadata_with_gps_postgresql(self):
+    def test_sync_video_metadata_with_gps_postgresql(self, service, mock_session):
         """Test syncing video.metadata artifact with GPS to PostgreSQL."""
         # Create metadata artifact with GPS coordinates
-        metadata_artifact = ArtifactEnvelope(
+        metadata_artifact = make_artifact(
             artifact_id="metadata_001",
-            asset_id="video_123",
             artifact_type="video.metadata",
-            schema_version=1,
-            span_start_ms=0,
             span_end_ms=120000,
             payload_json=(
                 '{"latitude": 40.7128, "longitude": -74.0060, "altitude": 10.5, '
@@ -360,23 +317,19 @@ class TestProjectionSyncService:
             producer="pyexiftool",
             producer_version="0.5.5",
             model_profile="balanced",
-            config_hash="abc123",
-            input_hash="def456",
-            run_id="run_123",
-            created_at=datetime.utcnow(),
         )
 
         # Mock PostgreSQL dialect
-        self.mock_bind.dialect.name = "postgresql"
+        mock_session.bind.dialect.name = "postgresql"
 
         # Sync artifact
-        self.service.sync_artifact(metadata_artifact)
+        service.sync_artifact(metadata_artifact)
 
         # Verify SQL was executed
-        assert self.mock_session.execute.called
+        assert mock_session.execute.called
 
         # Verify the SQL contains the expected GPS data
-        call_args = self.mock_session.execute.call_args
+        call_args = mock_session.execute.call_args
         params = call_args[0][1]
         assert params["artifact_id"] == "metadata_001"
         assert params["video_id"] == "video_123"
@@ -384,15 +337,13 @@ class TestProjectionSyncService:
         assert params["longitude"] == -74.0060
         assert params["altitude"] == 10.5
 
-    def test_sync_video_metadata_with_gps_sqlite(self):
+    def test_sync_video_metadata_with_gps_sqlite(self, service, mock_session):
         """Test syncing video.metadata artifact with GPS to SQLite."""
         # Create metadata artifact with GPS coordinates
-        metadata_artifact = ArtifactEnvelope(
+        metadata_artifact = make_artifact(
             artifact_id="metadata_002",
             asset_id="video_456",
             artifact_type="video.metadata",
-            schema_version=1,
-            span_start_ms=0,
             span_end_ms=90000,
             payload_json=(
                 '{"latitude": 51.5074, "longitude": -0.1278, "altitude": 5.0, '
@@ -401,37 +352,32 @@ class TestProjectionSyncService:
             producer="pyexiftool",
             producer_version="0.5.5",
             model_profile="balanced",
-            config_hash="abc123",
-            input_hash="def456",
             run_id="run_456",
-            created_at=datetime.utcnow(),
         )
 
         # Mock SQLite dialect
-        self.mock_bind.dialect.name = "sqlite"
+        mock_session.bind.dialect.name = "sqlite"
 
         # Sync artifact
-        self.service.sync_artifact(metadata_artifact)
+        service.sync_artifact(metadata_artifact)
 
         # Verify SQL was executed
-        assert self.mock_session.execute.called
+        assert mock_session.execute.called
 
         # Verify the SQL contains the expected GPS data
-        call_args = self.mock_session.execute.call_args
+        call_args = mock_session.execute.call_args
         params = call_args[0][1]
         assert params["latitude"] == 51.5074
         assert params["longitude"] == -0.1278
         assert params["altitude"] == 5.0
 
-    def test_sync_video_metadata_without_gps(self):
+    def test_sync_video_metadata_without_gps(self, service, mock_session):
         """Test syncing video.metadata artifact without GPS coordinates."""
         # Create metadata artifact without GPS
-        metadata_artifact = ArtifactEnvelope(
+        metadata_artifact = make_artifact(
             artifact_id="metadata_003",
             asset_id="video_789",
             artifact_type="video.metadata",
-            schema_version=1,
-            span_start_ms=0,
             span_end_ms=60000,
             payload_json=(
                 '{"duration_seconds": 60.0, "file_size": 40000000, '
@@ -440,30 +386,25 @@ class TestProjectionSyncService:
             producer="pyexiftool",
             producer_version="0.5.5",
             model_profile="balanced",
-            config_hash="abc123",
-            input_hash="def456",
             run_id="run_789",
-            created_at=datetime.utcnow(),
         )
 
         # Mock PostgreSQL dialect
-        self.mock_bind.dialect.name = "postgresql"
+        mock_session.bind.dialect.name = "postgresql"
 
         # Sync artifact
-        self.service.sync_artifact(metadata_artifact)
+        service.sync_artifact(metadata_artifact)
 
         # Verify SQL was NOT executed (no GPS coordinates)
-        assert not self.mock_session.execute.called
+        assert not mock_session.execute.called
 
-    def test_sync_video_metadata_invalid_latitude(self):
+    def test_sync_video_metadata_invalid_latitude(self, service, mock_session):
         """Test error handling for invalid latitude."""
         # Create metadata artifact with invalid latitude
-        metadata_artifact = ArtifactEnvelope(
+        metadata_artifact = make_artifact(
             artifact_id="metadata_004",
             asset_id="video_999",
             artifact_type="video.metadata",
-            schema_version=1,
-            span_start_ms=0,
             span_end_ms=60000,
             payload_json=(
                 '{"latitude": 95.0, "longitude": -74.0060, "altitude": 10.5}'
@@ -471,28 +412,23 @@ class TestProjectionSyncService:
             producer="pyexiftool",
             producer_version="0.5.5",
             model_profile="balanced",
-            config_hash="abc123",
-            input_hash="def456",
             run_id="run_999",
-            created_at=datetime.utcnow(),
         )
 
         # Mock PostgreSQL dialect
-        self.mock_bind.dialect.name = "postgresql"
+        mock_session.bind.dialect.name = "postgresql"
 
         # Should raise ProjectionSyncError
         with pytest.raises(ProjectionSyncError, match="Invalid latitude"):
-            self.service.sync_artifact(metadata_artifact)
+            service.sync_artifact(metadata_artifact)
 
-    def test_sync_video_metadata_invalid_longitude(self):
+    def test_sync_video_metadata_invalid_longitude(self, service, mock_session):
         """Test error handling for invalid longitude."""
         # Create metadata artifact with invalid longitude
-        metadata_artifact = ArtifactEnvelope(
+        metadata_artifact = make_artifact(
             artifact_id="metadata_005",
             asset_id="video_888",
             artifact_type="video.metadata",
-            schema_version=1,
-            span_start_ms=0,
             span_end_ms=60000,
             payload_json=(
                 '{"latitude": 40.7128, "longitude": 200.0, "altitude": 10.5}'
@@ -500,44 +436,36 @@ class TestProjectionSyncService:
             producer="pyexiftool",
             producer_version="0.5.5",
             model_profile="balanced",
-            config_hash="abc123",
-            input_hash="def456",
             run_id="run_888",
-            created_at=datetime.utcnow(),
         )
 
         # Mock PostgreSQL dialect
-        self.mock_bind.dialect.name = "postgresql"
+        mock_session.bind.dialect.name = "postgresql"
 
         # Should raise ProjectionSyncError
         with pytest.raises(ProjectionSyncError, match="Invalid longitude"):
-            self.service.sync_artifact(metadata_artifact)
+            service.sync_artifact(metadata_artifact)
 
-    def test_sync_video_metadata_partial_gps(self):
+    def test_sync_video_metadata_partial_gps(self, service, mock_session):
         """Test that partial GPS coordinates (only latitude) are skipped."""
         # Create metadata artifact with only latitude
-        metadata_artifact = ArtifactEnvelope(
+        metadata_artifact = make_artifact(
             artifact_id="metadata_006",
             asset_id="video_777",
             artifact_type="video.metadata",
-            schema_version=1,
-            span_start_ms=0,
             span_end_ms=60000,
             payload_json='{"latitude": 40.7128, "duration_seconds": 60.0}',
             producer="pyexiftool",
             producer_version="0.5.5",
             model_profile="balanced",
-            config_hash="abc123",
-            input_hash="def456",
             run_id="run_777",
-            created_at=datetime.utcnow(),
         )
 
         # Mock PostgreSQL dialect
-        self.mock_bind.dialect.name = "postgresql"
+        mock_session.bind.dialect.name = "postgresql"
 
         # Sync artifact
-        self.service.sync_artifact(metadata_artifact)
+        service.sync_artifact(metadata_artifact)
 
         # Verify SQL was NOT executed (incomplete GPS)
-        assert not self.mock_session.execute.called
+        assert not mock_session.execute.called
@@ -1,12 +1,40 @@
 """Unit tests for Reconciler."""
 
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, create_autospec, patch
 
 import pytest
 
 from src.domain.models import Task
-from src.workers.reconciler import LONG_RUNNING_THRESHOLD, Reconciler
+from src.repositories.task_repository import SQLAlchemyTaskRepository
+from src.services.job_producer import JobProducer
+from src.workers.reconciler import COUNTS_KEY, LONG_RUNNING_THRESHOLD, Reconciler
+
+
+def make_task(**overrides):
+    """Build a pending object detection task for video-1, overriding any field."""
+    fields = {
+        "task_id": "task-1",
+        "video_id": "video-1",
+        "task_type": "object_detection",
+        "status": "pending",
+    }
+    fields.update(overrides)
+    return Task(**fields)
+
+
+@pytest.fixture
+def redis_class(monkeypatch):
+    """Replace redis.Redis with a mock for the duration of a test.
+
+    The reconciler imports redis lazily, so patching the class on the module
+    covers every client it constructs.
+    """
+    import redis
+
+    mock_redis_class = MagicMock()
+    monkeypatch.setattr(redis, "Redis", mock_redis_class)
+    return mock_redis_class
 
 
 class TestReconcilerInitialization:
@@ -38,26 +66,20 @@ class TestSyncPendingTasks:
         reconciler = Reconciler(session=mock_session)
 
         # Create mock tasks
-        task1 = Task(
-            task_id="task-1",
-            video_id="video-1",
-            task_type="object_detection",
-            status="pending",
-        )
-        task2 = Task(
+        task1 = make_task()
+        task2 = make_task(
             task_id="task-2",
             video_id="video-2",
             task_type="face_detection",
-            status="pending",
         )
 
         # Mock task repository
-        mock_task_repo = MagicMock()
+        mock_task_repo = create_autospec(SQLAlchemyTaskRepository, instance=True)
         mock_task_repo.find_by_status.return_value = [task1, task2]
         reconciler.task_repo = mock_task_repo
 
         # Mock job producer
-        mock_job_producer = AsyncMock()
+        mock_job_producer = AsyncMock(spec=JobProducer)
         reconciler.job_producer = mock_job_producer
 
         # Mock job existence check
@@ -77,20 +99,15 @@ class TestSyncPendingTasks:
         reconciler = Reconciler(session=mock_session)
 
         # Create mock tasks
-        task1 = Task(
-            task_id="task-1",
-            video_id="video-1",
-            task_type="object_detection",
-            status="pending",
-        )
+        task1 = make_task()
 
         # Mock task repository
-        mock_task_repo = MagicMock()
+        mock_task_repo = create_autospec(SQLAlchemyTaskRepository, instance=True)
         mock_task_repo.find_by_status.return_value = [task1]
         reconciler.task_repo = mock_task_repo
 
         # Mock job producer
-        mock_job_producer = AsyncMock()
+        mock_job_producer = AsyncMock(spec=JobProducer)
         reconciler.job_producer = mock_job_producer
 
         # Mock job existence check - job doesn't exist
@@ -103,6 +120,30 @@ class TestSyncPendingTasks:
             assert stats["reenqueued"] == 1
             mock_job_producer.enqueue_task.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_sync_pending_tasks_reenqueues_critical_path_first(self):
+        """Test tasks other tasks wait on are re-enqueued before their dependents."""
+        reconciler = Reconciler(session=MagicMock())
+
+        # Same stored priority, as for rows saved before priorities were set
+        thumbnail_task = make_task(task_type="thumbnail.extraction", priority=1)
+        detection_task = make_task(task_id="task-2", priority=1)
+
+        mock_task_repo = create_autospec(SQLAlchemyTaskRepository, instance=True)
+        mock_task_repo.find_by_status.return_value = [thumbnail_task, detection_task]
+        reconciler.task_repo = mock_task_repo
+        mock_job_producer = AsyncMock(spec=JobProducer)
+        reconciler.job_producer = mock_job_producer
+
+        with patch.object(reconciler, "_check_job_exists", return_value=False):
+            await reconciler._sync_pending_tasks()
+
+        enqueued = [
+            call.kwargs["task_type"]
+            for call in mock_job_producer.enqueue_task.await_args_list
+        ]
+        assert enqueued == ["object_detection", "thumbnail.extraction"]
+
     @pytest.mark.asyncio
     async def test_sync_pending_tasks_error_handling(self):
         """Test error handling in PENDING task sync."""
@@ -110,20 +151,15 @@ class TestSyncPendingTasks:
         reconciler = Reconciler(session=mock_session)
 
         # Create mock task
-        task1 = Task(
-            task_id="task-1",
-            video_id="video-1",
-            task_type="object_detection",
-            status="pending",
-        )
+        task1 = make_task()
 
         # Mock task repository
-        mock_task_repo = MagicMock()
+        mock_task_repo = create_autospec(SQLAlchemyTaskRepository, instance=True)
         mock_task_repo.find_by_status.return_value = [task1]
         reconciler.task_repo = mock_task_repo
 
         # Mock job producer
-        mock_job_producer = AsyncMock()
+        mock_job_producer = AsyncMock(spec=JobProducer)
         reconciler.job_producer = mock_job_producer
 
         # Mock job existence check to raise error
@@ -136,6 +172,34 @@ class TestSyncPendingTasks:
             assert stats["checked"] == 1
             assert stats["reenqueued"] == 0
 
+    @pytest.mark.asyncio
+    async def test_reconciler_bumps_counts(self):
+        """Test re-enqueueing a PENDING task bumps the Redis counts hash."""
+        mock_session = MagicMock()
+        reconciler = Reconciler(session=mock_session)
+
+        task1 = make_task()
+
+        mock_task_repo = create_autospec(SQLAlchemyTaskRepository, instance=True)
+        mock_task_repo.find_by_status.return_value = [task1]
+        reconciler.task_repo = mock_task_repo
+        reconciler.job_producer = AsyncMock(spec=JobProducer)
+
+        # Mock shared Redis client
+        mock_redis = MagicMock()
+        mock_pipeline = mock_redis.pipeline.return_value
+        reconciler._redis = mock_redis
+
+        with patch.object(reconciler, "_check_job_exists") as mock_check:
+            mock_check.return_value = False
+
+            await reconciler._sync_pending_tasks()
+
+            mock_pipeline.hincrby.assert_called_once_with(
+                "reconciler:counts", "pending_reenqueued", 1
+            )
+            mock_pipeline.execute.assert_called_once()
+
 
 class TestSyncRunningTasks:
     """Test RUNNING task synchronization."""
@@ -147,21 +211,18 @@ class TestSyncRunningTasks:
         reconciler = Reconciler(session=mock_session)
 
         # Create mock task
-        task1 = Task(
-            task_id="task-1",
-            video_id="video-1",
-            task_type="object_detection",
+        task1 = make_task(
             status="running",
             started_at=datetime.utcnow(),
         )
 
         # Mock task repository
-        mock_task_repo = MagicMock()
+        mock_task_repo = create_autospec(SQLAlchemyTaskRepository, instance=True)
         mock_task_repo.find_by_status.return_value = [task1]
         reconciler.task_repo = mock_task_repo
 
         # Mock job producer
-        mock_job_producer = AsyncMock()
+        mock_job_producer = AsyncMock(spec=JobProducer)
         reconciler.job_producer = mock_job_producer
 
         # Mock job existence check - job doesn't exist
@@ -184,21 +245,18 @@ class TestSyncRunningTasks:
         reconciler = Reconciler(session=mock_session)
 
         # Create mock task
-        task1 = Task(
-            task_id="task-1",
-            video_id="video-1",
-            task_type="object_detection",
+        task1 = make_task(
             status="running",
             started_at=datetime.utcnow(),
         )
 
         # Mock task repository
-        mock_task_repo = MagicMock()
+        mock_task_repo = create_autospec(SQLAlchemyTaskRepository, instance=True)
         mock_task_repo.find_by_status.return_value = [task1]
         reconciler.task_repo = mock_task_repo
 
         # Mock job producer
-        mock_job_producer = AsyncMock()
+        mock_job_producer = AsyncMock(spec=JobProducer)
         reconciler.job_producer = mock_job_producer
 
         # Mock job checks
@@ -224,21 +282,18 @@ class TestSyncRunningTasks:
         reconciler = Reconciler(session=mock_session)
 
         # Create mock task
-        task1 = Task(
-            task_id="task-1",
-            video_id="video-1",
-            task_type="object_detection",
+        task1 = make_task(
             status="running",
             started_at=datetime.utcnow(),
         )
 
         # Mock task repository
-        mock_task_repo = MagicMock()
+        mock_task_repo = create_autospec(SQLAlchemyTaskRepository, instance=True)
         mock_task_repo.find_by_status.return_value = [task1]
         reconciler.task_repo = mock_task_repo
 
         # Mock job producer
-        mock_job_producer = AsyncMock()
+        mock_job_producer = AsyncMock(spec=JobProducer)
         reconciler.job_producer = mock_job_producer
 
         # Mock job checks
@@ -268,16 +323,13 @@ class TestAlertLongRunningTasks:
         reconciler = Reconciler(session=mock_session)
 
         # Create mock task that's not long-running
-        task1 = Task(
-            task_id="task-1",
-            video_id="video-1",
-            task_type="object_detection",
+        task1 = make_task(
             status="running",
             started_at=datetime.utcnow() - timedelta(seconds=60),
         )
 
         # Mock task repository
-        mock_task_repo = MagicMock()
+        mock_task_repo = create_autospec(SQLAlchemyTaskRepository, instance=True)
         mock_task_repo.find_by_status.return_value = [task1]
         reconciler.task_repo = mock_task_repo
 
@@ -292,17 +344,14 @@ class TestAlertLongRunningTasks:
         reconciler = Reconciler(session=mock_session)
 
         # Create mock task that's long-running
-        task1 = Task(
-            task_id="task-1",
-            video_id="video-1",
-            task_type="object_detection",
+        task1 = make_task(
             status="running",
             started_at=datetime.utcnow()
             - timedelta(seconds=LONG_RUNNING_THRESHOLD + 100),
         )
 
         # Mock task repository
-        mock_task_repo = MagicMock()
+        mock_task_repo = create_autospec(SQLAlchemyTaskRepository, instance=True)
         mock_task_repo.find_by_status.return_value = [task1]
         reconciler.task_repo = mock_task_repo
 
@@ -317,16 +366,13 @@ class TestAlertLongRunningTasks:
         reconciler = Reconciler(session=mock_session)
 
         # Create mock task with no start time
-        task1 = Task(
-            task_id="task-1",
-            video_id="video-1",
-            task_type="object_detection",
+        task1 = make_task(
             status="running",
             started_at=None,
         )
 
         # Mock task repository
-        mock_task_repo = MagicMock()
+        mock_task_repo = create_autospec(SQLAlchemyTaskRepository, instance=True)
         mock_task_repo.find_by_status.return_value = [task1]
         reconciler.task_repo = mock_task_repo
 
@@ -345,23 +391,22 @@ class TestReconcilerRun:
         reconciler = Reconciler(session=mock_session)
 
         # Mock job producer
-        mock_job_producer = AsyncMock()
+        mock_job_producer = AsyncMock(spec=JobProducer)
         reconciler.job_producer = mock_job_producer
 
         # Mock sync methods
-        with patch.object(
-            reconciler, "_sync_pending_tasks"
-        ) as mock_pending, patch.object(
-            reconciler, "_sync_running_tasks"
-        ) as mock_running, patch.object(
-            reconciler, "_alert_long_running_tasks"
-        ) as mock_alert, patch(
-            "src.workers.reconciler.JobProducer"
-        ) as mock_producer_class:
-            mock_producer_class.return_value = mock_job_producer
-            mock_pending.return_value = {"checked": 5, "reenqueued": 1}
-            mock_running.return_value = {"checked": 3, "synced": 1}
-            mock_alert.return_value = {"alerted": 0}
+        with (
+            patch.multiple(
+                reconciler,
+                _sync_pending_tasks=DEFAULT,
+                _sync_running_tasks=DEFAULT,
+                _alert_long_running_tasks=DEFAULT,
+            ) as mocks,
+            patch("src.workers.reconciler.JobProducer", return_value=mock_job_producer),
+        ):
+            mocks["_sync_pending_tasks"].return_value = {"checked": 5, "reenqueued": 1}
+            mocks["_sync_running_tasks"].return_value = {"checked": 3, "synced": 1}
+            mocks["_alert_long_running_tasks"].return_value = {"alerted": 0}
 
             stats = await reconciler.run()
 
@@ -379,23 +424,22 @@ class TestReconcilerRun:
         reconciler = Reconciler(session=mock_session)
 
         # Mock job producer
-        mock_job_producer = AsyncMock()
+        mock_job_producer = AsyncMock(spec=JobProducer)
         reconciler.job_producer = mock_job_producer
 
         # Mock sync methods with errors
-        with patch.object(
-            reconciler, "_sync_pending_tasks"
-        ) as mock_pending, patch.object(
-            reconciler, "_sync_running_tasks"
-        ) as mock_running, patch.object(
-            reconciler, "_alert_long_running_tasks"
-        ) as mock_alert, patch(
-            "src.workers.reconciler.JobProducer"
-        ) as mock_producer_class:
-            mock_producer_class.return_value = mock_job_producer
-            mock_pending.side_effect = Exception("Pending sync error")
-            mock_running.return_value = {"checked": 3, "synced": 1}
-            mock_alert.return_value = {"alerted": 0}
+        with (
+            patch.multiple(
+                reconciler,
+                _sync_pending_tasks=DEFAULT,
+                _sync_running_tasks=DEFAULT,
+                _alert_long_running_tasks=DEFAULT,
+            ) as mocks,
+            patch("src.workers.reconciler.JobProducer", return_value=mock_job_producer),
+        ):
+            mocks["_sync_pending_tasks"].side_effect = Exception("Pending sync error")
+            mocks["_sync_running_tasks"].return_value = {"checked": 3, "synced": 1}
+            mocks["_alert_long_running_tasks"].return_value = {"alerted": 0}
 
             stats = await reconciler.run()
 
@@ -403,97 +447,119 @@ class TestReconcilerRun:
             assert "Pending sync error" in stats["errors"][0]
 
 
+class TestReconcilerCounts:
+    """Test reconciler count bookkeeping."""
+
+    def test_get_counts(self):
+        """Test reading counts with a single HGETALL."""
+        reconciler = Reconciler(session=MagicMock())
+        mock_redis = MagicMock()
+        mock_redis.hgetall.return_value = {"pending_reenqueued": "3"}
+        reconciler._redis = mock_redis
+
+        counts = reconciler.get_counts()
+
+        assert counts == {"pending_reenqueued": 3}
+        mock_redis.hgetall.assert_called_once_with(COUNTS_KEY)
+
+    def test_get_counts_error(self):
+        """Test reading counts when Redis error occurs."""
+        reconciler = Reconciler(session=MagicMock())
+        mock_redis = MagicMock()
+        mock_redis.hgetall.side_effect = Exception("Redis connection error")
+        reconciler._redis = mock_redis
+
+        assert reconciler.get_counts() == {}
+
+    def test_bump_error_is_swallowed(self):
+        """Test bookkeeping errors never interrupt reconciliation."""
+        reconciler = Reconciler(session=MagicMock())
+        mock_redis = MagicMock()
+        mock_redis.pipeline.side_effect = Exception("Redis connection error")
+        reconciler._redis = mock_redis
+
+        reconciler._bump("pending_reenqueued")
+
+        mock_redis.pipeline.assert_called_once()
+
+
 class TestCheckJobExists:
     """Test job existence check."""
 
     @pytest.mark.asyncio
-    async def test_check_job_exists_found(self):
+    async def test_check_job_exists_found(self, redis_class):
         """Test checking when job exists in Redis."""
         mock_session = MagicMock()
         reconciler = Reconciler(session=mock_session)
 
-        with patch("redis.Redis") as mock_redis_class:
-            mock_redis = MagicMock()
-            mock_redis_class.return_value = mock_redis
-            mock_redis.get.return_value = '{"status": "in_progress"}'
+        redis_class.return_value.get.return_value = '{"status": "in_progress"}'
 
-            result = await reconciler._check_job_exists("task-1")
+        result = await reconciler._check_job_exists("task-1")
 
-            assert result is True
+        assert result is True
 
     @pytest.mark.asyncio
-    async def test_check_job_exists_not_found(self):
+    async def test_check_job_exists_not_found(self, redis_class):
         """Test checking when job doesn't exist in Redis."""
         mock_session = MagicMock()
         reconciler = Reconciler(session=mock_session)
 
-        with patch("redis.Redis") as mock_redis_class:
-            mock_redis = MagicMock()
-            mock_redis_class.return_value = mock_redis
-            mock_redis.get.return_value = None
+        redis_class.return_value.get.return_value = None
 
-            result = await reconciler._check_job_exists("task-1")
+        result = await reconciler._check_job_exists("task-1")
 
-            assert result is False
+        assert result is False
 
     @pytest.mark.asyncio
-    async def test_check_job_exists_error(self):
+    async def test_check_job_exists_error(self, redis_class):
         """Test checking when Redis error occurs."""
         mock_session = MagicMock()
         reconciler = Reconciler(session=mock_session)
 
-        with patch("redis.Redis") as mock_redis_class:
-            mock_redis_class.side_effect = Exception("Redis connection error")
+        redis_class.side_effect = Exception("Redis connection error")
 
-            result = await reconciler._check_job_exists("task-1")
+        result = await reconciler._check_job_exists("task-1")
 
-            # Should return True on error to avoid re-enqueueing
-            assert result is True
+        # Should return True on error to avoid re-enqueueing
+        assert result is True
 
 
 class TestGetJobStatus:
     """Test job status retrieval."""
 
     @pytest.mark.asyncio
-    async def test_get_job_status_found(self):
+    async def test_get_job_status_found(self, redis_class):
         """Test getting job status when job exists."""
         mock_session = MagicMock()
         reconciler = Reconciler(session=mock_session)
 
-        with patch("redis.Redis") as mock_redis_class:
-            mock_redis = MagicMock()
-            mock_redis_class.return_value = mock_redis
-            mock_redis.get.return_value = '{"status": "complete"}'
+        redis_class.return_value.get.return_value = '{"status": "complete"}'
 
-            result = await reconciler._get_job_status("task-1")
+        result = await reconciler._get_job_status("task-1")
 
-            # Currently returns None (simplified implementation)
-            assert result is None
+        # Currently returns None (simplified implementation)
+        assert result is None
 
     @pytest.mark.asyncio
-    async def test_get_job_status_not_found(self):
+    async def test_get_job_status_not_found(self, redis_class):
         """Test getting job status when job doesn't exist."""
         mock_session = MagicMock()
         reconciler = Reconciler(session=mock_session)
 
-        with patch("redis.Redis") as mock_redis_class:
-            mock_redis = MagicMock()
-            mock_redis_class.return_value = mock_redis
-            mock_redis.get.return_value = None
+        redis_class.return_value.get.return_value = None
 
-            result = await reconciler._get_job_status("task-1")
+        result = await reconciler._get_job_status("task-1")
 
-            assert result is None
+        assert result is None
 
     @pytest.mark.asyncio
-    async def test_get_job_status_error(self):
+    async def test_get_job_status_error(self, redis_class):
         """Test getting job status when Redis error occurs."""
         mock_session = MagicMock()
         reconciler = Reconciler(session=mock_session)
 
-        with patch("redis.Redis") as mock_redis_class:
-            mock_redis_class.side_effect = Exception("Redis connection error")
+        redis_class.side_effect = Exception("Redis connection error")
 
-            result = await reconciler._get_job_status("task-1")
+        result = await reconciler._get_job_status("task-1")
 
-            assert result is None
+        assert result is None
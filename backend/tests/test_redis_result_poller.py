@@ -18,6 +18,19 @@ def poller():
     return RedisResultPoller(redis_url="redis://localhost:6379")
 
 
+@pytest.fixture
+def redis_client():
+    """Create a mock async Redis client."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def connected_poller(poller, redis_client):
+    """Create a poller already connected to the mock Redis client."""
+    poller.redis_client = redis_client
+    return poller
+
+
 class TestRedisResultPollerConnection:
     """Tests for Redis connection management."""
 
@@ -26,24 +39,20 @@ class TestRedisResultPollerConnection:
         """Test that connect() establishes Redis connection."""
         mock_client = AsyncMock()
 
-        async def mock_from_url(url):
-            return mock_client
-
         with patch(
-            "src.workers.redis_result_poller.redis.from_url", side_effect=mock_from_url
+            "src.workers.redis_result_poller.redis.from_url",
+            new=AsyncMock(return_value=mock_client),
         ):
             await poller.connect()
 
             assert poller.redis_client is not None
 
     @pytest.mark.asyncio
-    async def test_close_closes_connection(self, poller):
+    async def test_close_closes_connection(self, connected_poller, redis_client):
         """Test that close() closes Redis connection."""
-        poller.redis_client = AsyncMock()
+        await connected_poller.close()
 
-        await poller.close()
-
-        poller.redis_client.close.assert_called_once()
+        redis_client.close.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_close_handles_none_client(self, poller):
@@ -57,9 +66,21 @@ class TestRedisResultPollerConnection:
 class TestRedisResultPolling:
     """Tests for result polling functionality."""
 
+    @pytest.mark.parametrize(
+        "misses,expected_delays",
+        [
+            pytest.param([], [], id="immediate"),
+            pytest.param([None, None], [0.01, 0.02], id="retries"),
+            pytest.param(
+                [Exception("Redis error"), None], [0.01, 0.02], id="redis_error"
+            ),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_poll_for_result_immediate_success(self, poller):
-        """Test polling when result is immediately available."""
+    async def test_poll_for_result_eventual_success(
+        self, connected_poller, redis_client, misses, expected_delays
+    ):
+        """Test polling returns the result after any misses or Redis errors."""
         result_data = {
             "config_hash": "abc123",
             "input_hash": "xyz789",
@@ -69,66 +90,49 @@ class TestRedisResultPolling:
             "detections": [],
         }
 
-        poller.redis_client = AsyncMock()
-        poller.redis_client.get.return_value = json.dumps(result_data).encode()
-
-        result = await poller.poll_for_result(task_id="task_001")
-
-        assert result == result_data
-        poller.redis_client.get.assert_called_once_with("ml_result:task_001")
-
-    @pytest.mark.asyncio
-    async def test_poll_for_result_with_retries(self, poller):
-        """Test polling with multiple retries before success."""
-        result_data = {
-            "config_hash": "abc123",
-            "input_hash": "xyz789",
-            "run_id": "run_001",
-            "producer": "yolo",
-            "producer_version": "8.0.0",
-            "detections": [],
-        }
-
-        poller.redis_client = AsyncMock()
-        # First two calls return None, third returns result
-        poller.redis_client.get.side_effect = [
-            None,
-            None,
-            json.dumps(result_data).encode(),
-        ]
+        redis_client.get.side_effect = [*misses, json.dumps(result_data).encode()]
 
-        result = await poller.poll_for_result(
-            task_id="task_001",
-            initial_delay=0.01,
-            max_delay=0.1,
-            timeout=10.0,
-        )
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await connected_poller.poll_for_result(
+                task_id="task_001",
+                initial_delay=0.01,
+                max_delay=0.1,
+                timeout=10.0,
+            )
 
         assert result == result_data
-        assert poller.redis_client.get.call_count == 3
+        assert redis_client.get.call_count == len(misses) + 1
+        redis_client.get.assert_called_with("ml_result:task_001")
+        sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
+        assert sleep_calls == expected_delays
 
     @pytest.mark.asyncio
-    async def test_poll_for_result_timeout(self, poller):
+    async def test_poll_for_result_timeout(self, connected_poller, redis_client):
         """Test polling timeout when result never arrives."""
-        poller.redis_client = AsyncMock()
-        poller.redis_client.get.return_value = None
+        redis_client.get.return_value = None
 
-        with pytest.raises(TimeoutError, match="polling timeout exceeded"):
-            await poller.poll_for_result(
+        with (
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            pytest.raises(TimeoutError, match="polling timeout exceeded"),
+        ):
+            await connected_poller.poll_for_result(
                 task_id="task_001",
-                initial_delay=0.01,
-                max_delay=0.02,
-                timeout=0.05,
+                initial_delay=1.0,
+                max_delay=2.0,
+                timeout=5.0,
             )
 
+        # Gives up once the slept time reaches the timeout: 1.0 + 2.0 + 2.0
+        sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
+        assert sleep_calls == [1.0, 2.0, 2.0]
+
     @pytest.mark.asyncio
-    async def test_poll_for_result_invalid_json(self, poller):
+    async def test_poll_for_result_invalid_json(self, connected_poller, redis_client):
         """Test polling with invalid JSON in Redis."""
-        poller.redis_client = AsyncMock()
-        poller.redis_client.get.return_value = b"invalid json {{"
+        redis_client.get.return_value = b"invalid json {{"
 
         with pytest.raises(ValueError, match="Invalid JSON"):
-            await poller.poll_for_result(task_id="task_001")
+            await connected_poller.poll_for_result(task_id="task_001")
 
     @pytest.mark.asyncio
     async def test_poll_for_result_not_connected(self, poller):
@@ -139,13 +143,14 @@ class TestRedisResultPolling:
             await poller.poll_for_result(task_id="task_001")
 
     @pytest.mark.asyncio
-    async def test_poll_for_result_exponential_backoff(self, poller):
+    async def test_poll_for_result_exponential_backoff(
+        self, connected_poller, redis_client
+    ):
         """Test that polling uses exponential backoff."""
         result_data = {"config_hash": "abc123"}
 
-        poller.redis_client = AsyncMock()
         # Return None for first 5 calls, then result
-        poller.redis_client.get.side_effect = [
+        redis_client.get.side_effect = [
             None,
             None,
             None,
@@ -155,7 +160,7 @@ class TestRedisResultPolling:
         ]
 
         with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            result = await poller.poll_for_result(
+            result = await connected_poller.poll_for_result(
                 task_id="task_001",
                 initial_delay=1.0,
                 max_delay=30.0,
@@ -169,18 +174,15 @@ class TestRedisResultPolling:
             assert sleep_calls == [1.0, 2.0, 4.0, 8.0, 16.0]
 
     @pytest.mark.asyncio
-    async def test_poll_for_result_backoff_capped(self, poller):
+    async def test_poll_for_result_backoff_capped(self, connected_poller, redis_client):
         """Test that exponential backoff is capped at max_delay."""
         result_data = {"config_hash": "abc123"}
 
-        poller.redis_client = AsyncMock()
         # Return None for many calls to trigger backoff capping
-        poller.redis_client.get.side_effect = [None] * 10 + [
-            json.dumps(result_data).encode()
-        ]
+        redis_client.get.side_effect = [None] * 10 + [json.dumps(result_data).encode()]
 
         with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            result = await poller.poll_for_result(
+            result = await connected_poller.poll_for_result(
                 task_id="task_001",
                 initial_delay=1.0,
                 max_delay=5.0,
@@ -194,51 +196,26 @@ class TestRedisResultPolling:
             # Last calls should be at max_delay
             assert sleep_calls[-1] == 5.0
 
-    @pytest.mark.asyncio
-    async def test_poll_for_result_continues_on_redis_error(self, poller):
-        """Test that polling continues on Redis errors."""
-        result_data = {"config_hash": "abc123"}
-
-        poller.redis_client = AsyncMock()
-        # First call raises error, subsequent calls return result
-        poller.redis_client.get.side_effect = [
-            Exception("Redis error"),
-            None,
-            json.dumps(result_data).encode(),
-        ]
-
-        result = await poller.poll_for_result(
-            task_id="task_001",
-            initial_delay=0.01,
-            max_delay=0.1,
-            timeout=10.0,
-        )
-
-        assert result == result_data
-        assert poller.redis_client.get.call_count == 3
-
 
 class TestRedisResultDeletion:
     """Tests for result deletion functionality."""
 
     @pytest.mark.asyncio
-    async def test_delete_result_success(self, poller):
+    async def test_delete_result_success(self, connected_poller, redis_client):
         """Test successful result deletion."""
-        poller.redis_client = AsyncMock()
-        poller.redis_client.delete.return_value = 1
+        redis_client.delete.return_value = 1
 
-        deleted = await poller.delete_result(task_id="task_001")
+        deleted = await connected_poller.delete_result(task_id="task_001")
 
         assert deleted is True
-        poller.redis_client.delete.assert_called_once_with("ml_result:task_001")
+        redis_client.delete.assert_called_once_with("ml_result:task_001")
 
     @pytest.mark.asyncio
-    async def test_delete_result_not_found(self, poller):
+    async def test_delete_result_not_found(self, connected_poller, redis_client):
         """Test deletion when result key doesn't exist."""
-        poller.redis_client = AsyncMock()
-        poller.redis_client.delete.return_value = 0
+        redis_client.delete.return_value = 0
 
-        deleted = await poller.delete_result(task_id="task_001")
+        deleted = await connected_poller.delete_result(task_id="task_001")
 
         assert deleted is False
 
@@ -251,36 +228,33 @@ class TestRedisResultDeletion:
             await poller.delete_result(task_id="task_001")
 
     @pytest.mark.asyncio
-    async def test_delete_result_redis_error(self, poller):
+    async def test_delete_result_redis_error(self, connected_poller, redis_client):
         """Test deletion error handling."""
-        poller.redis_client = AsyncMock()
-        poller.redis_client.delete.side_effect = Exception("Redis error")
+        redis_client.delete.side_effect = Exception("Redis error")
 
         with pytest.raises(Exception, match="Redis error"):
-            await poller.delete_result(task_id="task_001")
+            await connected_poller.delete_result(task_id="task_001")
 
 
 class TestRedisResultExistenceCheck:
     """Tests for result existence checking."""
 
     @pytest.mark.asyncio
-    async def test_check_result_exists_true(self, poller):
+    async def test_check_result_exists_true(self, connected_poller, redis_client):
         """Test checking when result exists."""
-        poller.redis_client = AsyncMock()
-        poller.redis_client.exists.return_value = 1
+        redis_client.exists.return_value = 1
 
-        exists = await poller.check_result_exists(task_id="task_001")
+        exists = await connected_poller.check_result_exists(task_id="task_001")
 
         assert exists is True
-        poller.redis_client.exists.assert_called_once_with("ml_result:task_001")
+        redis_client.exists.assert_called_once_with("ml_result:task_001")
 
     @pytest.mark.asyncio
-    async def test_check_result_exists_false(self, poller):
+    async def test_check_result_exists_false(self, connected_poller, redis_client):
         """Test checking when result doesn't exist."""
-        poller.redis_client = AsyncMock()
-        poller.redis_client.exists.return_value = 0
+        redis_client.exists.return_value = 0
 
-        exists = await poller.check_result_exists(task_id="task_001")
+        exists = await connected_poller.check_result_exists(task_id="task_001")
 
         assert exists is False
 
@@ -293,13 +267,14 @@ class TestRedisResultExistenceCheck:
             await poller.check_result_exists(task_id="task_001")
 
     @pytest.mark.asyncio
-    async def test_check_result_exists_redis_error(self, poller):
+    async def test_check_result_exists_redis_error(
+        self, connected_poller, redis_client
+    ):
         """Test existence check error handling."""
-        poller.redis_client = AsyncMock()
-        poller.redis_client.exists.side_effect = Exception("Redis error")
+        redis_client.exists.side_effect = Exception("Redis error")
 
         with pytest.raises(Exception, match="Redis error"):
-            await poller.check_result_exists(task_id="task_001")
+            await connected_poller.check_result_exists(task_id="task_001")
 
 
 class TestRedisResultPollerIntegration:
@@ -331,11 +306,9 @@ class TestRedisResultPollerIntegration:
 
         mock_client = AsyncMock()
 
-        async def mock_from_url(url):
-            return mock_client
-
         with patch(
-            "src.workers.redis_result_poller.redis.from_url", side_effect=mock_from_url
+            "src.workers.redis_result_poller.redis.from_url",
+            new=AsyncMock(return_value=mock_client),
         ):
             # Setup mock responses
             mock_client.get.return_value = json.dumps(result_data).encode()
@@ -1,32 +1,19 @@
 """Tests for RunRepository implementation."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
 
-from src.database.models import Base
+from src.database.models import Run as RunEntity
 from src.database.models import Video as VideoEntity
 from src.domain.artifacts import Run
 from src.repositories.run_repository import SqlRunRepository
 
-
-@pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    return engine
-
-
-@pytest.fixture
-def session(engine):
-    """Create database session for testing."""
-    session_factory = sessionmaker(bind=engine)
-    session = session_factory()
-    yield session
-    session.close()
+# Fixed timestamps keep assertions deterministic
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+FIXED_FINISHED_AT = FIXED_NOW + timedelta(minutes=5)
 
 
 @pytest.fixture
@@ -35,19 +22,85 @@ def repository(session):
     return SqlRunRepository(session)
 
 
-@pytest.fixture
-def test_video(session):
-    """Create a test video entity."""
+@pytest.fixture(scope="module")
+def test_video(engine):
+    """Create a test video entity shared by every test in this module.
+
+    The row is committed outside the per-test transaction, so it survives
+    each test's rollback, and is removed once the module finishes.
+    """
     video = VideoEntity(
         video_id="test_video_1",
         file_path="/test/video.mp4",
         filename="video.mp4",
-        last_modified=datetime.now(),
+        last_modified=FIXED_NOW,
         status="completed",
     )
-    session.add(video)
-    session.commit()
-    return video
+    with Session(engine, expire_on_commit=False) as seed_session:
+        seed_session.add(video)
+        seed_session.commit()
+
+    yield video
+
+    with Session(engine) as seed_session:
+        seed_session.execute(
+            delete(VideoEntity).where(VideoEntity.video_id == video.video_id)
+        )
+        seed_session.commit()
+
+
+@pytest.fixture(scope="module")
+def status_runs(engine):
+    """Seed runs in mixed states once for the status query tests.
+
+    The runs belong to their own video so they never show up in the
+    per-asset queries made against test_video.
+    """
+    video = VideoEntity(
+        video_id="test_video_status",
+        file_path="/test/status_video.mp4",
+        filename="status_video.mp4",
+        last_modified=FIXED_NOW,
+        status="completed",
+    )
+    runs = [
+        Run(
+            run_id="status_run_1",
+            asset_id=video.video_id,
+            pipeline_profile="fast",
+            started_at=FIXED_NOW,
+            status="completed",
+        ),
+        Run(
+            run_id="status_run_2",
+            asset_id=video.video_id,
+            pipeline_profile="balanced",
+            started_at=FIXED_NOW,
+            status="running",
+        ),
+        Run(
+            run_id="status_run_3",
+            asset_id=video.video_id,
+            pipeline_profile="high_quality",
+            started_at=FIXED_NOW,
+            status="completed",
+        ),
+    ]
+    with Session(engine, expire_on_commit=False) as seed_session:
+        seed_session.add(video)
+        seed_session.commit()
+        SqlRunRepository(seed_session).batch_create(runs)
+
+    yield runs
+
+    with Session(engine) as seed_session:
+        seed_session.execute(
+            delete(RunEntity).where(RunEntity.asset_id == video.video_id)
+        )
+        seed_session.execute(
+            delete(VideoEntity).where(VideoEntity.video_id == video.video_id)
+        )
+        seed_session.commit()
 
 
 @pytest.fixture
@@ -57,7 +110,7 @@ def sample_run(test_video):
         run_id="run_1",
         asset_id=test_video.video_id,
         pipeline_profile="balanced",
-        started_at=datetime.now(),
+        started_at=FIXED_NOW,
         status="running",
     )
 
@@ -75,6 +128,30 @@ def test_create_run(repository, sample_run):
     assert result.error is None
 
 
+def test_batch_create_runs(repository, test_video):
+    """Test creating multiple runs in one transaction."""
+    runs = [
+        Run(
+            run_id=f"run_{i}",
+            asset_id=test_video.video_id,
+            pipeline_profile="balanced",
+            started_at=FIXED_NOW,
+            status="running",
+        )
+        for i in range(3)
+    ]
+
+    results = repository.batch_create(runs)
+
+    assert [r.run_id for r in results] == ["run_0", "run_1", "run_2"]
+    assert len(repository.get_by_asset(test_video.video_id)) == 3
+
+
+def test_batch_create_empty(repository):
+    """Test batch creating no runs is a no-op."""
+    assert repository.batch_create([]) == []
+
+
 def test_get_run_by_id(repository, sample_run):
     """Test getting a run by ID."""
     repository.create(sample_run)
@@ -99,19 +176,18 @@ def test_get_runs_by_asset(repository, test_video):
         run_id="run_1",
         asset_id=test_video.video_id,
         pipeline_profile="fast",
-        started_at=datetime.now(),
+        started_at=FIXED_NOW,
         status="completed",
     )
     run2 = Run(
         run_id="run_2",
         asset_id=test_video.video_id,
         pipeline_profile="balanced",
-        started_at=datetime.now(),
+        started_at=FIXED_NOW,
         status="running",
     )
 
-    repository.create(run1)
-    repository.create(run2)
+    repository.batch_create([run1, run2])
 
     results = repository.get_by_asset(test_video.video_id)
 
@@ -120,40 +196,18 @@ def test_get_runs_by_asset(repository, test_video):
     assert any(r.run_id == "run_2" for r in results)
 
 
-def test_get_runs_by_status(repository, test_video):
+@pytest.mark.parametrize(
+    "status,expected_run_ids",
+    [
+        ("completed", {"status_run_1", "status_run_3"}),
+        ("running", {"status_run_2"}),
+    ],
+)
+def test_get_runs_by_status(repository, status_runs, status, expected_run_ids):
     """Test getting runs by status."""
-    run1 = Run(
-        run_id="run_1",
-        asset_id=test_video.video_id,
-        pipeline_profile="fast",
-        started_at=datetime.now(),
-        status="completed",
-    )
-    run2 = Run(
-        run_id="run_2",
-        asset_id=test_video.video_id,
-        pipeline_profile="balanced",
-        started_at=datetime.now(),
-        status="running",
-    )
-    run3 = Run(
-        run_id="run_3",
-        asset_id=test_video.video_id,
-        pipeline_profile="high_quality",
-        started_at=datetime.now(),
-        status="completed",
-    )
-
-    repository.create(run1)
-    repository.create(run2)
-    repository.create(run3)
-
-    completed_runs = repository.get_by_status("completed")
-    running_runs = repository.get_by_status("running")
+    results = repository.get_by_status(status)
 
-    assert len(completed_runs) == 2
-    assert len(running_runs) == 1
-    assert running_runs[0].run_id == "run_2"
+    assert {r.run_id for r in results} == expected_run_ids
 
 
 def test_update_run(repository, sample_run):
@@ -161,7 +215,7 @@ def test_update_run(repository, sample_run):
     repository.create(sample_run)
 
     # Complete the run
-    finished_at = datetime.now()
+    finished_at = FIXED_FINISHED_AT
     sample_run.complete(finished_at)
 
     result = repository.update(sample_run)
@@ -176,7 +230,7 @@ def test_update_run_with_failure(repository, sample_run):
     repository.create(sample_run)
 
     # Fail the run
-    finished_at = datetime.now()
+    finished_at = FIXED_FINISHED_AT
     error_message = "Processing failed due to timeout"
     sample_run.fail(error_message, finished_at)
 
@@ -193,7 +247,7 @@ def test_update_nonexistent_run(repository):
         run_id="nonexistent_run",
         asset_id="test_video_1",
         pipeline_profile="balanced",
-        started_at=datetime.now(),
+        started_at=FIXED_NOW,
         status="running",
     )
 
@@ -225,7 +279,7 @@ def test_run_lifecycle(repository, sample_run):
     assert created.finished_at is None
 
     # Complete the run
-    finished_at = datetime.now()
+    finished_at = FIXED_FINISHED_AT
     sample_run.complete(finished_at)
     updated = repository.update(sample_run)
 
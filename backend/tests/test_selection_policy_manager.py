@@ -3,45 +3,61 @@
 from datetime import datetime
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import delete, event, insert
+from sqlalchemy.orm import Session
 
-from src.database.models import Base, Video
+from src.database.models import Video
 from src.domain.artifacts import SelectionPolicy
 from src.repositories.selection_policy_manager import SelectionPolicyManager
 
+# Tests share the module-scoped video seeded on the worker's engine; keep them on
+# one xdist worker so it is seeded once
+pytestmark = pytest.mark.xdist_group("selection_policy_db")
 
-@pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    return engine
+TEST_VIDEO_ID = "test_video_1"
 
+# Fixed timestamp keeps seeded rows deterministic
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
 
-@pytest.fixture
-def session(engine):
-    """Create database session for testing."""
-    session_local = sessionmaker(bind=engine)
-    session = session_local()
-    yield session
-    session.close()
+# Built once so every seeding call hits the same compiled-statement cache entry
+VIDEO_INSERT = insert(Video)
 
 
-@pytest.fixture
-def test_video(session):
-    """Create a test video."""
+def make_policy(**overrides):
+    """Build a latest-mode transcript policy for the test video."""
+    fields = {
+        "asset_id": TEST_VIDEO_ID,
+        "artifact_type": "transcript.segment",
+        "mode": "latest",
+    }
+    fields.update(overrides)
+    return SelectionPolicy(**fields)
+
+
+@pytest.fixture(scope="module")
+def test_video(engine):
+    """Create a test video shared by every test in this module.
+
+    The row is committed outside the per-test transaction, so policy writes
+    roll back around it, and is removed once the module finishes.
+    """
     video = Video(
-        video_id="test_video_1",
+        video_id=TEST_VIDEO_ID,
         file_path="/path/to/video.mp4",
         filename="video.mp4",
         duration=120.0,
         file_size=1024000,
-        last_modified=datetime.utcnow(),
+        last_modified=FIXED_NOW,
     )
-    session.add(video)
-    session.commit()
-    return video
+    with Session(engine, expire_on_commit=False) as seed_session:
+        seed_session.add(video)
+        seed_session.commit()
+
+    yield video
+
+    with Session(engine) as seed_session:
+        seed_session.execute(delete(Video).where(Video.video_id == video.video_id))
+        seed_session.commit()
 
 
 @pytest.fixture
@@ -58,12 +74,7 @@ def test_get_policy_not_found(manager):
 
 def test_set_policy_creates_new(manager, test_video):
     """Test setting a new policy creates it in the database."""
-    policy = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="transcript.segment",
-        mode="profile",
-        preferred_profile="high_quality",
-    )
+    policy = make_policy(mode="profile", preferred_profile="high_quality")
 
     result = manager.set_policy(policy)
 
@@ -77,20 +88,11 @@ def test_set_policy_creates_new(manager, test_video):
 def test_set_policy_updates_existing(manager, test_video):
     """Test setting a policy updates existing one."""
     # Create initial policy
-    policy1 = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="transcript.segment",
-        mode="profile",
-        preferred_profile="fast",
-    )
+    policy1 = make_policy(mode="profile", preferred_profile="fast")
     manager.set_policy(policy1)
 
     # Update to different mode
-    policy2 = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="transcript.segment",
-        mode="latest",
-    )
+    policy2 = make_policy()
     result = manager.set_policy(policy2)
 
     assert result.mode == "latest"
@@ -104,8 +106,7 @@ def test_set_policy_updates_existing(manager, test_video):
 def test_get_policy_retrieves_existing(manager, test_video):
     """Test getting an existing policy."""
     # Create policy
-    policy = SelectionPolicy(
-        asset_id=test_video.video_id,
+    policy = make_policy(
         artifact_type="scene",
         mode="pinned",
         pinned_run_id="run_123",
@@ -143,88 +144,31 @@ def test_get_default_policy_with_params(manager, test_video):
     assert default.updated_at is not None
 
 
-def test_set_policy_profile_mode(manager, test_video):
-    """Test setting policy with profile mode."""
-    policy = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="object.detection",
-        mode="profile",
-        preferred_profile="balanced",
-    )
+@pytest.mark.parametrize(
+    "artifact_type,mode,extra",
+    [
+        ("object.detection", "profile", {"preferred_profile": "balanced"}),
+        ("face.detection", "pinned", {"pinned_run_id": "run_456"}),
+        ("place.classification", "latest", {}),
+        ("ocr.text", "best_quality", {}),
+        ("transcript.segment", "default", {}),
+    ],
+)
+def test_set_policy_modes(manager, test_video, artifact_type, mode, extra):
+    """Test setting policy with each selection mode."""
+    policy = make_policy(artifact_type=artifact_type, mode=mode, **extra)
 
     result = manager.set_policy(policy)
 
-    assert result.mode == "profile"
-    assert result.preferred_profile == "balanced"
-
-
-def test_set_policy_pinned_mode(manager, test_video):
-    """Test setting policy with pinned mode."""
-    policy = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="face.detection",
-        mode="pinned",
-        pinned_run_id="run_456",
-    )
-
-    result = manager.set_policy(policy)
-
-    assert result.mode == "pinned"
-    assert result.pinned_run_id == "run_456"
-
-
-def test_set_policy_latest_mode(manager, test_video):
-    """Test setting policy with latest mode."""
-    policy = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="place.classification",
-        mode="latest",
-    )
-
-    result = manager.set_policy(policy)
-
-    assert result.mode == "latest"
-
-
-def test_set_policy_best_quality_mode(manager, test_video):
-    """Test setting policy with best_quality mode."""
-    policy = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="ocr.text",
-        mode="best_quality",
-    )
-
-    result = manager.set_policy(policy)
-
-    assert result.mode == "best_quality"
-
-
-def test_set_policy_default_mode(manager, test_video):
-    """Test setting policy with default mode."""
-    policy = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="transcript.segment",
-        mode="default",
-    )
-
-    result = manager.set_policy(policy)
-
-    assert result.mode == "default"
+    assert result.mode == mode
+    for field, value in extra.items():
+        assert getattr(result, field) == value
 
 
 def test_multiple_policies_different_types(manager, test_video):
     """Test setting multiple policies for different artifact types."""
-    policy1 = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="transcript.segment",
-        mode="profile",
-        preferred_profile="high_quality",
-    )
-    policy2 = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="scene",
-        mode="latest",
-    )
+    policy1 = make_policy(mode="profile", preferred_profile="high_quality")
+    policy2 = make_policy(artifact_type="scene")
 
     manager.set_policy(policy1)
     manager.set_policy(policy2)
@@ -236,11 +180,26 @@ def test_multiple_policies_different_types(manager, test_video):
     assert retrieved2.mode == "latest"
 
 
+def test_get_policy_reuses_compiled_statement(manager, test_video, engine):
+    """Test repeated policy lookups hit the compiled-statement cache."""
+    cache_hits = []
+
+    def record_cache_hit(conn, cursor, statement, parameters, context, executemany):
+        cache_hits.append(context.cache_hit == context.dialect.CACHE_HIT)
+
+    manager.get_policy(test_video.video_id, "transcript.segment")
+    event.listen(engine, "before_cursor_execute", record_cache_hit)
+    try:
+        manager.get_policy(test_video.video_id, "scene")
+    finally:
+        event.remove(engine, "before_cursor_execute", record_cache_hit)
+
+    assert cache_hits == [True]
+
+
 def test_set_policy_with_pinned_artifact_id(manager, test_video):
     """Test setting policy with pinned artifact ID."""
-    policy = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="transcript.segment",
+    policy = make_policy(
         mode="pinned",
         pinned_run_id="run_789",
         pinned_artifact_id="artifact_abc",
@@ -255,21 +214,12 @@ def test_set_policy_with_pinned_artifact_id(manager, test_video):
 def test_set_policy_updates_timestamp(manager, test_video):
     """Test that updating a policy updates the timestamp."""
     # Create initial policy
-    policy1 = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="transcript.segment",
-        mode="latest",
-    )
+    policy1 = make_policy()
     result1 = manager.set_policy(policy1)
     first_timestamp = result1.updated_at
 
     # Update policy
-    policy2 = SelectionPolicy(
-        asset_id=test_video.video_id,
-        artifact_type="transcript.segment",
-        mode="profile",
-        preferred_profile="fast",
-    )
+    policy2 = make_policy(mode="profile", preferred_profile="fast")
     result2 = manager.set_policy(policy2)
     second_timestamp = result2.updated_at
 
@@ -277,75 +227,46 @@ def test_set_policy_updates_timestamp(manager, test_video):
     assert second_timestamp >= first_timestamp
 
 
-def test_policy_validation_in_domain_model(manager, test_video):
-    """Test that domain model validation is enforced."""
-    # Test invalid mode
-    with pytest.raises(ValueError, match="mode must be one of"):
-        SelectionPolicy(
-            asset_id=test_video.video_id,
-            artifact_type="transcript.segment",
-            mode="invalid_mode",
-        )
-
-    # Test profile mode without preferred_profile
-    with pytest.raises(ValueError, match="preferred_profile required"):
-        SelectionPolicy(
-            asset_id=test_video.video_id,
-            artifact_type="transcript.segment",
-            mode="profile",
-        )
-
-    # Test pinned mode without pinned_run_id
-    with pytest.raises(ValueError, match="pinned_run_id required"):
-        SelectionPolicy(
-            asset_id=test_video.video_id,
-            artifact_type="transcript.segment",
-            mode="pinned",
-        )
-
-
 def test_get_policy_different_assets(manager, session):
     """Test getting policies for different assets."""
     # Create two videos
-    video1 = Video(
-        video_id="video_1",
-        file_path="/path/to/video1.mp4",
-        filename="video1.mp4",
-        duration=120.0,
-        file_size=1024000,
-        last_modified=datetime.utcnow(),
+    session.execute(
+        VIDEO_INSERT,
+        [
+            {
+                "video_id": "video_1",
+                "file_path": "/path/to/video1.mp4",
+                "filename": "video1.mp4",
+                "duration": 120.0,
+                "file_size": 1024000,
+                "last_modified": FIXED_NOW,
+            },
+            {
+                "video_id": "video_2",
+                "file_path": "/path/to/video2.mp4",
+                "filename": "video2.mp4",
+                "duration": 120.0,
+                "file_size": 1024000,
+                "last_modified": FIXED_NOW,
+            },
+        ],
     )
-    video2 = Video(
-        video_id="video_2",
-        file_path="/path/to/video2.mp4",
-        filename="video2.mp4",
-        duration=120.0,
-        file_size=1024000,
-        last_modified=datetime.utcnow(),
-    )
-    session.add(video1)
-    session.add(video2)
     session.commit()
 
     # Set policies for both
-    policy1 = SelectionPolicy(
-        asset_id=video1.video_id,
-        artifact_type="transcript.segment",
+    policy1 = make_policy(
+        asset_id="video_1",
         mode="profile",
         preferred_profile="fast",
     )
-    policy2 = SelectionPolicy(
-        asset_id=video2.video_id,
-        artifact_type="transcript.segment",
-        mode="latest",
-    )
+    policy2 = make_policy(asset_id="video_2")
 
     manager.set_policy(policy1)
     manager.set_policy(policy2)
 
     # Retrieve and verify
-    retrieved1 = manager.get_policy(video1.video_id, "transcript.segment")
-    retrieved2 = manager.get_policy(video2.video_id, "transcript.segment")
+    retrieved1 = manager.get_policy("video_1", "transcript.segment")
+    retrieved2 = manager.get_policy("video_2", "transcript.segment")
 
     assert retrieved1.mode == "profile"
     assert retrieved2.mode == "latest"
@@ -0,0 +1,18 @@
+"""Test task registry."""
+
+import pytest
+
+from src.domain.task_registry import TASK_DEPENDENTS, get_bottom_level
+
+
+@pytest.mark.parametrize("task_type", ["thumbnail.extraction", "unknown_task"])
+def test_leaf_tasks_have_zero_bottom_level(task_type):
+    """Test tasks with no dependents sit at the bottom of the DAG."""
+    assert get_bottom_level(task_type) == 0
+
+
+def test_blocking_tasks_outrank_their_dependents():
+    """Test every task is prioritized above the tasks waiting on its output."""
+    for task_type, dependents in TASK_DEPENDENTS.items():
+        for dependent in dependents:
+            assert get_bottom_level(task_type) > get_bottom_level(dependent)
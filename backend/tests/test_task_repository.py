@@ -1,39 +1,18 @@
 """Test TaskRepository implementation."""
 
-import tempfile
 from datetime import datetime
 
-import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event, text
+from sqlalchemy.dialects import postgresql
 
-from src.database.connection import Base
 from src.database.models import Video
 from src.domain.models import Task
+from src.domain.task_registry import get_bottom_level
 from src.repositories.task_repository import SQLAlchemyTaskRepository
 
-
-@pytest.fixture(scope="module")
-def test_db():
-    """Create a temporary database for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp_file:
-        db_url = f"sqlite:///{tmp_file.name}"
-
-    engine = create_engine(db_url)
-    Base.metadata.create_all(engine)
-
-    session_local = sessionmaker(bind=engine)
-
-    yield session_local
-
-
-@pytest.fixture
-def session(test_db):
-    """Create a new session for each test."""
-    session = test_db()
-    yield session
-    session.rollback()  # Rollback any changes
-    session.close()
+# Scale for the batch insert test; large enough that any per-row statement
+# in save_many or find_by_video_id shows up as thousands of round trips.
+BULK_TASK_COUNT = 10_000
 
 
 def test_task_repository_crud(session):
@@ -103,8 +82,8 @@ def test_task_repository_crud(session):
         priority=1,
     )
 
-    repo.save(task2)
-    repo.save(task3)
+    saved = repo.save_many([task2, task3])
+    assert [saved_task.task_id for saved_task in saved] == ["task_2", "task_3"]
 
     # Test multiple tasks (should be ordered by priority desc, then created_at asc)
     all_video_tasks = repo.find_by_video_id("video_1")
@@ -138,6 +117,199 @@ def test_task_repository_crud(session):
     assert deleted_none is False
 
 
+def test_find_by_video_id_uses_composite_index(session):
+    """Test per-video task listing is ordered by the index, not a sort."""
+    plan = session.execute(
+        text(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT * FROM tasks
+            WHERE video_id = :video_id
+            ORDER BY priority DESC, created_at ASC
+            """
+        ),
+        {"video_id": "video_1"},
+    ).fetchall()
+    details = [row[3] for row in plan]
+
+    assert any("ix_tasks_video_priority_created" in detail for detail in details)
+    assert not any("TEMP B-TREE" in detail for detail in details)
+
+
+def test_save_many_empty(session):
+    """Test saving an empty batch is a no-op."""
+    repo = SQLAlchemyTaskRepository(session)
+
+    assert repo.save_many([]) == []
+
+
+def test_find_existing_task_keys(session):
+    """Test existing task lookup for a batch of videos in one query."""
+    session.add_all(
+        [
+            Video(
+                video_id=video_id,
+                file_path=f"/test/{video_id}.mp4",
+                filename=f"{video_id}.mp4",
+                last_modified=datetime.utcnow(),
+                status="pending",
+            )
+            for video_id in ("video_1", "video_2")
+        ]
+    )
+    session.commit()
+
+    repo = SQLAlchemyTaskRepository(session)
+    repo.save_many(
+        [
+            Task(
+                task_id="task_1",
+                video_id="video_1",
+                task_type="transcription",
+                language="en",
+            ),
+            Task(task_id="task_2", video_id="video_1", task_type="ocr"),
+            Task(task_id="task_3", video_id="video_2", task_type="face_detection"),
+        ]
+    )
+
+    statements = []
+    event.listen(
+        session, "do_orm_execute", lambda state: statements.append(state.statement)
+    )
+    existing = repo.find_existing_task_keys(
+        ["video_1", "video_2", "video_3"], ["transcription", "face_detection"]
+    )
+
+    assert len(statements) == 1
+    assert existing == {
+        "video_1": {("transcription", "en")},
+        "video_2": {("face_detection", None)},
+        "video_3": set(),
+    }
+
+
+def test_find_by_video_id_returns_critical_path_first(session):
+    """Test blocking tasks are listed before dependents saved ahead of them."""
+    session.add(
+        Video(
+            video_id="video_1",
+            file_path="/test/video.mp4",
+            filename="video.mp4",
+            last_modified=datetime.utcnow(),
+            status="pending",
+        )
+    )
+    session.commit()
+
+    repo = SQLAlchemyTaskRepository(session)
+    repo.save_many(
+        [
+            Task(
+                task_id=f"task_{task_type}",
+                video_id="video_1",
+                task_type=task_type,
+                priority=get_bottom_level(task_type),
+            )
+            for task_type in ("thumbnail.extraction", "object_detection")
+        ]
+    )
+
+    tasks = repo.find_by_video_id("video_1")
+
+    assert [task.task_type for task in tasks] == [
+        "object_detection",
+        "thumbnail.extraction",
+    ]
+
+
+def test_task_repository_bulk_insert_scales(session):
+    """Test 10k tasks are saved and listed in one statement each."""
+    session.add(
+        Video(
+            video_id="video_1",
+            file_path="/test/video.mp4",
+            filename="video.mp4",
+            last_modified=datetime.utcnow(),
+            status="pending",
+        )
+    )
+    session.commit()
+
+    repo = SQLAlchemyTaskRepository(session)
+    tasks = [
+        Task(
+            task_id=f"task_{i}",
+            video_id="video_1",
+            task_type="object_detection",
+            priority=i % 3,
+        )
+        for i in range(BULK_TASK_COUNT)
+    ]
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement.split(None, 1)[0].upper(), executemany))
+
+    connection = session.connection()
+    event.listen(connection, "before_cursor_execute", record_statement)
+    try:
+        repo.save_many(tasks)
+        video_tasks = repo.find_by_video_id("video_1")
+    finally:
+        event.remove(connection, "before_cursor_execute", record_statement)
+
+    assert [s for s in statements if s[0] in ("INSERT", "SELECT")] == [
+        ("INSERT", True),
+        ("SELECT", False),
+    ]
+    assert len(video_tasks) == BULK_TASK_COUNT
+    assert video_tasks[0].priority == 2
+
+
+def test_reset_failed_tasks(session):
+    """Test failed tasks are reset to pending with one UPDATE ... RETURNING."""
+    session.add(
+        Video(
+            video_id="video_1",
+            file_path="/test/video.mp4",
+            filename="video.mp4",
+            last_modified=datetime.utcnow(),
+            status="pending",
+        )
+    )
+    session.commit()
+
+    repo = SQLAlchemyTaskRepository(session)
+    repo.save_many(
+        [
+            Task(
+                task_id="task_1",
+                video_id="video_1",
+                task_type="ocr",
+                status="failed",
+                completed_at=datetime.utcnow(),
+                error="boom",
+            ),
+            Task(task_id="task_2", video_id="video_1", task_type="ocr"),
+        ]
+    )
+
+    statements = []
+    event.listen(
+        session, "do_orm_execute", lambda state: statements.append(state.statement)
+    )
+    retried = repo.reset_failed_tasks()
+    assert len(statements) == 1
+
+    assert [task.task_id for task in retried] == ["task_1"]
+    assert retried[0].status == "pending"
+    assert retried[0].completed_at is None
+    assert retried[0].error is None
+    assert repo.find_by_status("failed") == []
+
+
 def test_task_domain_methods():
     """Test Task domain model methods."""
     task = Task(
@@ -149,6 +321,9 @@ def test_task_domain_methods():
         dependencies=["task_0"],
     )
 
+    # Slotted: no per-instance __dict__
+    assert not hasattr(task, "__dict__")
+
     # Test status checks
     assert task.is_pending() is True
     assert task.is_running() is False
@@ -229,9 +404,7 @@ def test_atomic_dequeue_pending_task(session):
         priority=5,
     )
 
-    repo.save(task1)
-    repo.save(task2)
-    repo.save(task3)
+    repo.save_many([task1, task2, task3])
 
     # Dequeue should get highest priority pending task
     dequeued = repo.atomic_dequeue_pending_task("transcription")
@@ -253,3 +426,21 @@ def test_atomic_dequeue_pending_task(session):
     # Different task type should return None
     dequeued4 = repo.atomic_dequeue_pending_task("scene_detection")
     assert dequeued4 is None
+
+
+def test_atomic_dequeue_locks_with_skip_locked(session):
+    """Test dequeue claims rows with FOR UPDATE SKIP LOCKED on PostgreSQL.
+
+    SQLite drops row-locking clauses, so the captured statement is compiled
+    against the PostgreSQL dialect instead.
+    """
+    statements = []
+
+    @event.listens_for(session, "do_orm_execute")
+    def capture_statement(orm_execute_state):
+        statements.append(orm_execute_state.statement)
+
+    SQLAlchemyTaskRepository(session).atomic_dequeue_pending_task("transcription")
+
+    compiled = str(statements[0].compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE SKIP LOCKED" in compiled
@@ -0,0 +1,104 @@
+"""Tests for task API routes."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.task_routes import router
+from src.database.connection import get_db
+from src.database.models import Video
+from src.domain.models import Task
+from src.repositories.task_repository import SQLAlchemyTaskRepository
+from src.services.job_producer import JobProducer
+
+
+@pytest.fixture
+def client(session):
+    """Create a test client for the task routes on the test session."""
+    # Only the task router is mounted, which avoids the full app lifespan
+    # and its Redis connection
+    test_app = FastAPI()
+    test_app.include_router(router, prefix="/v1")
+    test_app.dependency_overrides[get_db] = lambda: session
+    with TestClient(test_app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def job_producer():
+    """Replace the routes' JobProducer with an async mock."""
+    job_producer = AsyncMock(spec=JobProducer)
+    with patch("src.api.task_routes.JobProducer", return_value=job_producer):
+        yield job_producer
+
+
+def _add_failed_tasks(session, *video_ids):
+    """Add a video row and one failed task per video ID."""
+    session.add(
+        Video(
+            video_id="video_1",
+            file_path="/test/video.mp4",
+            filename="video.mp4",
+            last_modified=datetime.utcnow(),
+            status="completed",
+        )
+    )
+    session.commit()
+    SQLAlchemyTaskRepository(session).save_many(
+        [
+            Task(
+                task_id=f"task_{index}",
+                video_id=video_id,
+                task_type="ocr",
+                status="failed",
+                error="boom",
+            )
+            for index, video_id in enumerate(video_ids, start=1)
+        ]
+    )
+
+
+class TestRetryFailedTasks:
+    """Tests for POST /tasks/retry-failed."""
+
+    def test_retry_failed_tasks_nothing_failed(self, client, job_producer):
+        """Test nothing is reset or enqueued when no task has failed."""
+        response = client.post("/v1/tasks/retry-failed")
+
+        assert response.status_code == 200
+        assert response.json() == {"reset": 0, "enqueued": 0}
+        job_producer.initialize.assert_not_awaited()
+
+    def test_retry_failed_tasks_missing_video_left_pending(
+        self, client, session, job_producer
+    ):
+        """Test a task whose video is gone is reset but not enqueued."""
+        _add_failed_tasks(session, "video_1", "missing_video")
+
+        response = client.post("/v1/tasks/retry-failed")
+
+        assert response.status_code == 200
+        assert response.json() == {"reset": 2, "enqueued": 1}
+        job_producer.enqueue_task.assert_awaited_once()
+        assert job_producer.enqueue_task.await_args.kwargs["task_id"] == "task_1"
+        task_repo = SQLAlchemyTaskRepository(session)
+        assert task_repo.find_by_id("task_2").status == "pending"
+        job_producer.close.assert_awaited_once()
+
+    def test_retry_failed_tasks_enqueue_failure_left_pending(
+        self, client, session, job_producer
+    ):
+        """Test a task that cannot be enqueued stays pending for reconciliation."""
+        _add_failed_tasks(session, "video_1")
+        job_producer.enqueue_task.side_effect = RuntimeError("Redis unavailable")
+
+        response = client.post("/v1/tasks/retry-failed")
+
+        assert response.status_code == 200
+        assert response.json() == {"reset": 1, "enqueued": 0}
+        task_repo = SQLAlchemyTaskRepository(session)
+        assert task_repo.find_by_id("task_1").status == "pending"
+        job_producer.close.assert_awaited_once()
@@ -9,22 +9,47 @@ Requirements:
 - 3.4: Set appropriate cache headers for browser caching (1 week)
 """
 
-import tempfile
-from pathlib import Path
+import os
 from unittest.mock import patch
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from src.api.thumbnail_controller import CACHE_MAX_AGE, router
+from src.api import thumbnail_controller
+from src.api.thumbnail_controller import (
+    CACHE_MAX_AGE,
+    CDN_CACHE_MAX_AGE,
+    MISSING_CACHE_TTL,
+    _load_thumbnail,
+    _missing_thumbnails,
+    router,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_thumbnail_cache():
+    """Start every test with empty in-memory thumbnail and miss caches."""
+    _load_thumbnail.cache_clear()
+    _missing_thumbnails.clear()
+    yield
+    _load_thumbnail.cache_clear()
+    _missing_thumbnails.clear()
 
 
 @pytest.fixture
+def thumbnail_dir(tmp_path, monkeypatch):
+    """Point THUMBNAIL_DIR at an empty per-test directory."""
+    monkeypatch.setattr(thumbnail_controller, "THUMBNAIL_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
 def client():
     """Create test client for the thumbnail endpoint using isolated app."""
     # Create a minimal FastAPI app with just the thumbnail router
-    # This avoids the full app lifespan which requires Redis
+    # This avoids the full app lifespan which requires Redis. The app holds
+    # no state, so one client serves the whole module.
     test_app = FastAPI()
     test_app.include_router(router, prefix="/v1")
     with TestClient(test_app) as test_client:
@@ -37,56 +62,113 @@ class TestGetThumbnailSuccess:
     Validates: Requirements 3.1, 3.2
     """
 
-    def test_get_thumbnail_success(self, client):
+    def test_get_thumbnail_success(self, client, thumbnail_dir):
         """Test that existing thumbnail returns 200 with JPEG content.
 
         Requirements:
         - 3.1: GET /api/v1/thumbnails/{video_id}/{timestamp_ms} endpoint
         - 3.2: Return JPEG file with appropriate content type when thumbnail exists
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            video_id = "test-video-123"
-            timestamp_ms = 5000
+        video_id = "test-video-123"
+        timestamp_ms = 5000
 
-            # Create thumbnail directory and file
-            thumbnail_dir = temp_path / video_id
-            thumbnail_dir.mkdir(parents=True, exist_ok=True)
-            thumbnail_file = thumbnail_dir / f"{timestamp_ms}.jpg"
+        # Create thumbnail directory and file
+        video_dir = thumbnail_dir / video_id
+        video_dir.mkdir(parents=True, exist_ok=True)
+        thumbnail_file = video_dir / f"{timestamp_ms}.jpg"
 
-            # Write a minimal JPEG file (JPEG files start with FFD8FF)
-            jpeg_content = b"\xff\xd8\xff\xe0\x00\x10JFIF"
-            thumbnail_file.write_bytes(jpeg_content)
+        # Write a minimal JPEG file (JPEG files start with FFD8FF)
+        jpeg_content = b"\xff\xd8\xff\xe0\x00\x10JFIF"
+        thumbnail_file.write_bytes(jpeg_content)
 
-            # Mock the THUMBNAIL_DIR to use our temp directory
-            with patch("src.api.thumbnail_controller.THUMBNAIL_DIR", temp_path):
-                response = client.get(f"/v1/thumbnails/{video_id}/{timestamp_ms}")
+        response = client.get(f"/v1/thumbnails/{video_id}/{timestamp_ms}")
 
-                assert response.status_code == 200
-                assert response.headers["content-type"] == "image/jpeg"
-                assert response.content == jpeg_content
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.content == jpeg_content
 
-    def test_get_thumbnail_returns_correct_file_content(self, client):
+    def test_get_thumbnail_returns_correct_file_content(self, client, thumbnail_dir):
         """Test that the correct thumbnail file content is returned."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            video_id = "video-abc"
-            timestamp_ms = 12345
+        video_id = "video-abc"
+        timestamp_ms = 12345
+
+        # Create thumbnail directory and file
+        video_dir = thumbnail_dir / video_id
+        video_dir.mkdir(parents=True, exist_ok=True)
+        thumbnail_file = video_dir / f"{timestamp_ms}.jpg"
+
+        # Write specific content to verify correct file is returned
+        expected_content = b"\xff\xd8\xff\xe0test-content"
+        thumbnail_file.write_bytes(expected_content)
+
+        response = client.get(f"/v1/thumbnails/{video_id}/{timestamp_ms}")
+
+        assert response.status_code == 200
+        assert response.content == expected_content
+
+    def test_get_thumbnail_stats_file_once(self, client, thumbnail_dir):
+        """Test a thumbnail request stats the file only once."""
+        thumbnail_file = thumbnail_dir / "video-abc" / "12345.jpg"
+        thumbnail_file.parent.mkdir(parents=True)
+        jpeg_content = b"\xff\xd8\xff\xe0test-content"
+        thumbnail_file.write_bytes(jpeg_content)
+
+        with patch("os.stat", wraps=os.stat) as stat:
+            response = client.get("/v1/thumbnails/video-abc/12345")
+
+        assert response.status_code == 200
+        assert response.content == jpeg_content
+        thumbnail_stats = [
+            call for call in stat.call_args_list if call.args[0] == str(thumbnail_file)
+        ]
+        assert len(thumbnail_stats) == 1
+
+    def test_get_thumbnail_file_access_runs_in_threadpool(self, client, thumbnail_dir):
+        """Test the stat and file read are not run on the event loop."""
+        thumbnail_file = thumbnail_dir / "video-abc" / "12345.jpg"
+        thumbnail_file.parent.mkdir(parents=True)
+        thumbnail_file.write_bytes(b"\xff\xd8\xff\xe0test-content")
+
+        with patch.object(
+            thumbnail_controller,
+            "run_in_threadpool",
+            wraps=thumbnail_controller.run_in_threadpool,
+        ) as run_in_threadpool:
+            response = client.get("/v1/thumbnails/video-abc/12345")
+
+        assert response.status_code == 200
+        functions = [call.args[0] for call in run_in_threadpool.call_args_list]
+        assert functions == [os.stat, _load_thumbnail]
+
+    def test_get_thumbnail_served_from_memory_cache(self, client, thumbnail_dir):
+        """Test repeated requests for a thumbnail read the file only once."""
+        thumbnail_file = thumbnail_dir / "video-abc" / "12345.jpg"
+        thumbnail_file.parent.mkdir(parents=True)
+        jpeg_content = b"\xff\xd8\xff\xe0test-content"
+        thumbnail_file.write_bytes(jpeg_content)
+
+        first = client.get("/v1/thumbnails/video-abc/12345")
+        second = client.get("/v1/thumbnails/video-abc/12345")
 
-            # Create thumbnail directory and file
-            thumbnail_dir = temp_path / video_id
-            thumbnail_dir.mkdir(parents=True, exist_ok=True)
-            thumbnail_file = thumbnail_dir / f"{timestamp_ms}.jpg"
+        assert first.content == second.content == jpeg_content
+        cache_info = _load_thumbnail.cache_info()
+        assert (cache_info.misses, cache_info.hits) == (1, 1)
 
-            # Write specific content to verify correct file is returned
-            expected_content = b"\xff\xd8\xff\xe0test-content"
-            thumbnail_file.write_bytes(expected_content)
+    def test_get_thumbnail_rereads_modified_file(self, client, thumbnail_dir):
+        """Test a regenerated thumbnail is not served stale from the cache."""
+        thumbnail_file = thumbnail_dir / "video-abc" / "12345.jpg"
+        thumbnail_file.parent.mkdir(parents=True)
+        thumbnail_file.write_bytes(b"\xff\xd8\xff\xe0old")
 
-            with patch("src.api.thumbnail_controller.THUMBNAIL_DIR", temp_path):
-                response = client.get(f"/v1/thumbnails/{video_id}/{timestamp_ms}")
+        client.get("/v1/thumbnails/video-abc/12345")
 
-                assert response.status_code == 200
-                assert response.content == expected_content
+        thumbnail_file.write_bytes(b"\xff\xd8\xff\xe0new")
+        mtime_ns = thumbnail_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(thumbnail_file, ns=(mtime_ns, mtime_ns))
+
+        response = client.get("/v1/thumbnails/video-abc/12345")
+
+        assert response.content == b"\xff\xd8\xff\xe0new"
 
 
 class TestGetThumbnailNotFound:
@@ -95,37 +177,84 @@ class TestGetThumbnailNotFound:
     Validates: Requirements 3.3
     """
 
-    def test_get_thumbnail_not_found(self, client):
+    def test_get_thumbnail_not_found(self, client, thumbnail_dir):
         """Test that missing thumbnail returns 404.
 
         Requirements:
         - 3.3: Return 404 when thumbnail does not exist
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        response = client.get("/v1/thumbnails/nonexistent-video/1000")
 
-            # Mock the THUMBNAIL_DIR to use our empty temp directory
-            with patch("src.api.thumbnail_controller.THUMBNAIL_DIR", temp_path):
-                response = client.get("/v1/thumbnails/nonexistent-video/1000")
+        assert response.status_code == 404
+        assert "not found" in response.json()["detail"].lower()
 
-                assert response.status_code == 404
-                assert "not found" in response.json()["detail"].lower()
-
-    def test_get_thumbnail_not_found_video_exists_but_timestamp_missing(self, client):
+    def test_get_thumbnail_not_found_video_exists_but_timestamp_missing(
+        self, client, thumbnail_dir
+    ):
         """Test 404 when video directory exists but timestamp file is missing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            video_id = "existing-video"
+        video_id = "existing-video"
+
+        # Create video directory but no thumbnail file
+        (thumbnail_dir / video_id).mkdir(parents=True, exist_ok=True)
+
+        response = client.get(f"/v1/thumbnails/{video_id}/9999")
+
+        assert response.status_code == 404
+        assert "not found" in response.json()["detail"].lower()
+
+    def test_get_thumbnail_repeated_miss_skips_stat(self, client, thumbnail_dir):
+        """Test repeated requests for a missing thumbnail stat it only once."""
+        with patch("os.stat", wraps=os.stat) as stat:
+            first = client.get("/v1/thumbnails/missing-video/1000")
+            second = client.get("/v1/thumbnails/missing-video/1000")
+
+        assert first.status_code == 404
+        assert second.status_code == 404
+        missing_path = str(thumbnail_dir / "missing-video" / "1000.jpg")
+        thumbnail_stats = [
+            call for call in stat.call_args_list if call.args[0] == missing_path
+        ]
+        assert len(thumbnail_stats) == 1
 
-            # Create video directory but no thumbnail file
-            thumbnail_dir = temp_path / video_id
-            thumbnail_dir.mkdir(parents=True, exist_ok=True)
+    def test_get_thumbnail_served_after_miss_expires(self, client, thumbnail_dir):
+        """Test a thumbnail created after a miss is served once the TTL passes."""
+        thumbnail_file = thumbnail_dir / "late-video" / "2000.jpg"
 
-            with patch("src.api.thumbnail_controller.THUMBNAIL_DIR", temp_path):
-                response = client.get(f"/v1/thumbnails/{video_id}/9999")
+        with patch("src.api.thumbnail_controller.time.monotonic") as monotonic:
+            monotonic.return_value = 1000.0
+            assert client.get("/v1/thumbnails/late-video/2000").status_code == 404
 
-                assert response.status_code == 404
-                assert "not found" in response.json()["detail"].lower()
+            thumbnail_file.parent.mkdir(parents=True)
+            thumbnail_file.write_bytes(b"\xff\xd8\xff\xe0late")
+            assert client.get("/v1/thumbnails/late-video/2000").status_code == 404
+
+            monotonic.return_value = 1000.0 + MISSING_CACHE_TTL
+            response = client.get("/v1/thumbnails/late-video/2000")
+
+        assert response.status_code == 200
+        assert response.content == b"\xff\xd8\xff\xe0late"
+
+
+class TestGetThumbnailInvalidParams:
+    """Tests for path parameter validation on the thumbnail endpoint."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/v1/thumbnails/..secret/1000",
+            "/v1/thumbnails/video.abc/1000",
+            f"/v1/thumbnails/{'a' * 65}/1000",
+            "/v1/thumbnails/video-abc/-1",
+            "/v1/thumbnails/video-abc/not-a-number",
+        ],
+    )
+    def test_get_thumbnail_invalid_params_rejected(self, client, path):
+        """Test malformed path parameters get 422 without touching disk."""
+        with patch("os.stat") as stat:
+            response = client.get(path)
+
+        assert response.status_code == 422
+        stat.assert_not_called()
 
 
 class TestGetThumbnailCacheHeaders:
@@ -134,54 +263,94 @@ class TestGetThumbnailCacheHeaders:
     Validates: Requirements 3.4
     """
 
-    def test_get_thumbnail_cache_headers(self, client):
+    def test_get_thumbnail_cache_headers(self, client, thumbnail_dir):
         """Test that response includes correct Cache-Control header.
 
         Requirements:
         - 3.4: Set appropriate cache headers for browser caching (1 week)
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            video_id = "cache-test-video"
-            timestamp_ms = 3000
-
-            # Create thumbnail directory and file
-            thumbnail_dir = temp_path / video_id
-            thumbnail_dir.mkdir(parents=True, exist_ok=True)
-            thumbnail_file = thumbnail_dir / f"{timestamp_ms}.jpg"
-            thumbnail_file.write_bytes(b"\xff\xd8\xff\xe0\x00\x10JFIF")
-
-            with patch("src.api.thumbnail_controller.THUMBNAIL_DIR", temp_path):
-                response = client.get(f"/v1/thumbnails/{video_id}/{timestamp_ms}")
-
-                assert response.status_code == 200
-                assert "cache-control" in response.headers
-                cache_control = response.headers["cache-control"]
-                assert "public" in cache_control
-                assert f"max-age={CACHE_MAX_AGE}" in cache_control
+        video_id = "cache-test-video"
+        timestamp_ms = 3000
+
+        # Create thumbnail directory and file
+        video_dir = thumbnail_dir / video_id
+        video_dir.mkdir(parents=True, exist_ok=True)
+        thumbnail_file = video_dir / f"{timestamp_ms}.jpg"
+        thumbnail_file.write_bytes(b"\xff\xd8\xff\xe0\x00\x10JFIF")
+
+        response = client.get(f"/v1/thumbnails/{video_id}/{timestamp_ms}")
+
+        assert response.status_code == 200
+        assert "cache-control" in response.headers
+        cache_control = response.headers["cache-control"]
+        assert "public" in cache_control
+        assert f"max-age={CACHE_MAX_AGE}" in cache_control
+
+    @pytest.mark.parametrize(
+        "conditional_header",
+        ["if-none-match", "if-modified-since"],
+    )
+    def test_get_thumbnail_revalidation_returns_304(
+        self, client, thumbnail_dir, conditional_header
+    ):
+        """Test a revalidation request for an unchanged thumbnail gets a 304."""
+        thumbnail_file = thumbnail_dir / "revalidate" / "3000.jpg"
+        thumbnail_file.parent.mkdir(parents=True)
+        thumbnail_file.write_bytes(b"\xff\xd8\xff\xe0\x00\x10JFIF")
+
+        first = client.get("/v1/thumbnails/revalidate/3000")
+        validator = first.headers[
+            "etag" if conditional_header == "if-none-match" else "last-modified"
+        ]
+        second = client.get(
+            "/v1/thumbnails/revalidate/3000",
+            headers={conditional_header: validator},
+        )
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == first.headers["etag"]
+        assert f"max-age={CACHE_MAX_AGE}" in second.headers["cache-control"]
+
+    def test_get_thumbnail_stale_etag_returns_body(self, client, thumbnail_dir):
+        """Test a revalidation with an outdated ETag gets the full thumbnail."""
+        thumbnail_file = thumbnail_dir / "revalidate" / "3000.jpg"
+        thumbnail_file.parent.mkdir(parents=True)
+        jpeg_content = b"\xff\xd8\xff\xe0\x00\x10JFIF"
+        thumbnail_file.write_bytes(jpeg_content)
+
+        response = client.get(
+            "/v1/thumbnails/revalidate/3000",
+            headers={"if-none-match": '"stale"'},
+        )
+
+        assert response.status_code == 200
+        assert response.content == jpeg_content
 
     def test_cache_max_age_is_one_week(self):
         """Test that CACHE_MAX_AGE constant is set to 1 week (604800 seconds)."""
         one_week_in_seconds = 7 * 24 * 60 * 60  # 604800
         assert CACHE_MAX_AGE == one_week_in_seconds
 
-    def test_get_thumbnail_cache_header_format(self, client):
+    def test_cdn_cache_max_age_is_thirty_days(self):
+        """Test that CDN_CACHE_MAX_AGE is set to 30 days (2592000 seconds)."""
+        assert CDN_CACHE_MAX_AGE == 30 * 24 * 60 * 60
+
+    def test_get_thumbnail_cache_header_format(self, client, thumbnail_dir):
         """Test that Cache-Control header has correct format."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            video_id = "format-test"
-            timestamp_ms = 0
-
-            # Create thumbnail directory and file
-            thumbnail_dir = temp_path / video_id
-            thumbnail_dir.mkdir(parents=True, exist_ok=True)
-            thumbnail_file = thumbnail_dir / f"{timestamp_ms}.jpg"
-            thumbnail_file.write_bytes(b"\xff\xd8\xff\xe0\x00\x10JFIF")
-
-            with patch("src.api.thumbnail_controller.THUMBNAIL_DIR", temp_path):
-                response = client.get(f"/v1/thumbnails/{video_id}/{timestamp_ms}")
-
-                assert response.status_code == 200
-                # Verify exact format: "public, max-age=604800"
-                expected_cache_control = f"public, max-age={CACHE_MAX_AGE}"
-                assert response.headers["cache-control"] == expected_cache_control
+        video_id = "format-test"
+        timestamp_ms = 0
+
+        # Create thumbnail directory and file
+        video_dir = thumbnail_dir / video_id
+        video_dir.mkdir(parents=True, exist_ok=True)
+        thumbnail_file = video_dir / f"{timestamp_ms}.jpg"
+        thumbnail_file.write_bytes(b"\xff\xd8\xff\xe0\x00\x10JFIF")
+
+        response = client.get(f"/v1/thumbnails/{video_id}/{timestamp_ms}")
+
+        assert response.status_code == 200
+        # Verify exact format
+        expected_cache_control = "public, max-age=604800, s-maxage=2592000, immutable"
+        assert response.headers["cache-control"] == expected_cache_control
+        assert response.headers["cdn-cache-control"] == "max-age=2592000"
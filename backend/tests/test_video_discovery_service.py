@@ -1,68 +1,69 @@
 """Test VideoDiscoveryService."""
 
 import tempfile
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, create_autospec, patch
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import pytest
 
-from src.database.connection import Base
+from src.domain.models import PathConfig, Video
 from src.repositories.path_config_repository import SQLAlchemyPathConfigRepository
 from src.repositories.video_repository import SqlVideoRepository
+from src.services import video_discovery_service
+from src.services.file_hash_service import FileHashError, FileHashService
+from src.services.job_producer import JobProducer
 from src.services.path_config_manager import PathConfigManager
-from src.services.video_discovery_service import VideoDiscoveryService
+from src.services.video_discovery_service import (
+    ACTIVE_TASK_TYPES,
+    VideoDiscoveryService,
+)
 
 
-def test_video_discovery_service_scan():
+def test_video_discovery_service_scan(session):
     """Test VideoDiscoveryService discovers video files."""
-    # Create temporary database
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp_file:
-        db_url = f"sqlite:///{tmp_file.name}"
+    # Set up repositories and services
+    path_repo = SQLAlchemyPathConfigRepository(session)
+    video_repo = SqlVideoRepository(session)
+    path_manager = PathConfigManager(path_repo)
+    discovery_service = VideoDiscoveryService(path_manager, video_repo)
 
-    engine = create_engine(db_url)
-    Base.metadata.create_all(engine)
+    # Create temporary test directory with video files
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_path = Path(temp_dir)
 
-    session_local = sessionmaker(bind=engine)
-    session = session_local()
+        # Create test video files
+        (test_path / "video1.mp4").write_text("fake video")
+        (test_path / "video2.mov").write_text("fake video")
+        (test_path / "not_video.txt").write_text("not a video")
 
-    try:
-        # Set up repositories and services
-        path_repo = SQLAlchemyPathConfigRepository(session)
-        video_repo = SqlVideoRepository(session)
-        path_manager = PathConfigManager(path_repo)
-        discovery_service = VideoDiscoveryService(path_manager, video_repo)
+        # Add path configuration (recursive)
+        path_manager.add_path(str(test_path), recursive=True)
 
-        # Create temporary test directory with video files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_path = Path(temp_dir)
+        # Discover videos
+        discovered_videos = discovery_service.discover_videos()
 
-            # Create test video files
-            (test_path / "video1.mp4").write_text("fake video")
-            (test_path / "video2.mov").write_text("fake video")
-            (test_path / "not_video.txt").write_text("not a video")
+        # Should find 2 video files
+        assert len(discovered_videos) == 2
 
-            # Add path configuration (recursive)
-            path_manager.add_path(str(test_path), recursive=True)
+        # Check video properties
+        video_names = {v.filename for v in discovered_videos}
+        expected_names = {"video1.mp4", "video2.mov"}
+        assert video_names == expected_names
 
-            # Discover videos
-            discovered_videos = discovery_service.discover_videos()
-
-            # Should find 2 video files
-            assert len(discovered_videos) == 2
-
-            # Check video properties
-            video_names = {v.filename for v in discovered_videos}
-            expected_names = {"video1.mp4", "video2.mov"}
-            assert video_names == expected_names
-
-    finally:
-        session.close()
+        # A rescan returns the stored records instead of inserting again
+        rediscovered = discovery_service.discover_videos()
+        assert {v.video_id for v in rediscovered} == {
+            v.video_id for v in discovered_videos
+        }
 
 
 def test_video_discovery_service_supported_formats():
     """Test VideoDiscoveryService only processes supported formats."""
-    discovery_service = VideoDiscoveryService(Mock(), Mock())
+    discovery_service = VideoDiscoveryService(
+        create_autospec(PathConfigManager, instance=True),
+        create_autospec(SqlVideoRepository, instance=True),
+    )
 
     # Test supported formats
     assert discovery_service._is_video_file(Path("video.mp4")) is True
@@ -75,3 +76,179 @@ def test_video_discovery_service_supported_formats():
 
     # Test unsupported formats
     assert discovery_service._is_video_file(Path("document.txt")) is False
+
+
+@pytest.mark.parametrize(
+    ("recursive", "expected_names"),
+    [
+        (True, {"a.mp4", "b.MOV", "c.Mkv", "nested.avi"}),
+        (False, {"a.mp4", "b.MOV", "c.Mkv"}),
+    ],
+)
+def test_scan_path_walks_once_case_insensitively(tmp_path, recursive, expected_names):
+    """Test a scan matches any extension case and honours recursion."""
+    for name in ("a.mp4", "b.MOV", "c.Mkv", "notes.txt"):
+        (tmp_path / name).write_text("fake video")
+    (tmp_path / "sub.mp4").mkdir()
+    (tmp_path / "sub.mp4" / "nested.avi").write_text("fake video")
+    video_repo = create_autospec(SqlVideoRepository, instance=True)
+    video_repo.find_by_paths.return_value = {}
+    video_repo.save_many.side_effect = lambda videos: videos
+    discovery_service = VideoDiscoveryService(
+        create_autospec(PathConfigManager, instance=True), video_repo
+    )
+
+    videos = discovery_service._scan_path(
+        PathConfig("path_1", str(tmp_path), recursive=recursive)
+    )
+
+    assert sorted(v.filename for v in videos) == sorted(expected_names)
+    video_repo.save_many.assert_called_once()
+
+
+def test_scan_path_falls_back_to_single_saves(tmp_path):
+    """Test a failed batch insert still saves the videos one at a time."""
+    for name in ("a.mp4", "b.mp4"):
+        (tmp_path / name).write_text("fake video")
+    video_repo = create_autospec(SqlVideoRepository, instance=True)
+    video_repo.find_by_paths.return_value = {}
+    video_repo.save_many.side_effect = RuntimeError("UNIQUE constraint failed")
+    video_repo.save.side_effect = lambda video: video
+    discovery_service = VideoDiscoveryService(
+        create_autospec(PathConfigManager, instance=True), video_repo
+    )
+
+    videos = discovery_service._scan_path(PathConfig("path_1", str(tmp_path)))
+
+    assert sorted(v.filename for v in videos) == ["a.mp4", "b.mp4"]
+    assert video_repo.save.call_count == 2
+
+
+def test_scan_path_keeps_videos_whose_hash_fails(tmp_path):
+    """Test a file that cannot be hashed is still discovered, without a hash."""
+    (tmp_path / "a.mp4").write_text("fake video")
+    video_repo = create_autospec(SqlVideoRepository, instance=True)
+    video_repo.find_by_paths.return_value = {}
+    video_repo.save_many.side_effect = lambda videos: videos
+    hash_service = create_autospec(FileHashService, instance=True)
+    hash_service.calculate_hashes.return_value = [None]
+    hash_service.calculate_hash.side_effect = FileHashError("Failed to read file")
+    discovery_service = VideoDiscoveryService(
+        create_autospec(PathConfigManager, instance=True),
+        video_repo,
+        hash_service=hash_service,
+    )
+
+    scanned = discovery_service._scan_path(PathConfig("path_1", str(tmp_path)))
+    video_repo.find_by_path.return_value = None
+    video_repo.save.side_effect = lambda video: video
+    created = discovery_service._create_video_from_file(tmp_path / "a.mp4")
+
+    assert [video.file_hash for video in scanned] == [None]
+    assert created.file_hash is None
+    hash_service.calculate_hashes.assert_called_once_with([str(tmp_path / "a.mp4")])
+
+
+@pytest.mark.asyncio
+async def test_discover_and_queue_tasks_skips_processed_video(tmp_path):
+    """Test an already processed video is returned without any task lookups."""
+    video_file = tmp_path / "video.mp4"
+    video_file.write_text("fake video")
+    video_repo = create_autospec(SqlVideoRepository, instance=True)
+    video_repo.find_by_path.return_value = Video(
+        video_id="video_1",
+        file_path=str(video_file),
+        filename="video.mp4",
+        last_modified=datetime(2024, 1, 1, 12, 0, 0),
+        status="completed",
+    )
+    job_producer = AsyncMock(spec=JobProducer)
+    discovery_service = VideoDiscoveryService(
+        create_autospec(PathConfigManager, instance=True), video_repo, job_producer
+    )
+
+    with patch(
+        "src.services.video_discovery_service.SQLAlchemyTaskRepository"
+    ) as task_repo_class:
+        video_id = await discovery_service.discover_and_queue_tasks(str(video_file))
+
+    assert video_id == "video_1"
+    task_repo_class.assert_not_called()
+    job_producer.enqueue_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_discover_and_queue_tasks_saves_new_tasks_in_one_batch(tmp_path):
+    """Test every new task is saved with one save_many call, then enqueued."""
+    video_file = tmp_path / "video.mp4"
+    video_file.write_text("fake video")
+    video_repo = create_autospec(SqlVideoRepository, instance=True)
+    video_repo.find_by_path.return_value = Video(
+        video_id="video_1",
+        file_path=str(video_file),
+        filename="video.mp4",
+        last_modified=datetime(2024, 1, 1, 12, 0, 0),
+    )
+    video_repo.session = None  # Instance attribute; unused with the patch below
+    job_producer = AsyncMock(spec=JobProducer)
+    discovery_service = VideoDiscoveryService(
+        create_autospec(PathConfigManager, instance=True), video_repo, job_producer
+    )
+
+    with patch(
+        "src.services.video_discovery_service.SQLAlchemyTaskRepository",
+        autospec=True,
+    ) as task_repo_class:
+        task_repo = task_repo_class.return_value
+        task_repo.find_existing_task_keys.return_value = {
+            "video_1": {("object_detection", None)}
+        }
+        await discovery_service.discover_and_queue_tasks(str(video_file))
+
+    task_repo.save.assert_not_called()
+    task_repo.save_many.assert_called_once()
+    saved_tasks = task_repo.save_many.call_args.args[0]
+    assert {task.task_type for task in saved_tasks} == set(ACTIVE_TASK_TYPES) - {
+        "object_detection"
+    }
+    assert job_producer.enqueue_task.await_count == len(saved_tasks)
+
+
+@pytest.mark.asyncio
+async def test_discover_and_queue_tasks_enqueues_critical_path_first(
+    tmp_path, monkeypatch
+):
+    """Test tasks other tasks wait on are enqueued before their dependents."""
+    monkeypatch.setattr(
+        video_discovery_service,
+        "ACTIVE_TASK_TYPES",
+        ["thumbnail.extraction", "object_detection"],
+    )
+    video_file = tmp_path / "video.mp4"
+    video_file.write_text("fake video")
+    video_repo = create_autospec(SqlVideoRepository, instance=True)
+    video_repo.find_by_path.return_value = Video(
+        video_id="video_1",
+        file_path=str(video_file),
+        filename="video.mp4",
+        last_modified=datetime(2024, 1, 1, 12, 0, 0),
+    )
+    video_repo.session = None  # Instance attribute; unused with the patch below
+    job_producer = AsyncMock(spec=JobProducer)
+    discovery_service = VideoDiscoveryService(
+        create_autospec(PathConfigManager, instance=True), video_repo, job_producer
+    )
+
+    with patch(
+        "src.services.video_discovery_service.SQLAlchemyTaskRepository",
+        autospec=True,
+    ) as task_repo_class:
+        task_repo_class.return_value.find_existing_task_keys.return_value = {
+            "video_1": set()
+        }
+        await discovery_service.discover_and_queue_tasks(str(video_file))
+
+    enqueued = [
+        call.kwargs["task_type"] for call in job_producer.enqueue_task.await_args_list
+    ]
+    assert enqueued == ["object_detection", "thumbnail.extraction"]
@@ -39,7 +39,8 @@ class Task(Base):
     video_id = Column(String, ForeignKey("videos.video_id"), nullable=False, index=True)
     task_type = Column(String, nullable=False, index=True)  # transcription, scene, etc
     status = Column(String, nullable=False, default="pending", index=True)  # Status
-    priority = Column(Integer, nullable=False, default=5)  # 1=highest, 10=lowest
+    # Critical-path bottom level of the task type; higher runs first, 0 = leaf
+    priority = Column(Integer, nullable=False, default=1)
     dependencies = Column(JSON)  # List of task_ids that must complete first
     created_at = Column(DateTime, server_default=func.now())
     started_at = Column(DateTime)
@@ -4,6 +4,21 @@ from datetime import datetime
 class Video:
     """Domain model for Video - pure business object."""
 
+    __slots__ = (
+        "created_at",
+        "duration",
+        "file_created_at",
+        "file_hash",
+        "file_path",
+        "file_size",
+        "filename",
+        "last_modified",
+        "processed_at",
+        "status",
+        "updated_at",
+        "video_id",
+    )
+
     def __init__(
         self,
         video_id: str,
@@ -73,6 +88,19 @@ class PathConfig:
 class Task:
     """Domain model for Task - pure business object."""
 
+    __slots__ = (
+        "completed_at",
+        "created_at",
+        "dependencies",
+        "error",
+        "priority",
+        "started_at",
+        "status",
+        "task_id",
+        "task_type",
+        "video_id",
+    )
+
     def __init__(
         self,
         task_id: str,
@@ -52,9 +52,7 @@ class SqlVideoRepository(VideoRepository):
                 return result
         except Exception as e:
             logger.error(f"Error in VideoRepository.save(): {e}")
-            import traceback
-
-            traceback.print_exc()
+            logger.debug("Traceback for failed VideoRepository.save()", exc_info=True)
             raise
 
     def find_by_id(self, video_id: str) -> Video | None:
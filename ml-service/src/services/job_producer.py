@@ -17,14 +17,16 @@ class JobProducer:
     """
 
     # All supported tasks
-    SUPPORTED_TASKS = {
-        "object_detection",
-        "face_detection",
-        "transcription",
-        "ocr",
-        "place_detection",
-        "scene_detection",
-    }
+    SUPPORTED_TASKS = frozenset(
+        {
+            "object_detection",
+            "face_detection",
+            "transcription",
+            "ocr",
+            "place_detection",
+            "scene_detection",
+        }
+    )
 
     def __init__(self, redis_url: str | None = None):
         """Initialize JobProducer with Redis connection.
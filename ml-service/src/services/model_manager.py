@@ -19,6 +19,7 @@ class ModelManager:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.models = {}
         self._gpu_available = None  # Lazy initialization
+        self._gpu_device = None  # (device name, total memory MB), lazy
 
     @property
     def gpu_available(self) -> bool:
@@ -181,14 +182,21 @@ class ModelManager:
 
         import torch
 
-        device_name = torch.cuda.get_device_name(0)
-        total_memory = torch.cuda.get_device_properties(0).total_memory / 1e6
+        # The device name and total memory never change; query the driver for
+        # them once. Allocated memory comes from torch's own allocator
+        # counters, so it stays cheap to read on every call.
+        if self._gpu_device is None:
+            self._gpu_device = (
+                torch.cuda.get_device_name(0),
+                int(torch.cuda.get_device_properties(0).total_memory / 1e6),
+            )
+        device_name, total_memory_mb = self._gpu_device
         allocated_memory = torch.cuda.memory_allocated(0) / 1e6
 
         return {
             "gpu_available": True,
             "gpu_device_name": device_name,
-            "gpu_memory_total_mb": int(total_memory),
+            "gpu_memory_total_mb": total_memory_mb,
             "gpu_memory_used_mb": int(allocated_memory),
         }
 
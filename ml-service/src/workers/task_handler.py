@@ -13,11 +13,54 @@ import asyncio
 import json
 import logging
 import os
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 from uuid import uuid4
 
 logger = logging.getLogger(__name__)
 
+# Map task type to inference function
+TASK_TO_ENDPOINT: Mapping[str, str] = MappingProxyType(
+    {
+        "object_detection": "objects",
+        "face_detection": "faces",
+        "transcription": "transcribe",
+        "ocr": "ocr",
+        "place_detection": "places",
+        "scene_detection": "scenes",
+        "metadata_extraction": "metadata",
+        "thumbnail_extraction": "thumbnails",
+        "thumbnail.extraction": "thumbnails",
+    }
+)
+
+# Map task types to artifact types
+TASK_TO_ARTIFACT_TYPE: Mapping[str, str] = MappingProxyType(
+    {
+        "object_detection": "object.detection",
+        "face_detection": "face.detection",
+        "transcription": "transcript.segment",
+        "ocr": "ocr.text",
+        "place_detection": "place.classification",
+        "scene_detection": "scene",
+        "metadata_extraction": "video.metadata",
+    }
+)
+
+# Map task types to result keys
+TASK_TO_RESULT_KEY: Mapping[str, str] = MappingProxyType(
+    {
+        "object_detection": "detections",
+        "face_detection": "detections",
+        "transcription": "segments",
+        "ocr": "detections",
+        "place_detection": "classifications",
+        "scene_detection": "scenes",
+        "metadata_extraction": "metadata",
+    }
+)
+
 
 async def process_ml_task(
     ctx,
@@ -88,19 +131,7 @@ async def process_ml_task(
         model_manager = ModelManager(cache_dir=model_cache_dir)
         logger.info(f"✅ Model manager initialized for task {task_id}")
 
-        # Map task type to inference function
-        task_to_endpoint = {
-            "object_detection": "objects",
-            "face_detection": "faces",
-            "transcription": "transcribe",
-            "ocr": "ocr",
-            "place_detection": "places",
-            "scene_detection": "scenes",
-            "metadata_extraction": "metadata",
-            "thumbnail_extraction": "thumbnails",
-            "thumbnail.extraction": "thumbnails",
-        }
-        endpoint = task_to_endpoint.get(task_type)
+        endpoint = TASK_TO_ENDPOINT.get(task_type)
         if not endpoint:
             raise ValueError(f"Unknown task type: {task_type}")
 
@@ -218,33 +249,11 @@ async def process_ml_task(
             producer_version = "0.5.5"
             model_profile = "balanced"
 
-        # Map task types to artifact types
-        task_to_artifact_type = {
-            "object_detection": "object.detection",
-            "face_detection": "face.detection",
-            "transcription": "transcript.segment",
-            "ocr": "ocr.text",
-            "place_detection": "place.classification",
-            "scene_detection": "scene",
-            "metadata_extraction": "video.metadata",
-        }
-
-        artifact_type = task_to_artifact_type.get(task_type)
+        artifact_type = TASK_TO_ARTIFACT_TYPE.get(task_type)
         if not artifact_type:
             raise ValueError(f"Unknown task type: {task_type}")
 
-        # Map task types to result keys
-        task_to_result_key = {
-            "object_detection": "detections",
-            "face_detection": "detections",
-            "transcription": "segments",
-            "ocr": "detections",
-            "place_detection": "classifications",
-            "scene_detection": "scenes",
-            "metadata_extraction": "metadata",
-        }
-
-        result_key = task_to_result_key.get(task_type)
+        result_key = TASK_TO_RESULT_KEY.get(task_type)
         if not result_key:
             raise ValueError(f"Unknown task type: {task_type}")
 
@@ -408,38 +417,42 @@ async def process_ml_task(
                 f"for task {task_id} and video {video_id}"
             )
 
+            from sqlalchemy import insert
+
             from ..database.models import Artifact
 
-            # Convert ArtifactEnvelope domain objects to ORM models
-            orm_envelopes = []
+            # Convert ArtifactEnvelope domain objects to column-value rows
+            rows = []
             for envelope in envelopes:
                 # Parse payload_json string to dict for proper JSONB storage
                 # (envelope.payload_json is a JSON string, but JSONB column needs a dict)
                 payload_dict = json.loads(envelope.payload_json)
 
-                orm_envelope = Artifact(
-                    artifact_id=envelope.artifact_id,
-                    asset_id=envelope.asset_id,
-                    artifact_type=envelope.artifact_type,
-                    schema_version=envelope.schema_version,
-                    span_start_ms=envelope.span_start_ms,
-                    span_end_ms=envelope.span_end_ms,
-                    payload_json=payload_dict,
-                    producer=envelope.producer,
-                    producer_version=envelope.producer_version,
-                    model_profile=envelope.model_profile,
-                    config_hash=envelope.config_hash,
-                    input_hash=envelope.input_hash,
-                    run_id=envelope.run_id,
-                    created_at=envelope.created_at,
+                rows.append(
+                    {
+                        "artifact_id": envelope.artifact_id,
+                        "asset_id": envelope.asset_id,
+                        "artifact_type": envelope.artifact_type,
+                        "schema_version": envelope.schema_version,
+                        "span_start_ms": envelope.span_start_ms,
+                        "span_end_ms": envelope.span_end_ms,
+                        "payload_json": payload_dict,
+                        "producer": envelope.producer,
+                        "producer_version": envelope.producer_version,
+                        "model_profile": envelope.model_profile,
+                        "config_hash": envelope.config_hash,
+                        "input_hash": envelope.input_hash,
+                        "run_id": envelope.run_id,
+                        "created_at": envelope.created_at,
+                    }
                 )
-                orm_envelopes.append(orm_envelope)
 
-            # Batch insert
-            session.add_all(orm_envelopes)
-            session.flush()  # Flush but don't commit yet
+            # Batch insert: one Core INSERT executed with every row, instead of
+            # building ORM objects and flushing them through the unit of work.
+            # Not committed yet; the task update below commits everything.
+            session.execute(insert(Artifact), rows)
             logger.info(
-                f"✅ Successfully inserted {len(orm_envelopes)} artifacts to "
+                f"✅ Successfully inserted {len(rows)} artifacts to "
                 f"PostgreSQL for task {task_id}"
             )
 
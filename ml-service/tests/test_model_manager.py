@@ -1,5 +1,9 @@
 """Tests for ModelManager."""
 
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
 
 from src.services.model_manager import ModelManager
@@ -32,6 +36,25 @@ def test_get_gpu_info(model_manager):
     assert "gpu_memory_used_mb" in gpu_info
 
 
+def test_get_gpu_info_queries_device_once(model_manager, monkeypatch):
+    """Test static device details are read once and memory use every call."""
+    cuda = MagicMock()
+    cuda.get_device_name.return_value = "Test GPU"
+    cuda.get_device_properties.return_value = SimpleNamespace(total_memory=8e9)
+    cuda.memory_allocated.side_effect = [1e9, 2e9]
+    monkeypatch.setitem(sys.modules, "torch", SimpleNamespace(cuda=cuda))
+    model_manager._gpu_available = True
+
+    first = model_manager.get_gpu_info()
+    second = model_manager.get_gpu_info()
+
+    assert first["gpu_device_name"] == second["gpu_device_name"] == "Test GPU"
+    assert first["gpu_memory_total_mb"] == 8000
+    assert (first["gpu_memory_used_mb"], second["gpu_memory_used_mb"]) == (1000, 2000)
+    cuda.get_device_name.assert_called_once()
+    cuda.get_device_properties.assert_called_once()
+
+
 def test_get_device(model_manager):
     """Test device string generation."""
     device = model_manager._get_device()